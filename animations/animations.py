@@ -2,9 +2,8 @@ from time import sleep
 from collections import deque
 import random
 
-import tdl
-
-from utils.utils import coordinates_within_circle, bresenham_line
+from utils.geometry import disc_indices
+from utils.utils import bresenham_line
 from etc.enum import Animations
 from etc.colors import COLORS
 from etc.chars import CHARS
@@ -471,21 +470,19 @@ def draw_blast(animation, *, char, fg_color_callback, bg_color_callback):
         blast_radius = next(animation.radius_iter)
     # Clear the drawing of the blast, the animation has finished.
     except StopIteration:
-        clear_coordinates = coordinates_within_circle(
-            (animation.source[0], animation.source[1]), animation.radius)
-        for x, y in clear_coordinates:
-            if animation.game_map.within_bounds(x, y):
-                animation.game_map.redraw_position(x, y)
+        xs, ys = disc_indices(
+            animation.game_map, animation.source, animation.radius)
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            animation.game_map.redraw_position(x, y)
         return True
     # Draw a circle centered at `source`.
-    blast_coordinates = coordinates_within_circle(
-        (animation.source[0], animation.source[1]), blast_radius)
-    for x, y in blast_coordinates:
-        if (animation.game_map.within_bounds(x, y) and
-            (animation.game_map.fov[x, y] or animation.game_map.shrub[x, y]) and
-            animation.game_map.walkable[x, y]):
-            animation.game_map.draw_char(
-                x, y, char, fg_color_callback(), bg_color_callback())
+    game_map = animation.game_map
+    xs, ys = disc_indices(game_map, animation.source, blast_radius)
+    drawable = ((game_map.fov[xs, ys] | (game_map.shrub[xs, ys] != 0)) &
+                (game_map.walkable[xs, ys] != 0))
+    for x, y in zip(xs[drawable].tolist(), ys[drawable].tolist()):
+        game_map.draw_char(
+            x, y, char, fg_color_callback(), bg_color_callback())
     return False
 
 
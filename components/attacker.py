@@ -1,6 +1,7 @@
 from itertools import product
 
 from messages import Message
+from turn_results import Result
 from etc.enum import ResultTypes, Elements
 
 class Attacker:
@@ -42,7 +43,7 @@ class Attacker:
         if target.harmable is None:
             message = Message(
                 f'{self.owner} attacks {target.name}, but it does nothing.')
-            results.append({ResultTypes.MESSAGE: message})
+            results.append(Result(ResultTypes.MESSAGE, message))
             return results
         # Collect list of targets of this attack.
         if self.target_callback:
@@ -57,14 +58,15 @@ class Attacker:
         # final damage.
         damage = self.power
         if self.damage_transformers == []:
-            results.append({
-                ResultTypes.DAMAGE: (target, self.owner, damage, [Elements.NONE])})
+            results.append(Result(
+                ResultTypes.DAMAGE,
+                (target, self.owner, damage, [Elements.NONE])))
         # No need for an else, this is an empty for loop if damage_transformers
         # is an empty list.
         for transformer, target in product(self.damage_transformers, targets):
             results.extend(
                 transformer.transform(target, self.owner, damage))
-        results.append({ResultTypes.END_TURN: True})
+        results.append(Result(ResultTypes.END_TURN, True))
         return results
 
     def add_damage_transformers(self, transformers):
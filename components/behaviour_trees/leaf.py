@@ -2,6 +2,7 @@ from pathfinding import get_shortest_path, get_path_to_radius_of_target
 
 from etc.enum import TreeStates
 from etc.enum import ResultTypes
+from turn_results import Result
 from utils.utils import random_walkable_position, random_adjacent
 from components.behaviour_trees.root import Node
 
@@ -14,7 +15,8 @@ class MoveTowardsTargetEntity(Node):
     def tick(self, owner, game_map):
         target = self.namespace.get("target")
         self.namespace[self.name] = (target.x, target.y)
-        results = [{ResultTypes.MOVE_TOWARDS: (owner, target.x, target.y)}]
+        results = [
+            Result(ResultTypes.MOVE_TOWARDS, (owner, target.x, target.y))]
         return TreeStates.SUCCESS, results
 
 
@@ -32,7 +34,8 @@ class MoveTowardsPointInNamespace(Node):
             self.namespace[self.name + '_previous'] = None
             self.namespace[self.name] = None
             return TreeStates.SUCCESS, []
-        results = [{ResultTypes.MOVE_TOWARDS: (owner, point[0], point[1])}]
+        results = [
+            Result(ResultTypes.MOVE_TOWARDS, (owner, point[0], point[1]))]
         self.namespace[self.name + '_previous'] = (owner.x, owner.y)
         return TreeStates.SUCCESS, results
 
@@ -52,39 +55,73 @@ class SeekTowardsLInfinityRadius(Node):
             routing_avoid=owner.routing_avoid)
         if len(path) <= 1:
             return TreeStates.SUCCESS, []
-        results = [{
-            ResultTypes.SET_POSITION: (owner, path[1][0], path[1][1])}]
+        results = [
+            Result(ResultTypes.SET_POSITION, (owner, path[1][0], path[1][1]))]
         return TreeStates.SUCCESS, results
 
 
 class TravelToRandomPosition(Node):
     """Pick a random position on the map and walk towards it until getting
     there.
+
+    The path to the position is kept between turns, and the owner advances
+    along it one square per turn.  The path is only searched for again when
+    the owner has been knocked off it, the next square on it is blocked, or
+    the routing mask of the owner has changed.
     """
     def __init__(self):
         self.target_position = None
-        self.target_path = None
+        # The remaining path to the target, starting at the owner's expected
+        # position.
+        self.path = None
+        self.routing_version = None
 
     def tick(self, owner, game_map):
         if not self.target_position:
             self.target_position = random_walkable_position(game_map, owner)
-        self.path = get_shortest_path(
-            game_map,
-            (owner.x, owner.y),
-            self.target_position,
-            routing_avoid=owner.routing_avoid)
-        if len(self.path) <= 2:
+            self.path = None
+            if not self.target_position:
+                return TreeStates.SUCCESS, []
+        position = (owner.x, owner.y)
+        routing_version = game_map.routing_masks.version(
+            game_map, owner.routing_avoid)
+        if not self._advance_to(position):
+            self.path = None
+        elif (routing_version != self.routing_version
+              or (len(self.path) > 1 and game_map.blocked[self.path[1]])):
+            self.path = None
+        if self.path is None:
+            self.path = [position] + get_shortest_path(
+                game_map, position, self.target_position,
+                routing_avoid=owner.routing_avoid)
+            self.routing_version = routing_version
+        if len(self.path) <= 3:
             self.target_position = None
+            self.path = None
             return TreeStates.SUCCESS, []
-        results = [{
-            ResultTypes.MOVE_TOWARDS: (owner, self.path[1][0], self.path[1][1])}]
+        results = [Result(ResultTypes.MOVE_TOWARDS, (
+            owner, self.path[1][0], self.path[1][1]))]
         return TreeStates.SUCCESS, results
 
+    def _advance_to(self, position):
+        """Drop the squares of the path the owner has already moved past.
+
+        The owner may have moved up to two squares along the path (sliding on
+        ice).  Returns False if the owner is not on the start of the path.
+        """
+        if not self.path:
+            return False
+        for idx, square in enumerate(self.path[:3]):
+            if square == position:
+                del self.path[:idx]
+                return True
+        return False
+
 
 class Skitter(Node):
     """Move the owner to a random adjacent tile."""
     def tick(self, owner, game_map):
-        results = [{ResultTypes.MOVE_RANDOM_ADJACENT: owner}]
+        results = [Result(ResultTypes.MOVE_RANDOM_ADJACENT, owner)]
         return TreeStates.SUCCESS, results
 
 
@@ -117,5 +154,6 @@ class SpawnEntity(Node):
             and not game_map.water[x, y]):
             entity = self.maker.make(x, y)
             if entity:
-                return TreeStates.SUCCESS, [{ResultTypes.ADD_ENTITY: entity}]
+                return TreeStates.SUCCESS, [
+                    Result(ResultTypes.ADD_ENTITY, entity)]
         return TreeStates.FAILURE, []
@@ -1,4 +1,5 @@
 from messages import Message
+from turn_results import Result
 from etc.enum import ResultTypes, Elements
 from etc.colors import COLORS
 from etc.game_config import GRASS_BURN_PROBABILTY, BURN_BASE_DAMAGE
@@ -11,16 +12,16 @@ class ItemBurnable:
     def burn(self, game_map):
         fire = game_objects.various.Fire.make(
             game_map, self.owner.x, self.owner.y)
-        return [{
-            ResultTypes.REMOVE_ENTITY: self.owner,
-            ResultTypes.ADD_ENTITY: fire}] 
+        return [
+            Result(ResultTypes.REMOVE_ENTITY, self.owner),
+            Result(ResultTypes.ADD_ENTITY, fire)] 
 
 
 class AliveBurnable:
     """A living creature takes fire elemental damage from a fire."""
     def burn(self, game_map):
-        return [{ResultTypes.DAMAGE: (
-            self.owner, None, BURN_BASE_DAMAGE, [Elements.FIRE])}]
+        return [Result(ResultTypes.DAMAGE, (
+            self.owner, None, BURN_BASE_DAMAGE, [Elements.FIRE]))]
 
 
 class ZombieBurnable:
@@ -28,9 +29,9 @@ class ZombieBurnable:
     def burn(self, game_map):
         fire = game_objects.various.Fire.make(
             game_map, self.owner.x, self.owner.y)
-        return [{
-            ResultTypes.ADD_ENTITY: fire,
-            ResultTypes.DEAD_ENTITY: self.owner}]
+        return [
+            Result(ResultTypes.ADD_ENTITY, fire),
+            Result(ResultTypes.DEAD_ENTITY, self.owner)]
 
 
 class WaterBloatBurnable:
@@ -39,10 +40,10 @@ class WaterBloatBurnable:
         results = [] 
         steam = game_objects.various.Steam.make(
             game_map, self.owner.x, self.owner.y)
-        results.append({ResultTypes.ADD_ENTITY: steam})
+        results.append(Result(ResultTypes.ADD_ENTITY, steam))
         # This is enough damage to immediately kill a bloat.
-        results.append({ResultTypes.DAMAGE: (
-            self.owner, None, 1, [Elements.FIRE])})
+        results.append(Result(ResultTypes.DAMAGE, (
+            self.owner, None, 1, [Elements.FIRE])))
         return results
 
 
@@ -65,10 +66,10 @@ class GrassBurnable:
         # entity (grass) from the tile before adding the new terrain (burned
         # grass), since each tile can only hold one terrain.
         if burned_grass:
-            results.append({ResultTypes.ADD_ENTITY: burned_grass})
+            results.append(Result(ResultTypes.ADD_ENTITY, burned_grass))
         if fire:
-            results.append({ResultTypes.ADD_ENTITY: fire})
-        results.append({ResultTypes.REMOVE_ENTITY: self.owner})
+            results.append(Result(ResultTypes.ADD_ENTITY, fire))
+        results.append(Result(ResultTypes.REMOVE_ENTITY, self.owner))
         return results
 
 
@@ -78,7 +79,7 @@ class WaterBurnable:
         steam = game_objects.various.Steam.make(
             game_map, self.owner.x, self.owner.y)
         if steam:
-            return [{ResultTypes.ADD_ENTITY: steam}]
+            return [Result(ResultTypes.ADD_ENTITY, steam)]
         else:
             return []
 
@@ -89,8 +90,8 @@ class IceBurnable:
         water = game_objects.terrain.Water.make(
             game_map, self.owner.x, self.owner.y)
         if water:
-            return [{
-                ResultTypes.ADD_ENTITY: water,
-                ResultTypes.REMOVE_ENTITY: self.owner}]
+            return [
+                Result(ResultTypes.ADD_ENTITY, water),
+                Result(ResultTypes.REMOVE_ENTITY, self.owner)]
         else:
             return []
@@ -1,9 +1,11 @@
 from etc.enum import ResultTypes
+from turn_results import Result
 
 class ReflectCallback:
 
     def execute(self, target, source, amount, elements):
         if source:
-            return [{ResultTypes.DAMAGE: (source, target, amount, elements)}]
+            return [Result(
+                ResultTypes.DAMAGE, (source, target, amount, elements))]
         else:
             return []
@@ -1,5 +1,6 @@
 from etc.enum import ResultTypes
 from etc.game_config import RAIPIER_RANGE
+from turn_results import Result
 
 from utils.utils import get_blocking_entity_in_position
 
@@ -22,13 +23,12 @@ class RaipierCallback:
         results = []
         if target:
             results.extend(owner.attacker.attack(game_map, target))
-            results.append({
-                ResultTypes.SET_POSITION: (
-                    owner, prior_coord[0], prior_coord[1])})
+            results.append(Result(ResultTypes.SET_POSITION, (
+                owner, prior_coord[0], prior_coord[1])))
         else:
-            results.append({
+            results.extend([
                 # TODO: This assumes the player is moving, which is hardcoded
                 # in the game loop.  We shoud be able to handle a generic move.
-                ResultTypes.MOVE: (dx, dy),
-                ResultTypes.END_TURN: True})
+                Result(ResultTypes.MOVE, (dx, dy)),
+                Result(ResultTypes.END_TURN, True)])
         return results
@@ -1,4 +1,5 @@
 from messages import Message
+from turn_results import Result
 from etc.enum import ResultTypes, CursorTypes, Animations, Elements
 
 from etc.colors import COLORS
@@ -38,26 +39,24 @@ class HealthPotionCallback(ThrowablePotionCallback):
             (self.user.x, self.user.y), (target.x, target.y))
         heal_animation = (
             Animations.HEALTH_POTION, (target.x, target.y))
-        return [{
-            ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            ResultTypes.DAMAGE: (
-                target, None, -self.owner.healing, [Elements.HEALING]),
-            ResultTypes.INCREASE_MAX_HP: (
-                target, HEALTH_POTION_HP_INCREASE_AMOUNT),
-            ResultTypes.ANIMATION: (
-                Animations.CONCATINATED, (throw_animation, heal_animation))
-        }]
+        return [
+            Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+            Result(ResultTypes.DAMAGE, (
+                target, None, -self.owner.healing, [Elements.HEALING])),
+            Result(ResultTypes.INCREASE_MAX_HP, (
+                target, HEALTH_POTION_HP_INCREASE_AMOUNT)),
+            Result(ResultTypes.ANIMATION, (
+                Animations.CONCATINATED, (throw_animation, heal_animation)))]
 
     def unsuccessful_target_result(self, x, y):
         text = "The health potion splashes on the ground."
         throw_animation = (
             Animations.THROW_POTION, (self.user.x, self.user.y), (x, y))
         spill_animation = (Animations.HEALTH_POTION, (x, y))
-        return [{
-            ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            ResultTypes.ANIMATION: (
-                Animations.CONCATINATED, (throw_animation, spill_animation))
-        }]
+        return [
+            Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+            Result(ResultTypes.ANIMATION, (
+                Animations.CONCATINATED, (throw_animation, spill_animation)))]
 
 
 class ConfusionPotionCallback(ThrowablePotionCallback):
@@ -70,23 +69,21 @@ class ConfusionPotionCallback(ThrowablePotionCallback):
             (self.user.x, self.user.y), (target.x, target.y))
         potion_animation = (
             Animations.CONFUSION_POTION, (target.x, target.y))
-        return [{
-            ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            ResultTypes.CONFUSE: target,
-            ResultTypes.ANIMATION: (
-                Animations.CONCATINATED, (throw_animation, potion_animation))
-        }]
+        return [
+            Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+            Result(ResultTypes.CONFUSE, target),
+            Result(ResultTypes.ANIMATION, (
+                Animations.CONCATINATED, (throw_animation, potion_animation)))]
 
     def unsuccessful_target_result(self, x, y):
         text = "The confusion potion splashes on the ground."
         throw_animation = (
             Animations.THROW_POTION, (self.user.x, self.user.y), (x, y))
         spill_animation = (Animations.CONFUSION_POTION, (x, y))
-        return [{
-            ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            ResultTypes.ANIMATION: (
-                Animations.CONCATINATED, (throw_animation, spill_animation))
-        }]
+        return [
+            Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+            Result(ResultTypes.ANIMATION, (
+                Animations.CONCATINATED, (throw_animation, spill_animation)))]
 
 
 class SpeedPotionCallback(ThrowablePotionCallback):
@@ -98,23 +95,21 @@ class SpeedPotionCallback(ThrowablePotionCallback):
             Animations.THROW_POTION,
             (self.user.x, self.user.y), (target.x, target.y))
         potion_animation = (Animations.SPEED_POTION, (target.x, target.y))
-        return [{
-            ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            ResultTypes.DOUBLE_SPEED: target,
-            ResultTypes.ANIMATION: (
-                Animations.CONCATINATED, (throw_animation, potion_animation))
-        }]
+        return [
+            Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+            Result(ResultTypes.DOUBLE_SPEED, target),
+            Result(ResultTypes.ANIMATION, (
+                Animations.CONCATINATED, (throw_animation, potion_animation)))]
 
     def unsuccessful_target_result(self, x, y):
         text = "The speed potion splashes on the ground."
         throw_animation = (
             Animations.THROW_POTION, (self.user.x, self.user.y), (x, y))
         spill_animation = (Animations.SPEED_POTION, (x, y))
-        return [{
-            ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            ResultTypes.ANIMATION: (
-                Animations.CONCATINATED, (throw_animation, spill_animation))
-        }]
+        return [
+            Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+            Result(ResultTypes.ANIMATION, (
+                Animations.CONCATINATED, (throw_animation, spill_animation)))]
 
 
 class TeleportationPotionCallback(ThrowablePotionCallback):
@@ -126,23 +121,21 @@ class TeleportationPotionCallback(ThrowablePotionCallback):
             Animations.THROW_POTION,
             (self.user.x, self.user.y), (target.x, target.y))
         potion_animation = (Animations.TELEPORTATION_POTION, (target.x, target.y))
-        return [{
-            ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            ResultTypes.MOVE_TO_RANDOM_POSITION: target,
-            ResultTypes.ANIMATION: (
-                Animations.CONCATINATED, (throw_animation, potion_animation))
-        }]
+        return [
+            Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+            Result(ResultTypes.MOVE_TO_RANDOM_POSITION, target),
+            Result(ResultTypes.ANIMATION, (
+                Animations.CONCATINATED, (throw_animation, potion_animation)))]
 
     def unsuccessful_target_result(self, x, y):
         text = "The teleportation postion splashes on the ground."
         throw_animation = (
             Animations.THROW_POTION, (self.user.x, self.user.y), (x, y))
         spill_animation = (Animations.TELEPORTATION_POTION, (x, y))
-        return [{
-            ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            ResultTypes.ANIMATION: (
-                Animations.CONCATINATED, (throw_animation, spill_animation))
-        }]
+        return [
+            Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+            Result(ResultTypes.ANIMATION, (
+                Animations.CONCATINATED, (throw_animation, spill_animation)))]
 
         
 class WeaponCallback:
@@ -158,23 +151,21 @@ class WeaponCallback:
             self.game_map, (self.user.x, self.user.y), (x, y))
         if monster and monster.harmable:
             text = f"The {self.owner.owner.name} pierces the {monster.name}'s flesh."
-            results.append({
-                ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-                ResultTypes.DAMAGE: (
+            results.extend([
+                Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+                Result(ResultTypes.DAMAGE, (
                     monster, None, 
                     THROWN_WEAPON_DAMAGE_FACTOR * self.owner.owner.stats.power,
-                    self.owner.owner.stats.elements),
-                ResultTypes.ANIMATION: (
+                    self.owner.owner.stats.elements)),
+                Result(ResultTypes.ANIMATION, (
                     Animations.THROWING_KNIFE,
                     (self.user.x, self.user.y),
-                    (monster.x, monster.y))
-            })
+                    (monster.x, monster.y)))])
         else:
             # Todo: Have the knife drop on the ground.
             text = "The {self.owner.name} clatters to the ground"
-            results.append({
-                ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            })
+            results.append(Result(
+                ResultTypes.MESSAGE, Message(text, COLORS.get('white'))))
         return results
 
 
@@ -191,18 +182,16 @@ class ThrowingKnifeCallback:
             self.game_map, (self.user.x, self.user.y), (x, y))
         if monster and monster.harmable:
             text = f"The throwing knife pierces the {monster.name}'s flesh."
-            results.append({
-                ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-                ResultTypes.DAMAGE: (monster, None, self.owner.damage, [Elements.NONE]),
-                ResultTypes.ANIMATION: (
+            results.extend([
+                Result(ResultTypes.MESSAGE, Message(text, COLORS.get('white'))),
+                Result(ResultTypes.DAMAGE, (monster, None, self.owner.damage, [Elements.NONE])),
+                Result(ResultTypes.ANIMATION, (
                     Animations.THROWING_KNIFE,
                     (self.user.x, self.user.y),
-                    (monster.x, monster.y))
-            })
+                    (monster.x, monster.y)))])
         else:
             # Todo: Have the knife drop on the ground.
             text = "The throwing knife clatters to the ground"
-            results.append({
-                ResultTypes.MESSAGE: Message(text, COLORS.get('white')),
-            })
+            results.append(Result(
+                ResultTypes.MESSAGE, Message(text, COLORS.get('white'))))
         return results
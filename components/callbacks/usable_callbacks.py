@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes, Animations
+from turn_results import Result
 from utils.utils import (
     bresenham_ray, get_all_entities_with_component_in_position)
 
@@ -43,9 +44,8 @@ class FireStaffCallback:
             if any(entity.blocks for entity in entities_in_position):
                 last_position = position
                 break
-        results.append({
-            ResultTypes.ANIMATION: (
-                Animations.FIREBALL, source, last_position)})
+        results.append(Result(ResultTypes.ANIMATION, (
+            Animations.FIREBALL, source, last_position)))
         return results
 
 
@@ -74,7 +74,6 @@ class IceStaffCallback:
             if any(entity.blocks for entity in entities_in_position):
                 last_position = position
                 break
-        results.append({
-            ResultTypes.ANIMATION: (
-                Animations.ICEBALL, source, last_position)})
+        results.append(Result(ResultTypes.ANIMATION, (
+            Animations.ICEBALL, source, last_position)))
         return results
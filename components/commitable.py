@@ -16,10 +16,28 @@ class BaseCommitable:
     """Baseline logic for commiting a new entity to the map."""
     def commit(self, game_map):
         game_map.entities.append(self.owner)
+        game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         if self.owner in game_map.entities:
             game_map.entities.remove(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
+
+
+class LingeringCommitable(BaseCommitable):
+    """Commit or delete an entity that lingers in its tile for a fixed number
+    of turns, counted down by its timer in the map's timers.
+    """
+    def __init__(self, n_turns):
+        self.n_turns = n_turns
+
+    def commit(self, game_map):
+        super().commit(game_map)
+        game_map.timers.set(self.owner, self.n_turns)
+
+    def delete(self, game_map):
+        super().delete(game_map)
+        game_map.timers.clear(self.owner)
 
 
 class BlockingCommitable:
@@ -30,7 +48,9 @@ class BlockingCommitable:
             return
         else:
             game_map.blocked[self.owner.x, self.owner.y] = True
+            game_map.bump_version("blocked")
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         x, y = self.owner.x, self.owner.y
@@ -39,20 +59,28 @@ class BlockingCommitable:
                 f"Attempt to remove blocking entity {self.owner} from "
                 f"unblocked space {x}, {y}.")
         game_map.blocked[self.owner.x, self.owner.y] = False
+        game_map.bump_version("blocked")
         game_map.entities.remove(self.owner)
+        game_map.dirty.mark(self.owner.x, self.owner.y)
 
 
 class DoorCommitable:
 
     def commit(self, game_map):
         game_map.transparent[self.owner.x, self.owner.y] = False
+        game_map.bump_version("transparent")
         game_map.door[self.owner.x, self.owner.y] = True
+        game_map.bump_version("door")
         game_map.entities.append(self.owner)
+        game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         game_map.transparent[self.owner.x, self.owner.y] = True
+        game_map.bump_version("transparent")
         game_map.door[self.owner.x, self.owner.y] = False
+        game_map.bump_version("door")
         game_map.entities.remove(self.owner)
+        game_map.dirty.mark(self.owner.x, self.owner.y)
 
 
 class FireCommitable:
@@ -62,7 +90,9 @@ class FireCommitable:
             return
         else:
             game_map.fire[self.owner.x, self.owner.y] = True
+            game_map.bump_version("fire")
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         if not game_map.fire[self.owner.x, self.owner.y]:
@@ -70,17 +100,29 @@ class FireCommitable:
                 f"Attempt to remove fire entity {self.owner} from "
                  "non-fire space.")
         game_map.fire[self.owner.x, self.owner.y] = False
+        game_map.bump_version("fire")
         game_map.entities.remove(self.owner)
+        game_map.dirty.mark(self.owner.x, self.owner.y)
 
 
 class SteamCommitable:
+    """Steam also records how it spreads and dissipates in the map's steam
+    field.
+    """
+    def __init__(self, p_spread, p_dissipate):
+        self.p_spread = p_spread
+        self.p_dissipate = p_dissipate
 
     def commit(self, game_map):
         if game_map.steam[self.owner.x, self.owner.y]:
             return
         else:
             game_map.steam[self.owner.x, self.owner.y] = True
+            game_map.bump_version("steam")
+            game_map.steam_field.add(
+                self.owner.x, self.owner.y, self.p_spread, self.p_dissipate)
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         if not game_map.steam[self.owner.x, self.owner.y]:
@@ -88,7 +130,10 @@ class SteamCommitable:
                 f"Attempt to remove steam entity {self.owner} from "
                  "non-steam space.")
         game_map.steam[self.owner.x, self.owner.y] = False
+        game_map.bump_version("steam")
+        game_map.steam_field.remove(self.owner.x, self.owner.y)
         game_map.entities.remove(self.owner)
+        game_map.dirty.mark(self.owner.x, self.owner.y)
 
 
 class TerrainCommitable:
@@ -99,6 +144,7 @@ class TerrainCommitable:
         else:
             game_map.terrain[self.owner.x, self.owner.y] = True
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         x, y = self.owner.x, self.owner.y
@@ -114,6 +160,7 @@ class TerrainCommitable:
                     f"non-terrain space {x}, {y}.")
             game_map.terrain[self.owner.x, self.owner.y] = False
             game_map.entities.remove(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
 
 class BlockingTerrainCommitable:
@@ -122,8 +169,10 @@ class BlockingTerrainCommitable:
         if not (game_map.terrain[self.owner.x, self.owner.y]
             and not game_map.blocked[self.owner.x, self.owner.y]):
             game_map.blocked[self.owner.x, self.owner.y] = True
+            game_map.bump_version("blocked")
             game_map.terrain[self.owner.x, self.owner.y] = True
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         x, y = self.owner.x, self.owner.y
@@ -143,6 +192,7 @@ class BlockingTerrainCommitable:
                     "unblocked space {x}, {y}.")
             game_map.terrain[self.owner.x, self.owner.y] = False
             game_map.entities.remove(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
 
 class UpwardStairsCommitable:
@@ -151,8 +201,10 @@ class UpwardStairsCommitable:
         if not game_map.terrain[self.owner.x, self.owner.y]:
             game_map.terrain[self.owner.x, self.owner.y] = True
             game_map.walkable[self.owner.x, self.owner.y] = True
+            game_map.bump_version("walkable")
             game_map.upward_stairs_position = (self.owner.x, self.owner.y)
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         if self.owner in game_map.entities:
@@ -165,8 +217,10 @@ class DownwardStairsCommitable:
         if not game_map.terrain[self.owner.x, self.owner.y]:
             game_map.terrain[self.owner.x, self.owner.y] = True
             game_map.walkable[self.owner.x, self.owner.y] = True
+            game_map.bump_version("walkable")
             game_map.downward_stairs_position = (self.owner.x, self.owner.y)
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         if self.owner in game_map.entities:
@@ -179,13 +233,17 @@ class WaterCommitable:
         if not game_map.terrain[self.owner.x, self.owner.y]:
             game_map.terrain[self.owner.x, self.owner.y] = True
             game_map.water[self.owner.x, self.owner.y] = True
+            game_map.bump_version("water")
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         if self.owner in game_map.entities:
             game_map.terrain[self.owner.x, self.owner.y] = False
             game_map.water[self.owner.x, self.owner.y] = False
+            game_map.bump_version("water")
             game_map.entities.remove(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
 
 class IceCommitable:
@@ -195,12 +253,14 @@ class IceCommitable:
             game_map.terrain[self.owner.x, self.owner.y] = True
             game_map.ice[self.owner.x, self.owner.y] = True
             game_map.entities.append(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
     def delete(self, game_map):
         if self.owner in game_map.entities:
             game_map.terrain[self.owner.x, self.owner.y] = False
             game_map.ice[self.owner.x, self.owner.y] = False
             game_map.entities.remove(self.owner)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
 
 
 class ShrubCommitable(TerrainCommitable):
@@ -208,9 +268,11 @@ class ShrubCommitable(TerrainCommitable):
     def commit(self, game_map):
         super().commit(game_map)
         game_map.transparent[self.owner.x, self.owner.y] = False
+        game_map.bump_version("transparent")
         game_map.shrub[self.owner.x, self.owner.y] = True
 
     def delete(self, game_map):
         super().delete(game_map)
         game_map.transparent[self.owner.x, self.owner.y] = True
+        game_map.bump_version("transparent")
         game_map.shrub[self.owner.x, self.owner.y] = False
\ No newline at end of file
@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes
+from turn_results import Result
 
 
 class FinitelyConsumable:
@@ -27,12 +28,12 @@ class FinitelyConsumable:
     def consume(self):
         self.uses = max(0, self.uses - 1)
         if self.uses == 0:
-            return [{
-                ResultTypes.DISCARD_ITEM: (self.owner, self.discard_on_empty),
-                ResultTypes.END_TURN: True}]
+            return [
+                Result(ResultTypes.DISCARD_ITEM,
+                       (self.owner, self.discard_on_empty)),
+                Result(ResultTypes.END_TURN, True)]
         else:
-            return [{
-                ResultTypes.END_TURN: True}]
+            return [Result(ResultTypes.END_TURN, True)]
 
     def make_menu_display(self):
         if self.uses <= 1 and not self.display_on_one:
@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes
+from turn_results import Result
 
 
 class Defender:
@@ -38,8 +39,8 @@ class Defender:
         """
         results = []
         if self.damage_transformers == []:
-            results.append({
-                ResultTypes.HARM: (self.owner, source, amount, elements)})
+            results.append(Result(
+                ResultTypes.HARM, (self.owner, source, amount, elements)))
         for transformer in self.damage_transformers:
             results.extend(transformer.transform(
                 self.owner, source, amount, elements=elements))
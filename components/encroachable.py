@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes, Elements
+from turn_results import Result
 from etc.game_config import NECROTIC_SOIL_BASE_DAMAGE
 import game_objects.terrain
 
@@ -11,8 +12,8 @@ class ShrubEncroachable:
         results = []
         grass = game_objects.terrain.Grass.make(
             game_map, self.owner.x, self.owner.y)
-        results.append({ResultTypes.ADD_ENTITY: grass})
-        results.append({ResultTypes.REMOVE_ENTITY: self.owner})
+        results.append(Result(ResultTypes.ADD_ENTITY, grass))
+        results.append(Result(ResultTypes.REMOVE_ENTITY, self.owner))
         return results
 
 
@@ -26,6 +27,6 @@ class NecroticSoilEncroachable:
     def encroach(self, game_map, encroacher):
         results = []
         if encroacher.harmable:
-            results.append({ResultTypes.DAMAGE: (
-                encroacher, None, self.damage, [Elements.NECROTIC])})
+            results.append(Result(ResultTypes.DAMAGE, (
+                encroacher, None, self.damage, [Elements.NECROTIC])))
         return results
@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes
+from turn_results import Result
 from etc.colors import COLORS
 from messages import Message
 
@@ -31,14 +32,12 @@ class ArmorEquipable(BaseEquipable):
 
     def equip(self, entity):
         results = []
-        results.append({
-            ResultTypes.EQUIP_ARMOR: (entity, self.owner)})
+        results.append(Result(ResultTypes.EQUIP_ARMOR, (entity, self.owner)))
         return results
 
     def remove(self, entity):
         results = []
-        results.append({
-            ResultTypes.REMOVE_ARMOR: (entity, self.owner)})
+        results.append(Result(ResultTypes.REMOVE_ARMOR, (entity, self.owner)))
         return results
 
 
@@ -62,12 +61,10 @@ class WeaponEquipable(BaseEquipable):
 
     def equip(self, entity):
         results = []
-        results.append({
-            ResultTypes.EQUIP_WEAPON: (entity, self.owner)})
+        results.append(Result(ResultTypes.EQUIP_WEAPON, (entity, self.owner)))
         return results
 
     def remove(self, entity):
         results = []
-        results.append({
-            ResultTypes.REMOVE_WEAPON: (entity, self.owner)})
+        results.append(Result(ResultTypes.REMOVE_WEAPON, (entity, self.owner)))
         return results
@@ -1,5 +1,6 @@
 from utils.utils import random_adjacent
 from etc.enum import ResultTypes
+from turn_results import Result
 
 
 class Floatable:
@@ -8,6 +9,6 @@ class Floatable:
         x, y = self.owner.x, self.owner.y
         coord = random_adjacent((x, y))
         if game_map.walkable[coord[0], coord[1]]:
-            return [{ResultTypes.SET_POSITION: (
-                self.owner, coord[0], coord[1])}]
+            return [Result(ResultTypes.SET_POSITION, (
+                self.owner, coord[0], coord[1]))]
         return []
@@ -1,12 +1,12 @@
 from etc.enum import ResultTypes, Elements
 from etc.game_config import FREEZE_BASE_DAMAGE
+from turn_results import Result
 
 
 class EnemyFreezable:
 
     def freeze(self, game_map):
-        return [{
-            ResultTypes.FREEZE: self.owner,
-            ResultTypes.DAMAGE: (
-                self.owner, None, FREEZE_BASE_DAMAGE, [Elements.ICE])
-        }]
+        return [
+            Result(ResultTypes.FREEZE, self.owner),
+            Result(ResultTypes.DAMAGE, (
+                self.owner, None, FREEZE_BASE_DAMAGE, [Elements.ICE]))]
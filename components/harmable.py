@@ -1,4 +1,5 @@
 from messages import Message
+from turn_results import Result
 from status_bar import StatusBar
 from game_events import fireblast, waterblast
 
@@ -61,7 +62,7 @@ class Harmable:
         results = []
         self.hp = min(max(0, self.hp - amount), self.max_hp)
         if self.hp <= 0:
-            results.append({ResultTypes.DEAD_ENTITY: self.owner})
+            results.append(Result(ResultTypes.DEAD_ENTITY, self.owner))
         return results
 
     # TODO: Remove this method.
@@ -105,9 +106,9 @@ class PinkJellyHarmable(Harmable):
             jelly = game_objects.monsters.PinkJelly.make_if_possible(
                 game_map, x, y, hp=self.hp)
             if jelly:
-                results.append({ResultTypes.ADD_ENTITY: jelly})
+                results.append(Result(ResultTypes.ADD_ENTITY, jelly))
         if self.hp <= 0:
-            results.append({ResultTypes.DEAD_ENTITY: self.owner})
+            results.append(Result(ResultTypes.DEAD_ENTITY, self.owner))
         return results
 
 
@@ -121,7 +122,7 @@ class FireBloatHarmable(Harmable):
                 (self.owner.x, self.owner.y),
                 radius=FIREBLOAT_BLAST_RADIUS,
                 damage=FIREBLOAT_BLAST_DAMAGE))
-        results.append({ResultTypes.DEAD_ENTITY: self.owner})
+        results.append(Result(ResultTypes.DEAD_ENTITY, self.owner))
         return results
 
 
@@ -134,7 +135,7 @@ class WaterBloatHarmable(Harmable):
             (self.owner.x, self.owner.y),
             radius=WATERBLOAT_BLAST_RADIUS,
             damage=WATERBLOAT_BLAST_DAMAGE))
-        results.append({ResultTypes.DEAD_ENTITY: self.owner})
+        results.append(Result(ResultTypes.DEAD_ENTITY, self.owner))
         return results
 
 
@@ -1,5 +1,6 @@
 from messages import Message
 from etc.enum import ResultTypes
+from turn_results import Result
 
 class Inventory:
     """An entities inventory."""
@@ -13,16 +14,16 @@ class Inventory:
     def pickup(self, item):
         results = []
         if len(self.items) >= self.capacity:
-            results.append({
-                ResultTypes.END_TURN: True,
-                ResultTypes.MESSAGE: Message(
-                    f'{self.owner.name} cannot carry any more items.')})
+            results.extend([
+                Result(ResultTypes.END_TURN, True),
+                Result(ResultTypes.MESSAGE, Message(
+                    f'{self.owner.name} cannot carry any more items.'))])
         else:
-            results.append({
-                ResultTypes.END_TURN: True,
-                ResultTypes.ADD_ITEM_TO_INVENTORY: (self.owner, item),
-                ResultTypes.MESSAGE: Message(
-                    f'{self.owner.name} picks up the {item.name}.')})
+            results.extend([
+                Result(ResultTypes.END_TURN, True),
+                Result(ResultTypes.ADD_ITEM_TO_INVENTORY, (self.owner, item)),
+                Result(ResultTypes.MESSAGE, Message(
+                    f'{self.owner.name} picks up the {item.name}.'))])
         return results
 
     def drop(self, item):
@@ -30,15 +31,16 @@ class Inventory:
         if item.equipable and item.equipable.equipped:
             message = Message(
                 f'{self.owner.name} cannot drop {item.name}, as it is currently equipped.')
-            results.append({
-                ResultTypes.END_TURN: True,
-                ResultTypes.MESSAGE: message})
+            results.extend([
+                Result(ResultTypes.END_TURN, True),
+                Result(ResultTypes.MESSAGE, message)])
         else:
             message = Message(f'{self.owner.name} dropped the {item.name}')
-            results.append({
-                ResultTypes.END_TURN: True,
-                ResultTypes.DROP_ITEM_FROM_INVENTORY: (self.owner, item),
-                ResultTypes.MESSAGE: message})
+            results.extend([
+                Result(ResultTypes.END_TURN, True),
+                Result(ResultTypes.DROP_ITEM_FROM_INVENTORY,
+                       (self.owner, item)),
+                Result(ResultTypes.MESSAGE, message)])
         return results
 
     def add(self, item):
@@ -37,8 +37,11 @@ class Movable:
             if self.owner.blocks:
                 game_map.blocked[self.owner.x, self.owner.y] = False
                 game_map.blocked[target_location] = True
+                game_map.bump_version("blocked")
             game_map.entities.update_position(
                 self.owner, (self.owner.x, self.owner.y), target_location)
+            game_map.dirty.mark(self.owner.x, self.owner.y)
+            game_map.dirty.mark(*target_location)
             self.owner.x, self.owner.y = target_location 
             return True
         return False
@@ -73,7 +76,31 @@ class Movable:
                 break
 
     def move_towards(self, game_map, target_x, target_y):
-        """Move the owner one step towards a target."""
+        """Move the owner one step towards a target.
+
+        When the target is the root of the map's flow fields (the player), the
+        step is read from the shared flow field for the owner's routing
+        profile.  A target in an adjacent square is stepped to directly, unless
+        the owner's routing mask avoids it (this is how entities following a
+        path they already hold take their next step), otherwise a path to the
+        target is searched for.
+        """
+        flow_fields = game_map.flow_fields
+        if (target_x, target_y) == flow_fields.root:
+            step = flow_fields.next_step(
+                game_map, (self.owner.x, self.owner.y),
+                routing_avoid=self.owner.routing_avoid)
+            if step:
+                dx, dy = step[0] - self.owner.x, step[1] - self.owner.y
+                self.move(game_map, dx, dy)
+            return
+        dx, dy = target_x - self.owner.x, target_y - self.owner.y
+        if max(abs(dx), abs(dy)) == 1:
+            routing_mask = game_map.routing_masks.get(
+                game_map, self.owner.routing_avoid)
+            if routing_mask[target_x, target_y]:
+                self.move(game_map, dx, dy)
+            return
         path = get_shortest_path(
             game_map, (self.owner.x, self.owner.y), (target_x, target_y),
             routing_avoid=self.owner.routing_avoid)
@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes
+from turn_results import Result
 
 
 class Rechargeable:
@@ -11,6 +12,5 @@ class Rechargeable:
         self.charges += 1
         if self.charges >= self.charges_needed:
             self.charges = 0
-            return [{
-                ResultTypes.RECHARGE_ITEM: self.owner}]
+            return [Result(ResultTypes.RECHARGE_ITEM, self.owner)]
         return []
@@ -1,16 +1,18 @@
 from colors import (
-    random_light_water, random_dark_water, 
+    random_light_water, random_dark_water,
     random_light_ice, random_dark_ice,
-    random_red_or_yellow, random_grey,
-    random_orange_or_red)
+    random_grey, random_orange_or_red)
+
 
 class WaterShimmer:
     """Change the random colors of a water tile."""
     def shimmer(self):
         self.owner.fg_color = random_light_water()
         self.owner.bg_color = random_light_water()
+
+    def shimmer_dark(self):
         self.owner.dark_fg_color = random_dark_water()
-        self.ownerdark_bg_color = random_dark_water()
+        self.owner.dark_bg_color = random_dark_water()
 
 
 class IceShimmer:
@@ -18,9 +20,11 @@ class IceShimmer:
     def shimmer(self):
         self.owner.fg_color = random_light_ice()
         self.owner.bg_color = random_light_ice()
+
+    def shimmer_dark(self):
         self.owner.dark_fg_color = random_dark_ice()
-        self.ownerdark_bg_color = random_dark_ice()
-       
+        self.owner.dark_bg_color = random_dark_ice()
+
 
 class FireShimmer:
     """Change the random colors of a fire tile."""
@@ -28,9 +32,15 @@ class FireShimmer:
         self.owner.fg_color = random_orange_or_red()
         self.owner.bg_color = random_orange_or_red()
 
+    def shimmer_dark(self):
+        pass
+
 
 class SteamShimmer:
     """Change the random colors of a steam tile."""
     def shimmer(self):
         self.owner.fg_color = random_grey()
         self.owner.bg_color = random_grey()
+
+    def shimmer_dark(self):
+        pass
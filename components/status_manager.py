@@ -36,7 +36,7 @@ class PlayerConfusedManager:
 
     def remove(self):
         self.owner.add_component(self.old_input_handler, "input_handler")
-        self.owner.status_manager = None
+        self.owner.add_component(None, "status_manager")
 
     def tick(self):
         self.n_turns += 1
@@ -67,7 +67,7 @@ class EnemyConfusedManager:
 
     def remove(self):
         self.owner.add_component(self.old_ai, "ai")
-        self.owner.status_manager = None
+        self.owner.add_component(None, "status_manager")
 
     def tick(self):
         self.n_turns += 1
@@ -91,7 +91,7 @@ class EnemyFrozenManager:
 
     def remove(self):
         self.owner.add_component(self.old_ai, "ai")
-        self.owner.status_manager = None
+        self.owner.add_component(None, "status_manager")
 
     def tick(self):
         self.n_turns += 1
@@ -116,7 +116,7 @@ class SpeedManager:
 
     def remove(self):
         self.owner.add_component(self.old_movable, "movable")
-        self.owner.status_manager = None
+        self.owner.add_component(None, "status_manager")
 
     def tick(self):
         self.n_turns += 1
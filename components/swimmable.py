@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes, Elements
+from turn_results import Result
 from etc.config import BOTTOM_PANEL_CONFIG
 from etc.colors import STATUS_BAR_COLORS
 from status_bar import StatusBar
@@ -16,14 +17,17 @@ class PlayerSwimmable:
     def swim(self):
         results = []
         if self.stamina > 0:
-            results.append({ResultTypes.CHANGE_SWIM_STAMINA: (self.owner, -1)})
+            results.append(
+                Result(ResultTypes.CHANGE_SWIM_STAMINA, (self.owner, -1)))
         if self.stamina <= 0:
-            results.append({ResultTypes.DAMAGE: (self.owner, None, 5, [Elements.WATER])})
+            results.append(Result(
+                ResultTypes.DAMAGE, (self.owner, None, 5, [Elements.WATER])))
         return results
 
     def rest(self):
         results = []
-        results.append({ResultTypes.CHANGE_SWIM_STAMINA: (self.owner, 1)})
+        results.append(
+            Result(ResultTypes.CHANGE_SWIM_STAMINA, (self.owner, 1)))
         return results
 
     def change_stamina(self, change):
@@ -44,6 +48,6 @@ class BaseSwimmable:
 
     def swim(self):
         results = []
-        results.append({
-            ResultTypes.DAMAGE: (self.owner, None, 5, [Elements.WATER])})
+        results.append(Result(
+            ResultTypes.DAMAGE, (self.owner, None, 5, [Elements.WATER])))
         return results
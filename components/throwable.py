@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes, CursorTypes
+from turn_results import Result
 
 from etc.game_config import (
     HEALTH_POTION_HEAL_AMOUNT, THROWING_KNIFE_BASE_DAMAGE)
@@ -25,9 +26,8 @@ class HealthPotionThrowable:
 
     def throw(self, game_map, thrower):
         callback = HealthPotionCallback(self, game_map, thrower)
-        return [{
-            ResultTypes.CURSOR_MODE: (
-                thrower.x, thrower.y, callback, CursorTypes.PATH)}]
+        return [Result(ResultTypes.CURSOR_MODE, (
+            thrower.x, thrower.y, callback, CursorTypes.PATH))]
 
 
 class ConfusionPotionThrowable:
@@ -37,9 +37,8 @@ class ConfusionPotionThrowable:
 
     def throw(self, game_map, thrower):
         callback = ConfusionPotionCallback(self, game_map, thrower)
-        return [{
-            ResultTypes.CURSOR_MODE: (
-                thrower.x, thrower.y, callback, CursorTypes.PATH)}]
+        return [Result(ResultTypes.CURSOR_MODE, (
+            thrower.x, thrower.y, callback, CursorTypes.PATH))]
 
 
 class SpeedPotionThrowable:
@@ -49,9 +48,8 @@ class SpeedPotionThrowable:
 
     def throw(self, game_map, thrower):
         callback = SpeedPotionCallback(self, game_map, thrower)
-        return [{
-            ResultTypes.CURSOR_MODE: (
-                thrower.x, thrower.y, callback, CursorTypes.PATH)}]
+        return [Result(ResultTypes.CURSOR_MODE, (
+            thrower.x, thrower.y, callback, CursorTypes.PATH))]
 
 
 class TeleportationPotionThrowable:
@@ -61,9 +59,8 @@ class TeleportationPotionThrowable:
 
     def throw(self, game_map, thrower):
         callback = TeleportationPotionCallback(self, game_map, thrower)
-        return [{
-            ResultTypes.CURSOR_MODE: (
-                thrower.x, thrower.y, callback, CursorTypes.PATH)}]
+        return [Result(ResultTypes.CURSOR_MODE, (
+            thrower.x, thrower.y, callback, CursorTypes.PATH))]
 
 
 class WeaponThrowable:
@@ -72,8 +69,8 @@ class WeaponThrowable:
     """
     def throw(self, game_map, user):
         callback = WeaponCallback(self, game_map, user)
-        return [{ResultTypes.CURSOR_MODE: (
-            user.x, user.y, callback, CursorTypes.PATH)}]
+        return [Result(ResultTypes.CURSOR_MODE, (
+            user.x, user.y, callback, CursorTypes.PATH))]
 
 
 class ThrowingKnifeThrowable:
@@ -84,7 +81,7 @@ class ThrowingKnifeThrowable:
     def throw(self, game_map, user):
         callback = ThrowingKnifeCallback(self, game_map, user)
         return [
-            {ResultTypes.CURSOR_MODE: (
-                user.x, user.y, callback, CursorTypes.PATH)}]
+            Result(ResultTypes.CURSOR_MODE, (
+                user.x, user.y, callback, CursorTypes.PATH))]
 
 
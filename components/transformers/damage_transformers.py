@@ -1,4 +1,5 @@
 from etc.enum import ResultTypes, Elements
+from turn_results import Result
 
 class LinearTransformer:
     """Base for classes that transform damage linearly.
@@ -31,9 +32,8 @@ class OffensiveLinearTransformer(LinearTransformer):
             elements = {Elements.NONE}
         elements = self.elements.union(elements) 
         damage = self.multiplyer * amount + self.addend
-        return [{
-            ResultTypes.HARM: (
-                target, source, damage, self.elements)}]
+        return [Result(ResultTypes.HARM, (
+            target, source, damage, self.elements))]
 
 
 class DefensiveLinearTransformer(LinearTransformer):
@@ -45,8 +45,7 @@ class DefensiveLinearTransformer(LinearTransformer):
             elements = {Elements.NONE}
         damage = self.multiplyer * amount - self.addend
         if self.elements.intersection(elements):
-            return [{
-                ResultTypes.HARM: (
-                    target, source, damage, list(elements))}]
+            return [Result(ResultTypes.HARM, (
+                target, source, damage, list(elements)))]
         else:
             return []
@@ -1,5 +1,6 @@
 from etc.colors import COLORS
 from messages import Message
+from turn_results import Result
 from game_events import fireblast, waterblast, use_staff
 
 from components.callbacks.usable_callbacks import (
@@ -42,16 +43,16 @@ class HealthPotionUsable:
         results = []
         message = Message(f"{reciever.name}'s wounds start to heal.", 
                             COLORS.get('green'))
-        results.append({
-            ResultTypes.DAMAGE: (
+        results.extend([
+            Result(ResultTypes.DAMAGE, (
                 # Note the minus sign, healing is negative damage.
-                reciever, None, -HEALTH_POTION_HEAL_AMOUNT, [Elements.HEALING]),
-            ResultTypes.INCREASE_MAX_HP: (
-                reciever, HEALTH_POTION_HP_INCREASE_AMOUNT),
-            ResultTypes.MESSAGE: message,
-            ResultTypes.ANIMATION: (
+                reciever, None, -HEALTH_POTION_HEAL_AMOUNT, [Elements.HEALING])),
+            Result(ResultTypes.INCREASE_MAX_HP, (
+                reciever, HEALTH_POTION_HP_INCREASE_AMOUNT)),
+            Result(ResultTypes.MESSAGE, message),
+            Result(ResultTypes.ANIMATION, (
                 Animations.HEALTH_POTION, 
-                (reciever.x, reciever.y))})
+                (reciever.x, reciever.y)))])
         return results
 
 
@@ -67,13 +68,13 @@ class PowerPotionUsable:
         results = []
         message = Message(f"{reciever.name}'s attack power increased.", 
                           COLORS.get('green'))
-        results.append({
-            ResultTypes.INCREASE_ATTACK_POWER: (
-                reciever, POWER_POTION_INCREASE_AMOUNT),
-            ResultTypes.MESSAGE: message,
-            ResultTypes.ANIMATION: (
+        results.extend([
+            Result(ResultTypes.INCREASE_ATTACK_POWER, (
+                reciever, POWER_POTION_INCREASE_AMOUNT)),
+            Result(ResultTypes.MESSAGE, message),
+            Result(ResultTypes.ANIMATION, (
                 Animations.POWER_POTION, 
-                (reciever.x, reciever.y))})
+                (reciever.x, reciever.y)))])
         return results
 
 
@@ -89,12 +90,12 @@ class SpeedPotionUsable:
         results = []
         message = Message(f"{reciever.name}'s speed doubled.", 
                           COLORS.get('green'))
-        results.append({
-            ResultTypes.DOUBLE_SPEED: reciever,
-            ResultTypes.MESSAGE: message,
-            ResultTypes.ANIMATION: (
+        results.extend([
+            Result(ResultTypes.DOUBLE_SPEED, reciever),
+            Result(ResultTypes.MESSAGE, message),
+            Result(ResultTypes.ANIMATION, (
                 Animations.SPEED_POTION, 
-                (reciever.x, reciever.y))})
+                (reciever.x, reciever.y)))])
         return results
 
 
@@ -110,12 +111,12 @@ class TeleportationPotionUsable:
         results = []
         message = Message(f"The {reciever.name} vanished.", 
                           COLORS.get('green'))
-        results.append({
-            ResultTypes.MOVE_TO_RANDOM_POSITION: reciever,
-            ResultTypes.MESSAGE: message,
-            ResultTypes.ANIMATION: (
+        results.extend([
+            Result(ResultTypes.MOVE_TO_RANDOM_POSITION, reciever),
+            Result(ResultTypes.MESSAGE, message),
+            Result(ResultTypes.ANIMATION, (
                 Animations.TELEPORTATION_POTION, 
-                (reciever.x, reciever.y))})
+                (reciever.x, reciever.y)))])
         return results
 
 
@@ -138,12 +139,12 @@ class ConfusionPotionUsable:
         results = []
         message = Message(f"{reciever.name}'s became confused!",
                           COLORS.get('purple'))
-        results.append({
-            ResultTypes.CONFUSE: reciever,
-            ResultTypes.MESSAGE: message,
-            ResultTypes.ANIMATION: (
+        results.extend([
+            Result(ResultTypes.CONFUSE, reciever),
+            Result(ResultTypes.MESSAGE, message),
+            Result(ResultTypes.ANIMATION, (
                 Animations.CONFUSION_POTION, 
-                (reciever.x, reciever.y))})
+                (reciever.x, reciever.y)))])
         return results
 
 
@@ -199,20 +200,20 @@ class MagicMissileUsable:
                     text = 'A shining magic missile pierces the {}'.format(
                         monster.name)
                     message = Message(text, COLORS.get('white'))
-                    results.append({ResultTypes.DAMAGE: (
-                                        monster, None, self.damage, [Elements.NONE]),
-                                    ResultTypes.MESSAGE: message})
+                    results.extend([
+                        Result(ResultTypes.DAMAGE, (
+                            monster, None, self.damage, [Elements.NONE])),
+                        Result(ResultTypes.MESSAGE, message)])
             animations = [
                 (Animations.MAGIC_MISSILE, (user.x, user.y), (monster.x, monster.y))
                 for monster in closest_monsters]
-            results.append({
-                ResultTypes.ANIMATION: (
-                    Animations.SIMULTANEOUS, animations)})               
+            results.append(Result(ResultTypes.ANIMATION, (
+                Animations.SIMULTANEOUS, animations)))               
         else:
             message = Message(
                 "A shining magic missile streaks into the darkness.",
                 COLORS.get('white'))
-            results.append({ResultTypes.MESSAGE: message})
+            results.append(Result(ResultTypes.MESSAGE, message))
         return results
 
 
@@ -286,9 +287,8 @@ class TorchUsable:
 
     def use(self, game_map, user):
         callback = TorchCallback(self, game_map, user)
-        return [{
-            ResultTypes.CURSOR_MODE: (
-                user.x, user.y, callback, CursorTypes.ADJACENT)}]
+        return [Result(ResultTypes.CURSOR_MODE, (
+            user.x, user.y, callback, CursorTypes.ADJACENT))]
 
 
 class FireStaffUsable:
@@ -74,8 +74,11 @@ class Cursor:
         self.game_map.highlight_position(self.x, self.y, self.cursor_color)
 
     def clear(self):
+        # Also mark the path dirty, so it is restored from the current state
+        # of the map on the next render.
         for x, y in self._path_iter():
             self.game_map.redraw_position(x, y)
+            self.game_map.dirty.mark(x, y)
 
     def _position_valid(self, x, y):
         if self.cursor_type in (CursorTypes.PATH, CursorTypes.RAY):
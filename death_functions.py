@@ -1,6 +1,7 @@
 from messages import Message
 
 from etc.enum import EntityTypes, GameStates, RenderOrder, ResultTypes
+from turn_results import Result
 from etc.colors import COLORS
 
 from components.harmable import NullHarmable
@@ -10,32 +11,36 @@ from components.floatable import Floatable
 def kill_player(player):
     player.char = '%'
     player.color = COLORS['dark_red']
-    return [{ResultTypes.DEATH_MESSAGE: Message('You died!', COLORS['red'])}]
+    return [Result(
+        ResultTypes.DEATH_MESSAGE, Message('You died!', COLORS['red']))]
 
 def kill_monster(monster, game_map):
     game_map.blocked[monster.x, monster.y] = False
+    game_map.bump_version("blocked")
     monster.blocks = False
     # The corpse needs to be able to float, and so needs to pass checks for
     # movability into a water tile.
     monster.routing_avoid = []
     # Remove all monster components, or replace with null placeholders.
-    monster.ai = None
-    monster.attacker = None
-    monster.burnable = None
-    monster.status_manager = None
-    monster.dissapatable = None
-    monster.spreadable = None
-    monster.swimable = None
-    monster.floatable = Floatable()
-    monster.floatable.owner = monster
-    monster.harmable = NullHarmable()
-    monster.harmable.owner = monster
+    monster.add_component(None, "ai")
+    monster.add_component(None, "attacker")
+    monster.add_component(None, "burnable")
+    monster.add_component(None, "status_manager")
+    monster.add_component(None, "dissipatable")
+    monster.add_component(None, "spreadable")
+    monster.add_component(None, "swimmable")
+    monster.add_component(Floatable(), "floatable")
+    monster.add_component(NullHarmable(), "harmable")
     message = 'The {} is dead!'.format(monster.name.capitalize())
-    return [{ResultTypes.MESSAGE: Message(message, COLORS['orange'])}]
+    return [Result(ResultTypes.MESSAGE, Message(message, COLORS['orange']))]
 
-def make_corpse(monster):
+def make_corpse(monster, game_map):
     monster.char = '#'
     monster.fg_color = COLORS['dark_red']
     monster.entity_type = EntityTypes.CORPSE
     monster.name = 'Remains of the ' + monster.name.capitalize()
+    old_render_order = monster.render_order
     monster.render_order = RenderOrder.CORPSE
+    if monster in game_map.entities:
+        game_map.entities.update_render_order(
+            monster, old_render_order, RenderOrder.CORPSE)
@@ -0,0 +1,242 @@
+"""
+Display backends.
+
+A display backend owns everything that touches the screen or the keyboard:
+creating consoles, flushing rendering to the window, and polling for input
+events.  The game loop only ever talks to the backend, so the same game can be
+driven by:
+
+  - TdlBackend: Draws to a window using tdl.  This is the backend used to play
+    the game.
+  - NullBackend: Consoles discard everything drawn to them.  Used to measure
+    the cost of the simulation alone, and to run soak tests on machines
+    without a display.
+  - ArrayBackend: Consoles record everything drawn to them into numpy arrays.
+    Used to measure rendering cost without a window, and to inspect what
+    would have been drawn.
+
+The two headless backends are driven by a script of key events, and report
+the window as closed once the script is exhausted.
+"""
+from time import sleep
+
+import numpy as np
+
+
+DEFAULT_FG = (255, 255, 255)
+DEFAULT_BG = (0, 0, 0)
+
+
+class TdlBackend:
+    """Draw the game to a window using tdl.
+
+    tdl is only imported when this backend is created, so the headless
+    backends can be used without it.
+    """
+    def __init__(self, *, font='fonts/consolas10x10.png',
+                 title='Roguelike Tutorial Game'):
+        import tdl
+        self.tdl = tdl
+        self.font = font
+        self.title = title
+
+    def init_root(self, width, height):
+        self.tdl.set_font(self.font, greyscale=True, altLayout=True)
+        return self.tdl.init(width, height, title=self.title)
+
+    def make_console(self, width, height):
+        return self.tdl.Console(width, height)
+
+    def flush(self):
+        self.tdl.flush()
+
+    def wait(self, seconds):
+        sleep(seconds)
+
+    def is_window_closed(self):
+        return self.tdl.event.is_window_closed()
+
+    def get_events(self):
+        return self.tdl.event.get()
+
+    def get_fullscreen(self):
+        return self.tdl.get_fullscreen()
+
+    def set_fullscreen(self, fullscreen):
+        self.tdl.set_fullscreen(fullscreen)
+
+
+class NullBackend:
+    """A backend that draws nothing.
+
+    Parameters
+    ----------
+    events: Iterable[KeyEvent]
+      The key events to feed to the game, one per frame.  The window is
+      reported as closed once these are exhausted.
+    """
+    def __init__(self, events=()):
+        self.events = iter(events)
+        self.closed = False
+        self.fullscreen = False
+        self.frames = 0
+
+    def init_root(self, width, height):
+        return self.make_console(width, height)
+
+    def make_console(self, width, height):
+        return NullConsole(width, height)
+
+    def flush(self):
+        self.frames += 1
+
+    def wait(self, seconds):
+        pass
+
+    def is_window_closed(self):
+        return self.closed
+
+    def get_events(self):
+        try:
+            return [next(self.events)]
+        except StopIteration:
+            self.closed = True
+            return []
+
+    def get_fullscreen(self):
+        return self.fullscreen
+
+    def set_fullscreen(self, fullscreen):
+        self.fullscreen = fullscreen
+
+
+class ArrayBackend(NullBackend):
+    """A backend that draws into in memory numpy arrays.
+
+    The root console holds the image that would have been flushed to the
+    window.
+    """
+    def init_root(self, width, height):
+        self.root = self.make_console(width, height)
+        return self.root
+
+    def make_console(self, width, height):
+        return ArrayConsole(width, height)
+
+
+class KeyEvent:
+    """A key press, with the same interface as the tdl key events consumed
+    by the input handlers.
+    """
+    def __init__(self, key='CHAR', char='', *, alt=False, shift=False,
+                 control=False):
+        self.type = 'KEYDOWN'
+        self.key = key
+        self.char = char
+        self.alt = alt
+        self.shift = shift
+        self.control = control
+
+    def __repr__(self):
+        return f"KeyEvent(key={self.key!r}, char={self.char!r})"
+
+
+class NullConsole:
+    """A console that discards everything drawn to it."""
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def draw_char(self, x, y, char, fg=Ellipsis, bg=Ellipsis):
+        pass
+
+    def draw_str(self, x, y, string, fg=Ellipsis, bg=Ellipsis):
+        pass
+
+    def draw_rect(self, x, y, width, height, string, fg=Ellipsis, bg=Ellipsis):
+        pass
+
+    def draw_frame(self, x, y, width, height, string, fg=Ellipsis,
+                   bg=Ellipsis):
+        pass
+
+    def clear(self, fg=Ellipsis, bg=Ellipsis):
+        pass
+
+    def blit(self, source, x=0, y=0, width=None, height=None,
+             srcX=0, srcY=0, fg_alpha=1.0, bg_alpha=1.0):
+        pass
+
+
+class ArrayConsole:
+    """A console that records everything drawn to it.
+
+    Colors follow the tdl conventions: a color of None leaves the current
+    color in place, and Ellipsis uses the console's default color.
+
+    Attributes
+    ----------
+    chars: np.array of str, shape (width, height)
+      The character drawn in each cell.
+
+    fg: np.array of uint8, shape (width, height, 3)
+      The foreground color of each cell.
+
+    bg: np.array of uint8, shape (width, height, 3)
+      The background color of each cell.
+    """
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.chars = np.full((width, height), ' ')
+        self.fg = np.zeros((width, height, 3), dtype=np.uint8)
+        self.bg = np.zeros((width, height, 3), dtype=np.uint8)
+        self.clear()
+
+    def draw_char(self, x, y, char, fg=Ellipsis, bg=Ellipsis):
+        self._fill(x, y, 1, 1, char, fg, bg)
+
+    def draw_str(self, x, y, string, fg=Ellipsis, bg=Ellipsis):
+        for i, char in enumerate(string):
+            self._fill(x + i, y, 1, 1, char, fg, bg)
+
+    def draw_rect(self, x, y, width, height, string, fg=Ellipsis, bg=Ellipsis):
+        self._fill(x, y, width, height, string, fg, bg)
+
+    def draw_frame(self, x, y, width, height, string, fg=Ellipsis,
+                   bg=Ellipsis):
+        self._fill(x, y, width, 1, string, fg, bg)
+        self._fill(x, y + height - 1, width, 1, string, fg, bg)
+        self._fill(x, y, 1, height, string, fg, bg)
+        self._fill(x + width - 1, y, 1, height, string, fg, bg)
+
+    def clear(self, fg=DEFAULT_FG, bg=DEFAULT_BG):
+        self.chars[:, :] = ' '
+        self.fg[:, :] = fg
+        self.bg[:, :] = bg
+
+    def blit(self, source, x=0, y=0, width=None, height=None,
+             srcX=0, srcY=0, fg_alpha=1.0, bg_alpha=1.0):
+        width = source.width - srcX if width is None else width
+        height = source.height - srcY if height is None else height
+        width = min(width, source.width - srcX, self.width - x)
+        height = min(height, source.height - srcY, self.height - y)
+        if width <= 0 or height <= 0:
+            return
+        dst = np.s_[x:x + width, y:y + height]
+        src = np.s_[srcX:srcX + width, srcY:srcY + height]
+        self.chars[dst] = source.chars[src]
+        self.fg[dst] = source.fg[src]
+        self.bg[dst] = source.bg[src]
+
+    def _fill(self, x, y, width, height, char, fg, bg):
+        cells = np.s_[max(x, 0):max(x + width, 0),
+                      max(y, 0):max(y + height, 0)]
+        if isinstance(char, int):
+            char = chr(char)
+        if char is not None:
+            self.chars[cells] = ' ' if char is Ellipsis else char
+        if fg is not None:
+            self.fg[cells] = DEFAULT_FG if fg is Ellipsis else fg
+        if bg is not None:
+            self.bg[cells] = DEFAULT_BG if bg is Ellipsis else bg
@@ -52,6 +52,13 @@ class Entity:
       In which order shoudl the entity be rendered.  For example, the player
       should be rendered after corpses and items.
 
+    entity_list: EntityList object
+      The entity list of the map the entity is currently committed to, if
+      any.  Kept up to date by the entity list.
+
+    component_names: set[str]
+      The names of all the components that have been added to the entity.
+
     Optional Attributes
     -------------------
     These optional attributes add custom behaviour to entities.
@@ -174,6 +181,8 @@ class Entity:
         self.seen = seen
         self.blocks = blocks
         self.render_order = render_order
+        self.entity_list = None
+        self.component_names = set()
 
         if routing_avoid:
             self.routing_avoid = routing_avoid
@@ -219,7 +228,13 @@ class Entity:
     def add_component(self, component, component_name):
         """Add a component as an attribute of the current object, and set the
         owner of the component to the current object.
+
+        If the entity is committed to a map, the map's entity list is notified
+        so it can keep its component indexes up to date.
         """
         if component:
             component.owner = self
         setattr(self, component_name, component)
+        self.component_names.add(component_name)
+        if self.entity_list is not None:
+            self.entity_list.update_component(self, component_name)
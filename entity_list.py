@@ -1,33 +1,237 @@
-import itertools
+import math
+from collections import defaultdict
+
+import numpy as np
+
+from etc.enum import RenderOrder
+
+
+# The width and height of the square buckets used to answer spatial queries.
+BUCKET_SIZE = 8
 
 
 class EntityList:
     """A data structure for contining all the entities in a current map.  This
-    is designed to support two sets of operations:
+    is designed to support five sets of operations:
 
-      - Standard list methods: append, remove, and iteration.
+      - Standard list methods: append, remove, membership, and iteration.
       - Efficient lookup by position in the map.
+      - Iteration in render order, without sorting.
+      - Efficient lookup of all entities holding a given component.
+      - Efficient range and nearest neighbour queries.
+
+    Entities are held in dictionaries used as insertion ordered sets, so
+    membership checks and removal take constant time while iteration order
+    stays stable.
+
+    The position index only holds the occupied positions on the map, so its
+    size scales with the number of entities, not the size of the map.  The
+    entities in each position are kept in render order.  The number of
+    entities in each position is also kept in an array, so a whole area of
+    the map can be checked for entities at once with numpy.
+
+    For spatial queries, the map is divided into a uniform grid of square
+    buckets, and each entity is additionally held in the bucket containing
+    its position.  Queries then only need to look at the entities in buckets
+    near the query position.
     """
     def __init__(self, width, height):
-        self.lst = []
-        self.coordinate_map = {
-            (i, j): [] for i, j in itertools.product(range(width), range(height))
-        }
+        self.width = width
+        self.height = height
+        self.entities = {}
+        self.coordinate_map = {}
+        self.occupancy = np.zeros((width, height), dtype=np.int16)
+        self.render_order_map = {order: {} for order in RenderOrder}
+        self.component_map = defaultdict(dict)
+        self.bucket_map = defaultdict(dict)
 
     def append(self, entity):
-        self.lst.append(entity)
-        self.coordinate_map[(entity.x, entity.y)].append(entity)
+        self.entities[entity] = None
+        self._add_to_position(entity, (entity.x, entity.y))
+        self.render_order_map[entity.render_order][entity] = None
+        entity.entity_list = self
+        for component_name in entity.component_names:
+            self.update_component(entity, component_name)
 
     def remove(self, entity):
-        self.lst.remove(entity)
-        self.coordinate_map[(entity.x, entity.y)].remove(entity)
+        del self.entities[entity]
+        self._remove_from_position(entity, (entity.x, entity.y))
+        del self.render_order_map[entity.render_order][entity]
+        entity.entity_list = None
+        for component_name in entity.component_names:
+            self.component_map[component_name].pop(entity, None)
 
     def update_position(self, entity, old_position, new_position):
-        self.coordinate_map[old_position].remove(entity)
-        self.coordinate_map[new_position].append(entity)
+        self._remove_from_position(entity, old_position)
+        self._add_to_position(entity, new_position)
+
+    def update_render_order(self, entity, old_render_order, new_render_order):
+        """Update the render order index after the render order of an entity
+        has been changed.
+        """
+        del self.render_order_map[old_render_order][entity]
+        self.render_order_map[new_render_order][entity] = None
+        # Move the entity to its new place among the entities sharing its
+        # position.
+        position = (entity.x, entity.y)
+        self._remove_from_position(entity, position)
+        self._add_to_position(entity, position)
+
+    def update_component(self, entity, component_name):
+        """Update the component index after a component of an entity has been
+        added, replaced or removed.
+        """
+        if getattr(entity, component_name):
+            self.component_map[component_name][entity] = None
+        else:
+            self.component_map[component_name].pop(entity, None)
+
+    def with_component(self, component_name):
+        """Get all the entities holding a given component.
+
+        A new list is returned, so the entities may add and remove components
+        while it is iterated over.
+        """
+        return list(self.component_map[component_name])
 
     def get_entities_in_position(self, position):
-        return self.coordinate_map[position]
+        """Get the entities in a position, in render order."""
+        return self.coordinate_map.get(position, ())
+
+    def within_radius(self, position, radius, predicate=None):
+        """Get all the entities within a given distance of a position.
+
+        Parameters
+        ----------
+        position: (int, int)
+          The center of the search.
+
+        radius: float
+          The maximum euclidean distance from the position.
+
+        predicate: Callable[[Entity], bool]
+          If supplied, only entities satisfying the predicate are returned.
+
+        Returns
+        -------
+        entities: List[Entity]
+        """
+        x, y = position
+        within_radius = []
+        buckets = self._buckets_in_box(
+            math.floor(x - radius), math.floor(y - radius),
+            math.ceil(x + radius), math.ceil(y + radius))
+        for bucket in buckets:
+            for entity in bucket:
+                dx, dy = entity.x - x, entity.y - y
+                if (dx*dx + dy*dy <= radius*radius
+                    and (predicate is None or predicate(entity))):
+                    within_radius.append(entity)
+        return within_radius
+
+    def nearest(self, position, n, predicate=None):
+        """Get the n entities closest to a position, closest first.
+
+        The buckets are searched in square rings of increasing size around
+        the bucket containing the position.  Any entity outside the rings
+        searched so far is further than ring * BUCKET_SIZE from the position,
+        so the search stops once n candidates are at least that close.
+
+        Parameters
+        ----------
+        position: (int, int)
+          The center of the search.
+
+        n: int
+          The number of entities to return.  Fewer are returned if there are
+          not enough entities satisfying the predicate.
+
+        predicate: Callable[[Entity], bool]
+          If supplied, only entities satisfying the predicate are returned.
+
+        Returns
+        -------
+        entities: List[Entity]
+        """
+        if n <= 0:
+            return []
+        x, y = position
+        bx, by = x // BUCKET_SIZE, y // BUCKET_SIZE
+        n_rings = max(self.width, self.height) // BUCKET_SIZE + 1
+        candidates = []
+        for ring in range(n_rings + 1):
+            for key in _bucket_ring(bx, by, ring):
+                for entity in self.bucket_map.get(key, ()):
+                    if predicate is None or predicate(entity):
+                        dx, dy = entity.x - x, entity.y - y
+                        candidates.append((math.sqrt(dx*dx + dy*dy), entity))
+            if len(candidates) >= n:
+                candidates.sort(key=lambda c: c[0])
+                if candidates[n - 1][0] <= ring * BUCKET_SIZE:
+                    break
+        candidates.sort(key=lambda c: c[0])
+        return [entity for _, entity in candidates[:n]]
+
+    def _buckets_in_box(self, x_min, y_min, x_max, y_max):
+        for i in range(x_min // BUCKET_SIZE, x_max // BUCKET_SIZE + 1):
+            for j in range(y_min // BUCKET_SIZE, y_max // BUCKET_SIZE + 1):
+                if (i, j) in self.bucket_map:
+                    yield self.bucket_map[(i, j)]
+
+    def _add_to_position(self, entity, position):
+        if position in self.coordinate_map:
+            # Keep the entities in each position in render order, after any
+            # entities already there with the same render order.
+            entities = self.coordinate_map[position]
+            order = entity.render_order.value
+            idx = len(entities)
+            while idx > 0 and entities[idx - 1].render_order.value > order:
+                idx -= 1
+            entities.insert(idx, entity)
+        else:
+            self.coordinate_map[position] = [entity]
+        self.occupancy[position] += 1
+        bucket = (position[0] // BUCKET_SIZE, position[1] // BUCKET_SIZE)
+        self.bucket_map[bucket][entity] = None
+
+    def _remove_from_position(self, entity, position):
+        entities = self.coordinate_map[position]
+        entities.remove(entity)
+        if not entities:
+            del self.coordinate_map[position]
+        self.occupancy[position] -= 1
+        bucket = (position[0] // BUCKET_SIZE, position[1] // BUCKET_SIZE)
+        del self.bucket_map[bucket][entity]
+        if not self.bucket_map[bucket]:
+            del self.bucket_map[bucket]
+
+    def in_render_order(self):
+        """Iterate over the entities, from those drawn first to those drawn
+        last.
+        """
+        for order in RenderOrder:
+            yield from self.render_order_map[order]
 
     def __iter__(self):
-        yield from self.lst
+        yield from self.entities
+
+    def __contains__(self, entity):
+        return entity in self.entities
+
+    def __len__(self):
+        return len(self.entities)
+
+
+def _bucket_ring(bx, by, ring):
+    """Iterate over the buckets at a chebyshev distance of exactly ring from
+    the bucket (bx, by).
+    """
+    if ring == 0:
+        yield (bx, by)
+        return
+    for i in range(bx - ring, bx + ring + 1):
+        yield (i, by - ring)
+        yield (i, by + ring)
+    for j in range(by - ring + 1, by + ring):
+        yield (bx - ring, j)
+        yield (bx + ring, j)
@@ -66,13 +66,13 @@ class ResultTypes(Enum):
     The results of game actions, and their consequent effects on game state are
     enumerated by these catagories.
 
-    The elements of this enum are used as dictionary keys in dictionaries
-    returned from components responsible for processing in game actions and
-    consequences. The values in these dictionries store the data needed to
-    update the game state as a result.  In the main game loop, these
-    dictionaries are added to a stack (either player_turn_results or
-    enemy_turn_results) for processing.  Results are processed until the stack
-    is empty.
+    The elements of this enum are the types of the Result records returned
+    from components responsible for processing in game actions and
+    consequences.  The data of each Result stores what is needed to update the
+    game state as a result.  In the main game loop, these results are added to
+    a ResultQueue (either player_turn_results or enemy_turn_results) for
+    processing, higher values first.  Results are processed until the queue is
+    empty.
 
     Enum Elements:
     --------------
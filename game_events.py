@@ -1,13 +1,12 @@
 from messages import Message
+from turn_results import Result
 
 from game_objects.terrain import Water
 
 from etc.colors import COLORS
 from etc.enum import ResultTypes, Animations, Elements, EntityTypes, CursorTypes
-from utils.utils import (
-    coordinates_within_circle,
-    get_all_entities_of_type_within_radius,
-    get_all_entities_with_component_within_radius)
+from utils.geometry import disc_indices, entities_in_stencil
+from utils.utils import get_all_entities_with_component_within_radius
 
 
 def fireblast(game_map, center, *, radius=4, damage=6, user=None):
@@ -26,14 +25,14 @@ def fireblast(game_map, center, *, radius=4, damage=6, user=None):
     for entity in (x for x in harmable_within_radius if x != user):
         text = f"The {entity.name} is caught in a fireblast!"
         message = Message(text, COLORS.get('white'))
-        results.append({ResultTypes.DAMAGE: (
-                            entity, None, damage, [Elements.NONE]),
-                        ResultTypes.MESSAGE: message})
+        results.extend([
+            Result(ResultTypes.DAMAGE, (
+                entity, None, damage, [Elements.NONE])),
+            Result(ResultTypes.MESSAGE, message)])
     for entity in (x for x in burnable_within_radius if x != user):
         results.extend(entity.burnable.burn(game_map))
-    results.append({
-        ResultTypes.ANIMATION: (
-            Animations.FIREBLAST, center, radius)})
+    results.append(Result(ResultTypes.ANIMATION, (
+        Animations.FIREBLAST, center, radius)))
     return results
 
 
@@ -50,21 +49,22 @@ def waterblast(game_map, center, *, radius=4, damage=6, user=None):
     for entity in (x for x in harmable_within_radius if x != user):
         text = f"The {entity.name} is caught in a waterblast!"
         message = Message(text, COLORS.get('white'))
-        results.append({ResultTypes.DAMAGE: (
-                            entity, None, damage, [Elements.WATER]),
-                        ResultTypes.MESSAGE: message})
-    blast_coordinates = coordinates_within_circle(center, radius)
-    for coord in blast_coordinates:
-        if game_map.walkable[coord]:
-            entities = get_all_entities_of_type_within_radius(
-                coord, game_map, EntityTypes.TERRAIN, 0)
-            for entity in entities:
-                results.append({ResultTypes.REMOVE_ENTITY: entity})
-            water = Water.make(game_map, coord[0], coord[1])
-            results.append({ResultTypes.ADD_ENTITY: water})
-    results.append({
-        ResultTypes.ANIMATION: (
-            Animations.WATERBLAST, center, radius)})
+        results.extend([
+            Result(ResultTypes.DAMAGE, (
+                entity, None, damage, [Elements.WATER])),
+            Result(ResultTypes.MESSAGE, message)])
+    xs, ys = disc_indices(game_map, center, radius)
+    walkable = game_map.walkable[xs, ys]
+    xs, ys = xs[walkable], ys[walkable]
+    terrain = entities_in_stencil(
+        game_map, xs, ys, lambda e: e.entity_type == EntityTypes.TERRAIN)
+    for entity in terrain:
+        results.append(Result(ResultTypes.REMOVE_ENTITY, entity))
+    for x, y in zip(xs.tolist(), ys.tolist()):
+        water = Water.make(game_map, x, y)
+        results.append(Result(ResultTypes.ADD_ENTITY, water))
+    results.append(Result(ResultTypes.ANIMATION, (
+        Animations.WATERBLAST, center, radius)))
     return results
 
 
@@ -88,10 +88,8 @@ def use_staff(staff_usable, callback_cls, game_map, user):
     """
     if staff_usable.owner.consumable.uses > 0:
         callback = callback_cls(staff_usable, game_map, user)
-        return [{
-            ResultTypes.CURSOR_MODE: (
-                user.x, user.y, callback, CursorTypes.RAY)}]
+        return [Result(ResultTypes.CURSOR_MODE, (
+            user.x, user.y, callback, CursorTypes.RAY))]
     else:
         message = Message(f"Cannot use {staff_usable.owner.name} with zero charges.")
-        return [{
-            ResultTypes.MESSAGE: message}]
+        return [Result(ResultTypes.MESSAGE, message)]
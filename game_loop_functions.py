@@ -1,5 +1,3 @@
-import tdl
-
 from components.attacker import Attacker
 from components.burnable import AliveBurnable
 from components.defender import Defender
@@ -29,6 +27,7 @@ from utils.utils import (
 from entity import Entity
 from map import GameMap
 from messages import Message
+from turn_results import Result
 
 
 def create_map(map_console, *, floor_schedule):
@@ -115,8 +114,8 @@ def construct_inventory_data(game_state):
     return invetory_message, highlight_attr
 
 
-def get_user_input():
-    for event in tdl.event.get():
+def get_user_input(backend):
+    for event in backend.get_events():
         if event.type == 'KEYDOWN':
             user_input = event
             break
@@ -145,7 +144,8 @@ def process_selected_item(item, *,
             # Cannot throw weapons that are equipped.
             if item.equipable and item.equipable.equipped:
                 message = Message(f"Cannot throw equipped weapon {item.name}")
-                player_turn_results.append({ResultTypes.MESSAGE: message})
+                player_turn_results.append(
+                    Result(ResultTypes.MESSAGE, message))
                 return
             player_turn_results.extend(item.throwable.throw(game_map, player))
             player_turn_results.extend(item.consumable.consume())
@@ -185,9 +185,9 @@ def player_move_or_attack(move, *,
                 game_map, player, (destination_x, destination_y))
             player_turn_results.extend(callback_results)
         else:
-            player_turn_results.append({
-                ResultTypes.MOVE: (dx, dy),
-                ResultTypes.END_TURN: True})
+            player_turn_results.extend([
+                Result(ResultTypes.MOVE, (dx, dy)),
+                Result(ResultTypes.END_TURN, True)])
 
 
 def pickup_entity(game_map, player, player_turn_results):
@@ -199,8 +199,8 @@ def pickup_entity(game_map, player, player_turn_results):
             player_turn_results.extend(pickup_results)
             break
     else:
-        player_turn_results.append({
-            ResultTypes.MESSAGE: Message("There is nothing to pick up!")})
+        player_turn_results.append(Result(
+            ResultTypes.MESSAGE, Message("There is nothing to pick up!")))
 
 
 def encroach_on_all(encroacher, game_map):
@@ -220,7 +220,7 @@ def process_damage(game_map, result_data, turn_results):
         turn_results.extend(target.defender.transform(
             game_map, source, amount, elements))
     else:
-        turn_results.append({ResultTypes.HARM: result_data})
+        turn_results.append(Result(ResultTypes.HARM, result_data))
 
 
 def process_harm(game_map, result_data, turn_results, harmed_queue):
@@ -247,10 +247,9 @@ def entity_equip_armor(entity, armor, turn_results):
         raise AttributeError(
             "Non harmable entities cannot equip Armor")
     if entity.equipment.armor or armor.equipable.equipped:
-        turn_results.append({
-            ResultTypes.MESSAGE: Message(
-                f"{entity.name} cannot equip {armor.name}",
-                COLORS['white'])})
+        turn_results.append(Result(ResultTypes.MESSAGE, Message(
+            f"{entity.name} cannot equip {armor.name}",
+            COLORS['white'])))
     else:
         entity.equipment.armor = armor
         armor.equipable.equipped = True
@@ -258,10 +257,9 @@ def entity_equip_armor(entity, armor, turn_results):
             armor.equipable.damage_transformers)
         entity.defender.add_damage_callbacks(
             armor.equipable.damage_callbacks)
-        turn_results.append({
-            ResultTypes.MESSAGE: Message(
-                f"{entity.name} equipped {armor.name}",
-                COLORS['white'])})
+        turn_results.append(Result(ResultTypes.MESSAGE, Message(
+            f"{entity.name} equipped {armor.name}",
+            COLORS['white'])))
 
 
 def entity_equip_weapon(entity, weapon, turn_results):
@@ -269,10 +267,9 @@ def entity_equip_weapon(entity, weapon, turn_results):
         raise AttributeError(
             "Non harmable entities cannot equip Weapons")
     if entity.equipment.weapon or weapon.equipable.equipped:
-        turn_results.append({
-            ResultTypes.MESSAGE: Message(
-                f"{entity.name} cannot equip {weapon.name}",
-                COLORS['white'])})
+        turn_results.append(Result(ResultTypes.MESSAGE, Message(
+            f"{entity.name} cannot equip {weapon.name}",
+            COLORS['white'])))
     else:
         entity.equipment.weapon = weapon
         weapon.equipable.equipped = True
@@ -280,10 +277,9 @@ def entity_equip_weapon(entity, weapon, turn_results):
             weapon.equipable.damage_transformers)
         entity.attacker.target_callback = weapon.equipable.target_callback
         entity.attacker.move_callback = weapon.equipable.move_callback
-        turn_results.append({
-            ResultTypes.MESSAGE: Message(
-                f"{entity.name} equipped {weapon.name}",
-                COLORS['white'])})
+        turn_results.append(Result(ResultTypes.MESSAGE, Message(
+            f"{entity.name} equipped {weapon.name}",
+            COLORS['white'])))
 
 
 def entity_remove_armor(entity, armor, turn_results):
@@ -291,10 +287,9 @@ def entity_remove_armor(entity, armor, turn_results):
         raise AttributeError(
             "Non harmable entities cannot un-equip Armor")
     if not entity.equipment.armor or not armor.equipable.equipped:
-        turn_results.append({
-            ResultTypes.MESSAGE: Message(
-                f"{entity.name} cannot un-equip {armor.name}",
-                COLORS['white'])})
+        turn_results.append(Result(ResultTypes.MESSAGE, Message(
+            f"{entity.name} cannot un-equip {armor.name}",
+            COLORS['white'])))
     else:
         entity.equipment.armor = None
         armor.equipable.equipped = False
@@ -302,10 +297,9 @@ def entity_remove_armor(entity, armor, turn_results):
             armor.equipable.damage_transformers)
         entity.defender.remove_damage_callbacks(
             armor.equipable.damage_callbacks)
-        turn_results.append({
-            ResultTypes.MESSAGE: Message(
-                f"{entity.name} removed {armor.name}",
-                COLORS['white'])})
+        turn_results.append(Result(ResultTypes.MESSAGE, Message(
+            f"{entity.name} removed {armor.name}",
+            COLORS['white'])))
 
 
 def entity_remove_weapon(entity, weapon, turn_results):
@@ -313,10 +307,9 @@ def entity_remove_weapon(entity, weapon, turn_results):
         raise AttributeError(
             "Non harmable entities cannot un-equip Weapons")
     if not entity.equipment.weapon or not weapon.equipable.equipped:
-        turn_results.append({
-            ResultTypes.MESSAGE: Message(
-                f"{entity.name} cannot un-equip {weapon.name}",
-                COLORS['white'])})
+        turn_results.append(Result(ResultTypes.MESSAGE, Message(
+            f"{entity.name} cannot un-equip {weapon.name}",
+            COLORS['white'])))
     else:
         entity.equipment.weapon = None
         weapon.equipable.equipped = False
@@ -324,7 +317,6 @@ def entity_remove_weapon(entity, weapon, turn_results):
             weapon.equipable.damage_transformers)
         entity.attacker.target_callback = None
         entity.attacker.move_callback = None
-        turn_results.append({
-            ResultTypes.MESSAGE: Message(
-                f"{entity.name} un-equipped {weapon.name}",
-                COLORS['white'])})
\ No newline at end of file
+        turn_results.append(Result(ResultTypes.MESSAGE, Message(
+            f"{entity.name} un-equipped {weapon.name}",
+            COLORS['white'])))
\ No newline at end of file
@@ -9,6 +9,7 @@ from colors import (
 from etc.enum import Terrain, EntityTypes, RenderOrder
 from etc.colors import COLORS
 from etc.chars import CHARS
+from etc.game_config import NECROTIC_SOIL_DISSIPATE_N_FRAMES
 
 import components.burnable
 import components.encroachable
@@ -16,8 +17,7 @@ import components.encroachable
 from components.commitable import (
     TerrainCommitable, BlockingTerrainCommitable, UpwardStairsCommitable,
     DownwardStairsCommitable, WaterCommitable, IceCommitable, ShrubCommitable,
-    DoorCommitable, BaseCommitable)
-from components.dissipatable import NecroticSoilDissipatable
+    DoorCommitable, LingeringCommitable)
 from components.illuminatable import Illuminatable
 from components.shimmer import WaterShimmer, IceShimmer, FireShimmer
 
@@ -275,6 +275,6 @@ class NecroticSoil:
             visible_out_of_fov=True,
             entity_type=EntityTypes.TERRAIN,
             render_order=RenderOrder.TERRAIN,
-            commitable=BaseCommitable(),
-            dissipatable=NecroticSoilDissipatable(),
+            commitable=LingeringCommitable(
+                n_turns=NECROTIC_SOIL_DISSIPATE_N_FRAMES),
             encroachable=components.encroachable.NecroticSoilEncroachable())
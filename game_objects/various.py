@@ -7,10 +7,8 @@ from etc.enum import EntityTypes, RenderOrder
 from etc.game_config import STEAM_DISSAPATE_PROBABILTY, STEAM_SPREAD_PROBABILTY
 
 from components.commitable import BaseCommitable, FireCommitable, SteamCommitable
-from components.dissipatable import FireDissipatable, SteamDissipatable
 from components.illuminatable import Illuminatable
 from components.shimmer import FireShimmer, SteamShimmer
-from components.spreadable import FireSpreadable, SteamSpreadable
 
 
 class Fire:
@@ -18,7 +16,8 @@ class Fire:
 
     Fire entities can spread to neighbouring squares containing burnable
     material, or harm burnable anjacent entities.  It will also dissipate at a
-    fixed probability every turn.
+    fixed probability every turn.  The spreading and dissipation of all fires
+    is simulated on the map grid, see simulation.fire.
     """
     @staticmethod
     def make(game_map, x, y):
@@ -32,10 +31,8 @@ class Fire:
             entity_type=EntityTypes.FIRE,
             render_order=RenderOrder.TERRAIN,
             commitable=FireCommitable(),
-            dissipatable=FireDissipatable(),
             illuminatable=Illuminatable(radius=3),
-            shimmer=FireShimmer(),
-            spreadable=FireSpreadable())
+            shimmer=FireShimmer())
 
     def maybe_make(game_map, x, y, p):
         spawn = random.uniform(0, 1) < p 
@@ -50,7 +47,8 @@ class Steam:
 
     Steam entities can spread to all neighbouring squares, and harm entities in
     the same equare.  It will also dissipate at a probablity each turn that
-    increases with each spread.
+    increases with each spread.  The spreading and dissipation of all steam is
+    simulated on the map grid, see simulation.steam.
     """
     @staticmethod
     def make(game_map, x, y, 
@@ -65,7 +63,5 @@ class Steam:
             bg_color=bg_color,
             entity_type=EntityTypes.STEAM,
             render_order=RenderOrder.TERRAIN,
-            commitable=SteamCommitable(),
-            dissipatable=SteamDissipatable(p=p_dissipate),
-            shimmer=SteamShimmer(),
-            spreadable=SteamSpreadable(p=p_spread))
+            commitable=SteamCommitable(p_spread, p_dissipate),
+            shimmer=SteamShimmer())
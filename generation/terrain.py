@@ -94,6 +94,7 @@ def add_random_terrain(game_map, terrain_config):
     # generated, so we zero out the array first.
     game_map.terrain[:, :] = False
     game_map.water[:, :] = False
+    game_map.bump_version("water")
     for t in terrain:
         if t:
             t.commitable.commit(game_map)
@@ -355,6 +356,7 @@ class Pool(Growable):
     # Rename to make_one_tile
     def make(game_map, x, y):
         game_map.water[x, y] = True
+        game_map.bump_version("water")
         return Water.make(game_map, x, y)
 
     @staticmethod
@@ -477,6 +479,7 @@ class River:
     @staticmethod
     def make(game_map, x, y):
         game_map.water[x, y] = True
+        game_map.bump_version("water")
         return Water.make(game_map, x, y)
 
     def get_entities(self, game_map):
@@ -1,10 +1,17 @@
 import numpy as np
+from collections import Counter
 from itertools import product
-from random import randint, choice
 
-from tdl.map import Map
+try:
+    from tdl.map import Map
+except ImportError:
+    # tdl is only needed to draw to a window.
+    from utils.tcod_map import Map
 
 from entity_list import EntityList
+from pathfinding import (
+    RoutingMasks, FlowFields, DijkstraMapCache, OpenCells, Regions)
+from utils.geometry import disc_stencil
 from etc.colors import COLORS
 
 
@@ -25,8 +32,9 @@ class GameMap(Map):
     floor: DungeonFloor object
       The built out dungeon floor object to use in constructing the GameMap.
 
-    console: tdl.Console object
-      The console to draw the dungeon floor on.
+    console: Console object
+      The console to draw the dungeon floor on, created by a display
+      backend.
 
     Attributes on Parent
     --------------------
@@ -60,6 +68,17 @@ class GameMap(Map):
     steam: np.array of bool
       Does he tile currently contain steam?
 
+    steam_field: SteamField object
+      The spread and dissipation parameters, and the age, of the steam in
+      each tile.
+
+    timers: CountdownTimers object
+      The remaining lifetime of each lingering entity.
+
+    lights: LightMap object
+      The light sources on the map, and the number of them illuminating each
+      tile.
+
     blocked: np.array of bool
       Is there currently a blocking entity in this spot?
 
@@ -74,6 +93,35 @@ class GameMap(Map):
 
     chars: np.array of strings
       The character currently rendered in each tile.
+
+    dirty: DirtyTiles object
+      The tiles that need to be re-rendered on the next call to
+      update_and_draw_all.
+
+    previously_visible: np.array of bool
+      The tiles that were visible during the last render.  Used to find the
+      tiles that have entered or left the player's view.
+
+    routing_masks: RoutingMasks object
+      The cached routing masks of the map, see pathfinding.
+
+    flow_fields: FlowFields object
+      The distance fields towards the player for the current turn, used by
+      chasing monsters.
+
+    dijkstra_maps: DijkstraMapCache object
+      The recently used Dijkstra maps of radius seeking monsters.
+
+    open_cells: OpenCells object
+      An index of the open squares of the map, for picking random positions.
+
+    regions: Regions object
+      The connected regions of the map, for rejecting unreachable targets.
+
+    versions: Counter
+      A version number for each of the map arrays whose changes invalidate
+      cached computations, for example "transparent".  Code that writes to
+      one of these arrays bumps its version with bump_version.
     """
     def __init__(self, floor, console):
         width, height = floor.width, floor.height
@@ -92,40 +140,90 @@ class GameMap(Map):
         self.door = np.zeros((width, height), dtype=np.int8)
         self.shrub = np.zeros((width, height), dtype=np.int8)
         self.steam = np.zeros((width, height), dtype=np.int8)
+        self.steam_field = SteamField((width, height))
+        self.timers = CountdownTimers()
+        self.lights = LightMap((width, height))
         self.terrain = np.zeros((width, height), dtype=np.int8)
         self.blocked = np.zeros((width, height), dtype=np.int8)
         self.fg_colors = ColorArray((width, height))
         self.bg_colors = ColorArray((width, height))
         self.chars = np.full((width, height), ' ')
+        self.dirty = DirtyTiles((width, height))
+        self.previously_visible = np.zeros((width, height), dtype=bool)
+        self.versions = Counter()
+        self.routing_masks = RoutingMasks()
+        self.flow_fields = FlowFields()
+        self.dijkstra_maps = DijkstraMapCache()
+        self.open_cells = OpenCells()
+        self.regions = Regions()
+        # The inputs of the last fov computation, see update_fov.
+        self._fov_key = None
         # Write the floor layout to the map.
         self.floor = floor
         self.floor.commit_to_game_map(self)
 
+    def bump_version(self, name):
+        """Record that the map array with a given name has changed."""
+        self.versions[name] += 1
+
+    def update_fov(self, x, y, *, fov, radius, light_walls):
+        """Compute the fov from a position, unless the position, the fov
+        parameters, and the transparency of the map are all unchanged since
+        the last computation.
+        """
+        key = (x, y, fov, radius, light_walls, self.versions["transparent"])
+        if key == self._fov_key:
+            return
+        self.compute_fov(x, y, fov=fov, radius=radius, light_walls=light_walls)
+        self._fov_key = key
+
     def update_and_draw_all(self):
-        self.update_and_draw_floor_layout()
-        entities_in_render_order = sorted(
-            self.entities, key=lambda x: x.render_order.value)
-        for entity in entities_in_render_order:
-            self.update_and_draw_entity(entity)
-
-    def update_and_draw_floor_layout(self):
-        for x, y in self:
-            wall = self.is_wall(x, y)
-            if self.visible(x, y):
-                if wall:
-                    self.update_and_draw_char(
-                        x, y, ' ', fg=None, bg=COLORS.get('light_wall'))
-                else:
-                    self.update_and_draw_char(
-                        x, y, ' ', fg=None, bg=COLORS.get('light_ground'))
-                self.explored[x, y] = True
-            elif self.explored[x, y]:
-                if wall:
-                    self.update_and_draw_char(
-                        x, y, ' ', fg=None, bg=COLORS.get('dark_wall'))
-                else:
-                    self.update_and_draw_char(
-                        x, y, ' ', fg=None, bg=COLORS.get('dark_ground'))
+        """Update and draw all the tiles that have changed since the last
+        render.
+
+        Tiles entering or leaving the player's view are marked dirty here, all
+        other changes are marked as they happen.  When no tile is dirty, this
+        does nothing.
+        """
+        visible = self.fov | (self.illuminated != 0)
+        self.dirty.mark_mask(visible != self.previously_visible)
+        self.previously_visible = visible
+        if not self.dirty.any():
+            return
+        self.update_and_draw_floor_layout(visible, self.dirty.mask)
+        for position in self.dirty.occupied_positions(self.entities):
+            for entity in self.entities.get_entities_in_position(position):
+                self.update_and_draw_entity(entity)
+        self.dirty.clear()
+
+    def update_and_draw_floor_layout(self, visible, dirty):
+        """Update and draw the background of the dirty tiles of the floor.
+
+        The lit and dark masks are computed for the whole map at once, and
+        each mask is then written to the console as horizontal runs of a
+        single background color.
+        """
+        wall = ~(self.transparent | (self.shrub != 0) | (self.door != 0))
+        dark = ~visible & (self.explored != 0)
+        self.explored[visible] = True
+        self.update_and_draw_background(
+            dirty & visible & wall, COLORS.get('light_wall'))
+        self.update_and_draw_background(
+            dirty & visible & ~wall, COLORS.get('light_ground'))
+        self.update_and_draw_background(
+            dirty & dark & wall, COLORS.get('dark_wall'))
+        self.update_and_draw_background(
+            dirty & dark & ~wall, COLORS.get('dark_ground'))
+
+    def update_and_draw_background(self, mask, color):
+        """Blank out all tiles in a boolean mask and fill their background with
+        a single color.
+        """
+        self.fg_colors[mask] = None
+        self.bg_colors[mask] = color
+        self.chars[mask] = ' '
+        for x, y, length in horizontal_runs(mask):
+            self.console.draw_rect(x, y, length, 1, ' ', fg=None, bg=color)
 
     def update_and_draw_entity(self, entity):
         self.update_entity(entity)
@@ -146,11 +244,12 @@ class GameMap(Map):
 
     def draw_entity(self, entity):
         if self.visible(entity.x, entity.y):
-            self.draw_char(entity.x, entity.y, entity.char,
-                           fg=entity.fg_color, bg=entity.bg_color)
+            self.console.draw_char(entity.x, entity.y, entity.char,
+                                   fg=entity.fg_color, bg=entity.bg_color)
         elif (entity.visible_out_of_fov and entity.seen):
-            self.draw_char(entity.x, entity.y, entity.char,
-                           fg=entity.dark_fg_color, bg=entity.dark_bg_color)
+            self.console.draw_char(entity.x, entity.y, entity.char,
+                                   fg=entity.dark_fg_color,
+                                   bg=entity.dark_bg_color)
 
     def update_visual_arrays(self, x, y, char, fg=None, bg=None):
         self.fg_colors[x, y] = fg
@@ -158,16 +257,19 @@ class GameMap(Map):
         self.chars[x, y] = char
 
     def draw_char(self, x, y, char, fg=None, bg=None):
+        """Draw over a tile without updating the visual arrays.
+
+        This is used for transient drawing, i.e. animations, the cursor and
+        debug highlighting, so the tile is marked dirty to be restored on the
+        next render.
+        """
+        self.dirty.mark(x, y)
         self.console.draw_char(x, y, char, fg, bg)
 
     def remove_entity(self, entity):
         self.fg_colors[entity.x, entity.y] = None
         self.chars[entity.x, entity.y] = ' '
 
-    def draw_blank(self, x, y):
-        bg = self.bg_colors[x, y]
-        self.draw_char(x, y, ' ', fg=None, bg=bg)
-
     def highlight_position(self, x, y, color):
         char = self.chars[x, y]
         fg = self.fg_colors[x, y]
@@ -177,11 +279,7 @@ class GameMap(Map):
         char = self.chars[x, y]
         fg = self.fg_colors[x, y]
         bg = self.bg_colors[x, y]
-        self.draw_char(x, y, char, fg=fg, bg=bg)
-
-    def undraw_all(self):
-        for entity in self.entities:
-            self.draw_blank(entity.x, entity.y)
+        self.console.draw_char(x, y, char, fg, bg)
 
     def update_and_draw_char(self, x, y, char, fg=None, bg=None):
         self.update_visual_arrays(x, y, char, fg, bg)
@@ -190,6 +288,8 @@ class GameMap(Map):
     def make_transparent_and_walkable(self, x, y):
         self.walkable[x, y] = True
         self.transparent[x, y] = True
+        self.bump_version("walkable")
+        self.bump_version("transparent")
 
     def within_bounds(self, x, y, buffer=0):
         return (
@@ -205,32 +305,254 @@ class GameMap(Map):
                     and not self.transparent[x, y])
 
     def find_random_open_position(self):
-        while True:
-            x = randint(0, self.width - 1)
-            y = randint(0, self.height - 1)
-            if self.walkable[x, y] and not self.blocked[x, y]:
-                return x, y
+        return self.open_cells.random_position(self)
+
+
+class DirtyTiles:
+    """Tracks the tiles of the map that need to be re-rendered.
+
+    Tiles are marked dirty when something changes how they should be drawn:
+    an entity moves into or out of the tile, an entity is committed to or
+    deleted from the tile, the tile enters or leaves the player's view, or
+    the tile is drawn over by an animation or cursor.  The renderer then
+    pushes only the dirty tiles to the console and clears the tracker.
+
+    Attributes
+    ----------
+    mask: np.array of bool
+      Is the tile dirty?
+    """
+    def __init__(self, shape):
+        # Everything needs to be drawn on the first render.
+        self.mask = np.ones(shape, dtype=bool)
+        self.marked = True
+
+    def mark(self, x, y):
+        self.mask[x, y] = True
+        self.marked = True
+
+    def mark_mask(self, mask):
+        if mask.any():
+            self.mask |= mask
+            self.marked = True
+
+    def mark_all(self):
+        self.mask[:, :] = True
+        self.marked = True
+
+    def any(self):
+        return self.marked
+
+    def occupied_positions(self, entities):
+        """Get the dirty positions holding at least one entity."""
+        xs, ys = np.nonzero(self.mask & (entities.occupancy > 0))
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def clear(self):
+        self.mask[:, :] = False
+        self.marked = False
+
+
+class SteamField:
+    """Per tile state of the steam on the map, kept alongside the
+    game_map.steam array.
+
+    Steam is simulated on the whole grid at once (see simulation.steam), the
+    steam entities are only used to draw the steam.
+
+    Attributes
+    ----------
+    p_spread: np.array of float
+      The probability that the steam in the tile spreads to each neighbour.
+
+    p_dissipate: np.array of float
+      The probability that the steam in the tile dissipates, once it has
+      lingered.
+
+    age: np.array of int
+      The number of turns the steam in the tile has lingered.
+    """
+    def __init__(self, shape):
+        self.p_spread = np.zeros(shape, dtype=float)
+        self.p_dissipate = np.zeros(shape, dtype=float)
+        self.age = np.zeros(shape, dtype=np.int16)
+
+    def add(self, x, y, p_spread, p_dissipate):
+        self.p_spread[x, y] = p_spread
+        self.p_dissipate[x, y] = p_dissipate
+        self.age[x, y] = 0
+
+    def remove(self, x, y):
+        self.p_spread[x, y] = 0
+        self.p_dissipate[x, y] = 0
+        self.age[x, y] = 0
+
+
+class CountdownTimers:
+    """The remaining lifetimes of lingering entities, one timer per entity.
+
+    The timers are held in slots of a flat array, so all the timers on the
+    map are counted down together once per turn, and the entities whose
+    timer has run out are reported as expired.  Slots are reused once their
+    timer is cleared, and the array grows when all of them are in use.
+
+    Attributes
+    ----------
+    remaining: np.array of int
+      The number of turns left before the timer in each slot expires, or -1
+      if the slot is unused.
+
+    entities: List[Entity or None]
+      The entity timed by each slot.
+
+    slots: Dict[Entity, int]
+      The slot holding the timer of each entity.
+    """
+    def __init__(self, capacity=64):
+        self.remaining = np.full(capacity, -1, dtype=np.int16)
+        self.entities = [None] * capacity
+        self.slots = {}
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def set(self, entity, n_turns):
+        slot = self.slots.get(entity)
+        if slot is None:
+            if not self.free:
+                self._grow()
+            slot = self.free.pop()
+            self.slots[entity] = slot
+            self.entities[slot] = entity
+        self.remaining[slot] = n_turns
+
+    def clear(self, entity):
+        slot = self.slots.pop(entity, None)
+        if slot is not None:
+            self.remaining[slot] = -1
+            self.entities[slot] = None
+            self.free.append(slot)
+
+    def tick(self):
+        """Count down all the timers.
+
+        Returns
+        -------
+        expired: List[Entity]
+          The entities whose timer has run out.  Their timer stays at zero
+          until it is cleared.
+        """
+        expired = np.flatnonzero(self.remaining == 0)
+        self.remaining[self.remaining > 0] -= 1
+        return [self.entities[slot] for slot in expired.tolist()]
+
+    def _grow(self):
+        capacity = len(self.remaining)
+        self.remaining = np.concatenate(
+            [self.remaining, np.full(capacity, -1, dtype=np.int16)])
+        self.entities.extend([None] * capacity)
+        self.free.extend(range(2*capacity - 1, capacity - 1, -1))
+
+
+class LightMap:
+    """The light sources on the map, composited into the number of sources
+    illuminating each tile.
+
+    The contribution of each source is a cached stencil, which is added to or
+    subtracted from the counts only when a source is added or removed.  A
+    source that moves is removed and added again.
+
+    Attributes
+    ----------
+    counts: np.array of int
+      The number of light sources illuminating each tile.
+
+    sources: Dict[object, (int, int, int)]
+      The (x, y, radius) of each light source.
+    """
+    def __init__(self, shape):
+        self.counts = np.zeros(shape, dtype=np.int16)
+        self.sources = {}
+
+    def add(self, source, x, y, radius):
+        self.sources[source] = (x, y, radius)
+        self._stamp(x, y, radius, 1)
+
+    def remove(self, source):
+        x, y, radius = self.sources.pop(source)
+        self._stamp(x, y, radius, -1)
+
+    def _stamp(self, x, y, radius, delta):
+        stencil = disc_stencil(radius)
+        reach = stencil.shape[0] // 2
+        width, height = self.counts.shape
+        x0, x1 = max(x - reach, 0), min(x + reach + 1, width)
+        y0, y1 = max(y - reach, 0), min(y + reach + 1, height)
+        self.counts[x0:x1, y0:y1] += delta * stencil[
+            x0 - (x - reach):x1 - (x - reach),
+            y0 - (y - reach):y1 - (y - reach)]
+
+
+def horizontal_runs(mask):
+    """Decompose a boolean array into maximal horizontal runs of True values.
+
+    Parameters
+    ----------
+    mask: np.array of bool, shape (width, height)
+
+    Returns
+    -------
+    runs: Iterable[(int, int, int)]
+      The (x, y, length) of each run.
+    """
+    # Pad each row with a False on either end, so that every run has both a
+    # rising and a falling edge.
+    rows = np.zeros((mask.shape[1], mask.shape[0] + 2), dtype=np.int8)
+    rows[:, 1:-1] = mask.T
+    edges = np.diff(rows, axis=1)
+    start_ys, start_xs = np.nonzero(edges == 1)
+    _, end_xs = np.nonzero(edges == -1)
+    return zip(
+        start_xs.tolist(), start_ys.tolist(), (end_xs - start_xs).tolist())
 
 
 class ColorArray:
-    """A two by two array of RGB tuples."""
+    """A two dimensional array of RGB tuples, each of which may be unset.
+
+    Colors are stored as a (width, height, 3) array of uint8, along with a
+    boolean mask recording which tiles hold a color.
+
+    Indexing with a single (x, y) position returns an RGB tuple, or None if
+    the tile holds no color.  Any other index (a boolean mask or slices) is
+    used for bulk reads and writes, in which case the value may be a single
+    RGB tuple, an array of RGB values, or None to unset the colors.
+
+    Attributes
+    ----------
+    rgb: np.array of uint8, shape (width, height, 3)
+      The color of each tile.
+
+    valid: np.array of bool, shape (width, height)
+      Does the tile hold a color?
+    """
     def __init__(self, shape):
-        # This needs to be an array of floating points so that we
-        # can store NaNs.
-        self.a = np.zeros((shape[0], shape[1], 3))
+        self.rgb = np.zeros((shape[0], shape[1], 3), dtype=np.uint8)
+        # Tiles start out black.
+        self.valid = np.ones((shape[0], shape[1]), dtype=bool)
 
     def __getitem__(self, idxs):
-        if len(idxs) == 2:
-            colors = self.a[idxs[0], idxs[1], :]
-            if np.all(np.isnan(colors)):
+        if type(idxs) is tuple and len(idxs) == 2 and _is_position(idxs):
+            if not self.valid[idxs]:
                 return None
-            else:
-                return tuple(colors.astype(int))
+            return tuple(self.rgb[idxs].tolist())
         else:
-            return self.a[idxs]
+            return self.rgb[idxs]
 
     def __setitem__(self, idxs, value):
-        if len(idxs) == 2:
-            self.a[idxs[0], idxs[1], :] = value
+        if value is None:
+            self.valid[idxs] = False
         else:
-            self.a[idxs] = value
+            self.rgb[idxs] = value
+            self.valid[idxs] = True
+
+
+def _is_position(idxs):
+    return all(isinstance(i, (int, np.integer)) for i in idxs)
@@ -1,11 +1,11 @@
-import tdl
 import textwrap
 import string
 
 from etc.colors import COLORS
 
 
-def menu(header, options, width, screen_width, screen_height, colors):
+def menu(header, options, width, screen_width, screen_height, colors,
+         backend):
     """Draw a generic menu with a header and options for selection.
 
     Arguments
@@ -29,9 +29,12 @@ def menu(header, options, width, screen_width, screen_height, colors):
       Colors to draw the description of the item.  Used to grey out items that
       are not selectable though the currently displayed menu.
 
+    backend: Display backend object
+      The backend used to create the console holding the menu.
+
     Returns
     -------
-    (window, x_position, y_position): tdl.Console, int, int:
+    (window, x_position, y_position): Console, int, int:
       The console contining the window, and the position to blit the console
       onto the main console.
     """
@@ -46,7 +49,7 @@ def menu(header, options, width, screen_width, screen_height, colors):
     header_buffer, border_buffer, edge_buffer = 1, 2, 2
     height = len(options) + header_height + header_buffer + 2*border_buffer
     
-    window = tdl.Console(width, height)
+    window = backend.make_console(width, height)
     # Draw background and display frame.
     window.draw_rect(0, 0, width, height, None, fg=COLORS['white'], bg=None)
     window.draw_frame(0, 0, width, height, '~', fg=None, bg=COLORS['darker_red'])
@@ -65,7 +68,8 @@ def menu(header, options, width, screen_width, screen_height, colors):
 
 
 def invetory_menu(header, inventory, inventory_width, 
-                  screen_width, screen_height, highlight_attr=None):
+                  screen_width, screen_height, highlight_attr=None,
+                  backend=None):
     if len(inventory.items) == 0:
         options = ['Invetory is Empty']
         highlight = [COLORS['white']]
@@ -79,7 +83,8 @@ def invetory_menu(header, inventory, inventory_width,
         else:
             highlight = [COLORS['white'] for item in inventory.items]
     return menu(header, options, inventory_width,
-                screen_width, screen_height, colors=highlight)
+                screen_width, screen_height, colors=highlight,
+                backend=backend)
 
 def make_inventory_options(inventory):
     options = []
@@ -1,8 +1,12 @@
+import random
+from collections import OrderedDict
+
+import numpy as np
 import tcod
-from dijkstra_map.dijkstra_map import DijkstraMap
 
 from etc.enum import RoutingOptions
 from utils.debug import draw_dijkstra_map
+from utils.geometry import ADJACENT_DX, ADJACENT_DY, adjacent_indices
 
 
 def get_shortest_path(game_map, source, target, routing_avoid=None):
@@ -26,8 +30,14 @@ def get_shortest_path(game_map, source, target, routing_avoid=None):
     -------
     path: List[(int, int)]
       The path shortest path through the game map from source to target while
-      avoiding the dungeon features in routing_avoid.
+      avoiding the dungeon features in routing_avoid.  Empty if the target
+      cannot be reached.
     """
+    # Targets in a different region of the map can never be reached, so
+    # don't bother searching for them.
+    if not game_map.regions.connected(
+        game_map, source, target, routing_avoid=routing_avoid):
+        return []
     walkable = make_walkable_array(game_map, routing_avoid=routing_avoid) 
     # The cell the the source and target occupy needs to manually be set to
     # walkable, else the entity will be frozen in place.
@@ -41,7 +51,28 @@ def get_path_to_radius_of_target(game_map, source, target, radius,
                                  routing_avoid=None):
     """Return the shortest path through a game map from a source to any square
     a fixed radius from a target.
+
+    The Dijkstra map towards the target is shared between all the entities
+    seeking the same target with the same routing profile (see
+    DijkstraMapCache).  The shared map does not account for the positions of
+    monsters, so if the next step of the shared path is blocked by a monster,
+    or the source is on a square the profile avoids, the path is searched
+    for from scratch instead.
     """
+    if not routing_avoid:
+        routing_avoid = []
+    static_avoid = [
+        option for option in routing_avoid
+        if option != RoutingOptions.AVOID_MONSTERS]
+    static_walkable = game_map.routing_masks.get(game_map, static_avoid)
+    if static_walkable[source[0], source[1]]:
+        dm = game_map.dijkstra_maps.get(game_map, target, radius, static_avoid)
+        path = dm.get_descent_path(source)
+        if (len(path) <= 1
+            or RoutingOptions.AVOID_MONSTERS not in routing_avoid
+            or not game_map.blocked[path[1][0], path[1][1]]):
+            return path
+    from dijkstra_map.dijkstra_map import DijkstraMap
     walkable = make_walkable_array(game_map, routing_avoid=routing_avoid) 
     walkable[source[0], source[1]] = True
     walkable[target[0], target[1]] = True
@@ -54,6 +85,10 @@ def make_walkable_array(game_map, routing_avoid=None):
     """Return a boolean array indicating which squares are accable to be routed
     through for some entity.
 
+    The static part of the array is cached per routing_avoid profile in
+    game_map.routing_masks, the positions of monsters are applied on top.
+    The returned array is a fresh copy, so callers are free to modify it.
+
     Parameters
     ----------
     game_map: GameMap object
@@ -63,25 +98,465 @@ def make_walkable_array(game_map, routing_avoid=None):
 
     Returns
     -------
-    valid_to_route: np.array or bool
-      A boolean array indicating which squares are valid to route through.
+    valid_to_route: np.array of int8
+      An array indicating which squares are valid to route through.
     """
     if not routing_avoid:
         routing_avoid = []
-    walkable = game_map.walkable.copy()
-    if RoutingOptions.AVOID_DOORS in routing_avoid:
-        walkable = walkable * (1 - game_map.door)
+    walkable = game_map.routing_masks.get(game_map, routing_avoid)
     if RoutingOptions.AVOID_MONSTERS in routing_avoid:
-        walkable = walkable * (1 - game_map.blocked)
-    if RoutingOptions.AVOID_WATER in routing_avoid:
-        walkable = walkable * (1 - game_map.water)
-    if RoutingOptions.AVOID_FIRE in routing_avoid:
-        walkable = walkable * (1 - game_map.fire)
-    if RoutingOptions.AVOID_STEAM in routing_avoid:
-        walkable = walkable * (1 - game_map.steam)
-    if RoutingOptions.AVOID_STAIRS in routing_avoid:
-        if game_map.upward_stairs_position:
-            walkable[game_map.upward_stairs_position] = False
-        if game_map.downward_stairs_position:
-            walkable[game_map.downward_stairs_position] = False
-    return walkable
+        walkable = walkable & (game_map.blocked == 0)
+    return walkable.astype(np.int8)
+
+
+# The map layer avoided by each routing option.
+AVOIDED_LAYERS = {
+    RoutingOptions.AVOID_DOORS: "door",
+    RoutingOptions.AVOID_WATER: "water",
+    RoutingOptions.AVOID_FIRE: "fire",
+    RoutingOptions.AVOID_STEAM: "steam",
+}
+
+
+def routing_layers(profile):
+    """Get the names of the map layers the routing mask of a profile is built
+    from.
+    """
+    return ["walkable"] + [
+        layer for option, layer in AVOIDED_LAYERS.items() if option in profile]
+
+
+class RoutingMasks:
+    """A cache of the static routing masks of a game map, one for each
+    routing_avoid profile.
+
+    A profile's mask combines the walkable array with the layers the profile
+    avoids (see routing_layers).  It is rebuilt only when the version of one
+    of those layers (see GameMap.bump_version) has changed, so all the
+    monsters sharing a profile share a single mask.  Monster positions change
+    every turn, so they are not part of the cached mask.
+
+    Attributes
+    ----------
+    masks: Dict[frozenset of RoutingOptions, (tuple, np.array of bool)]
+      The layer versions each mask was built from, and the mask.
+    """
+    def __init__(self):
+        self.masks = {}
+
+    def version(self, game_map, routing_avoid):
+        """Get a key that changes whenever the static routing mask of a
+        profile does.
+        """
+        return self._versions(game_map, frozenset(routing_avoid))
+
+    def get(self, game_map, routing_avoid):
+        """Get the (read only) static routing mask for a profile."""
+        profile = frozenset(routing_avoid)
+        versions = self._versions(game_map, profile)
+        cached = self.masks.get(profile)
+        if cached is None or cached[0] != versions:
+            cached = (versions, self._build(game_map, profile))
+            self.masks[profile] = cached
+        return cached[1]
+
+    @staticmethod
+    def _versions(game_map, profile):
+        versions = tuple(
+            game_map.versions[layer] for layer in routing_layers(profile))
+        if RoutingOptions.AVOID_STAIRS in profile:
+            versions += (game_map.upward_stairs_position,
+                         game_map.downward_stairs_position)
+        return versions
+
+    @staticmethod
+    def _build(game_map, profile):
+        mask = game_map.walkable != 0
+        for option, layer in AVOIDED_LAYERS.items():
+            if option in profile:
+                mask &= getattr(game_map, layer) == 0
+        if RoutingOptions.AVOID_STAIRS in profile:
+            if game_map.upward_stairs_position:
+                mask[game_map.upward_stairs_position] = False
+            if game_map.downward_stairs_position:
+                mask[game_map.downward_stairs_position] = False
+        mask.setflags(write=False)
+        return mask
+
+
+# The number of blocked squares drawn before giving up on random draws.
+MAX_REJECTIONS = 8
+
+
+class OpenCells:
+    """An index of the open squares of a game map, one for each routing_avoid
+    profile, used to pick random positions.
+
+    The index of a profile is a flat array of the squares open in its static
+    routing mask (see RoutingMasks), and is rebuilt along with that mask.
+    Drawing a random open square is then a single draw from the index.  The
+    squares blocked by monsters are rejected at draw time, they are a small
+    fraction of the open squares.
+
+    Attributes
+    ----------
+    indices: Dict[frozenset of RoutingOptions, (tuple, np.array of int)]
+      The mask version each index was built from, and the flat indices of
+      the open squares.
+    """
+    def __init__(self):
+        self.indices = {}
+
+    def get(self, game_map, routing_avoid):
+        """Get the flat indices of the open squares for a profile."""
+        profile = frozenset(routing_avoid)
+        version = game_map.routing_masks.version(game_map, profile)
+        cached = self.indices.get(profile)
+        if cached is None or cached[0] != version:
+            mask = game_map.routing_masks.get(game_map, profile)
+            cached = (version, np.flatnonzero(mask))
+            self.indices[profile] = cached
+        return cached[1]
+
+    def random_position(self, game_map, routing_avoid=None,
+                        avoid_monsters=True, reachable_from=None):
+        """Pick a random open square of the map.
+
+        Parameters
+        ----------
+        game_map: GameMap object
+
+        routing_avoid: List of RoutingOptions
+          The square types that do not count as open.
+
+        avoid_monsters: bool
+          Should squares blocked by a monster be rejected?
+
+        reachable_from: (int, int)
+          If supplied, only squares in the same region as this square (see
+          Regions) are picked.
+
+        Returns
+        -------
+        position: (int, int) or None
+          The square, or None if there are no open squares.
+        """
+        if not routing_avoid:
+            routing_avoid = []
+        if reachable_from is None:
+            indices = self.get(game_map, routing_avoid)
+        else:
+            indices = game_map.regions.reachable_indices(
+                game_map, reachable_from, routing_avoid)
+        if len(indices) == 0:
+            return None
+        shape = (game_map.width, game_map.height)
+        for _ in range(MAX_REJECTIONS):
+            idx = indices[random.randrange(len(indices))]
+            x, y = np.unravel_index(idx, shape)
+            if not avoid_monsters or not game_map.blocked[x, y]:
+                return int(x), int(y)
+        # Crowded, pick from the squares that are actually free.
+        indices = indices[game_map.blocked.ravel()[indices] == 0]
+        if len(indices) == 0:
+            return None
+        x, y = np.unravel_index(random.choice(indices.tolist()), shape)
+        return int(x), int(y)
+
+
+def label_regions(walkable):
+    """Label the connected regions of the walkable squares of a map, moving
+    between squares in all eight directions.
+
+    Each row of the map is split into runs of consecutive walkable squares,
+    and the runs touching each other in neighbouring rows (diagonals
+    included) are merged with a union-find.  There are far fewer runs than
+    squares, so this only loops over the runs in python.
+
+    Parameters
+    ----------
+    walkable: np.array
+      Non-zero for the squares that can be routed through.
+
+    Returns
+    -------
+    labels: np.array of int32
+      The label of the region each square is in, numbered from one, or zero
+      for squares that are not walkable.
+    """
+    # Work on the transpose, so the rows of the map are contiguous.
+    open_squares = (walkable != 0).T
+    starts = open_squares.copy()
+    starts[:, 1:] &= ~open_squares[:, :-1]
+    ends = open_squares.copy()
+    ends[:, :-1] &= ~open_squares[:, 1:]
+    run_ys, run_x0s = np.nonzero(starts)
+    _, run_x1s = np.nonzero(ends)
+    run_x0s, run_x1s = run_x0s.tolist(), run_x1s.tolist()
+    row_bounds = np.searchsorted(
+        run_ys, np.arange(open_squares.shape[0] + 1)).tolist()
+
+    parents = list(range(len(run_x0s)))
+    def find(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for y in range(open_squares.shape[0] - 1):
+        # Walk along the runs of this row and the next in step, merging the
+        # pairs that touch.
+        i, i_end = row_bounds[y], row_bounds[y + 1]
+        j, j_end = row_bounds[y + 1], row_bounds[y + 2]
+        while i < i_end and j < j_end:
+            if (run_x0s[i] <= run_x1s[j] + 1
+                and run_x0s[j] <= run_x1s[i] + 1):
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parents[root_j] = root_i
+            if run_x1s[i] < run_x1s[j]:
+                i += 1
+            else:
+                j += 1
+
+    roots = np.array([find(i) for i in range(len(parents))], dtype=np.int32)
+    _, run_labels = np.unique(roots, return_inverse=True)
+    # Every open square belongs to the run most recently started before it.
+    run_of_square = np.cumsum(starts.ravel()).reshape(starts.shape) - 1
+    labels = np.zeros(open_squares.shape, dtype=np.int32)
+    labels[open_squares] = run_labels.reshape(-1)[
+        run_of_square[open_squares]] + 1
+    return np.ascontiguousarray(labels.T)
+
+
+class Regions:
+    """The connected regions of the static routing masks of a game map, one
+    labelling for each routing_avoid profile.
+
+    Two squares in different regions can never be routed between, so
+    unreachable targets are rejected without a search.  The positions of
+    monsters are not accounted for: they only ever make squares harder to
+    reach.
+
+    A labelling only depends on the layers its profile reads (see
+    routing_layers), so it is checked only when one of their versions has
+    changed.  Even then, it is only rebuilt if the profile's routing mask
+    actually differs from the mask that was labelled.
+
+    A square that is not open itself (an entity may be standing in water it
+    avoids, say) belongs to the regions of its open neighbours, since paths
+    are always allowed to start and end on their source and target.
+
+    Attributes
+    ----------
+    labels: Dict[frozenset of RoutingOptions, (tuple, np.array, np.array)]
+      The layer versions each labelling was last checked against, the mask
+      that was labelled, and the labelling.
+
+    indices: Dict[(frozenset of RoutingOptions, frozenset of int), np.array]
+      The flat indices of the squares in some regions, for picking random
+      positions in them.
+    """
+    def __init__(self):
+        self.labels = {}
+        self.indices = {}
+
+    def get(self, game_map, routing_avoid):
+        """Get the region labels of the squares of the map for a profile."""
+        profile = frozenset(routing_avoid)
+        version = game_map.routing_masks.version(game_map, profile)
+        cached = self.labels.get(profile)
+        if cached is None or cached[0] != version:
+            mask = game_map.routing_masks.get(game_map, profile)
+            if cached is not None and np.array_equal(mask, cached[1]):
+                cached = (version, cached[1], cached[2])
+            else:
+                cached = (version, mask, label_regions(mask))
+                self.indices = {
+                    key: idxs for key, idxs in self.indices.items()
+                    if key[0] != profile}
+            self.labels[profile] = cached
+        return cached[2]
+
+    def regions_of(self, game_map, position, routing_avoid=None):
+        """Get the labels of the regions a square belongs to."""
+        labels = self.get(game_map, routing_avoid or [])
+        x, y = position
+        if labels[x, y]:
+            return frozenset([int(labels[x, y])])
+        xs, ys = adjacent_indices(game_map, position)
+        return frozenset(labels[xs, ys].tolist()) - {0}
+
+    def connected(self, game_map, source, target, routing_avoid=None):
+        """Could a path possibly be found between two squares?"""
+        if max(abs(source[0] - target[0]), abs(source[1] - target[1])) <= 1:
+            return True
+        return bool(self.regions_of(game_map, source, routing_avoid)
+                    & self.regions_of(game_map, target, routing_avoid))
+
+    def reachable_indices(self, game_map, position, routing_avoid=None):
+        """Get the flat indices of the open squares reachable from a square."""
+        profile = frozenset(routing_avoid or [])
+        regions = self.regions_of(game_map, position, profile)
+        key = (profile, regions)
+        if key not in self.indices:
+            labels = self.get(game_map, profile)
+            self.indices[key] = np.flatnonzero(np.isin(labels, list(regions)))
+        return self.indices[key]
+
+
+# The distance recorded for squares that cannot be reached.
+UNREACHABLE = np.iinfo(np.int32).max
+
+
+def make_distance_field(walkable, root):
+    """Compute the number of steps from a root square to every square of the
+    map, moving through walkable squares in all eight directions.
+
+    The search is a breadth first search run on the whole map at once: each
+    step grows the frontier into its unvisited walkable neighbours.
+
+    Parameters
+    ----------
+    walkable: np.array
+      Non-zero for the squares that can be routed through.
+
+    root: (int, int)
+      The square the distances are measured from.  It is always treated as
+      walkable.
+
+    Returns
+    -------
+    distances: np.array of int32
+      The number of steps from the root, or UNREACHABLE.
+    """
+    distances = np.full(walkable.shape, UNREACHABLE, dtype=np.int32)
+    unvisited = walkable != 0
+    frontier = np.zeros(walkable.shape, dtype=bool)
+    frontier[root] = True
+    unvisited[root] = False
+    distances[root] = 0
+    steps = 0
+    while frontier.any():
+        steps += 1
+        # Grow the frontier into its 3 by 3 neighbourhood.
+        grown = frontier.copy()
+        grown[1:, :] |= frontier[:-1, :]
+        grown[:-1, :] |= frontier[1:, :]
+        spread = grown.copy()
+        spread[:, 1:] |= grown[:, :-1]
+        spread[:, :-1] |= grown[:, 1:]
+        frontier = spread & unvisited
+        distances[frontier] = steps
+        unvisited &= ~frontier
+    return distances
+
+
+class FlowFields:
+    """Distance fields rooted at a single target (the player), shared by all
+    the entities chasing it.
+
+    There is one field for each routing_avoid profile, built on the profile's
+    static routing mask.  A field is built the first time it is needed after
+    the fields are reset, which happens once per turn, so a whole pack of
+    chasers costs a single map wide search per profile.  Each chaser then
+    reads its next step from the field by looking at its neighbours.
+
+    Monsters move during the turn, so their positions are not part of the
+    fields.  Instead, chasers that avoid monsters skip the neighbours that are
+    blocked at the time they step.
+
+    Attributes
+    ----------
+    root: (int, int) or None
+      The position of the target of the fields.
+
+    fields: Dict[frozenset of RoutingOptions, np.array of int32]
+      The distance field of each profile, built so far this turn.
+    """
+    def __init__(self):
+        self.root = None
+        self.fields = {}
+
+    def reset(self, root):
+        """Discard all the fields, and root new ones at a position."""
+        self.root = root
+        self.fields = {}
+
+    def next_step(self, game_map, source, routing_avoid=None):
+        """Get the next square on a shortest path from a source to the root.
+
+        If the source avoids monsters, the step is the nearest neighbour to
+        the root that is not currently blocked, as long as it is nearer to
+        the root than the source.  Returns None if the source is adjacent to
+        the root, or there is no such step.
+        """
+        profile = frozenset(routing_avoid) if routing_avoid else frozenset()
+        avoid_monsters = RoutingOptions.AVOID_MONSTERS in profile
+        profile = profile - {RoutingOptions.AVOID_MONSTERS}
+        distances = self.fields.get(profile)
+        if distances is None:
+            walkable = game_map.routing_masks.get(game_map, profile)
+            distances = make_distance_field(walkable, self.root)
+            self.fields[profile] = distances
+        x, y = source
+        width, height = distances.shape
+        best, best_distance = None, distances[x, y]
+        for dx, dy in zip(ADJACENT_DX.tolist(), ADJACENT_DY.tolist()):
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height
+                    and distances[nx, ny] < best_distance):
+                continue
+            # The root is never skipped, as it is blocked by the target.
+            if (avoid_monsters and distances[nx, ny] != 0
+                and game_map.blocked[nx, ny]):
+                continue
+            best, best_distance = (nx, ny), distances[nx, ny]
+        if best is None or best_distance == 0:
+            return None
+        return best
+
+
+# The number of Dijkstra maps kept in each map's cache.
+DIJKSTRA_CACHE_SIZE = 16
+
+
+class DijkstraMapCache:
+    """A least recently used cache of Dijkstra maps towards the squares within
+    a radius of a target, shared by all the entities seeking that target.
+
+    Maps are keyed on the target position, the radius, and the routing
+    profile along with its routing mask version, so a map is reused for as
+    long as the target stays put and the map layers the profile avoids are
+    unchanged.  Monster positions are not part of the maps.
+
+    dijkstra_map is only imported when a map is first built, so the rest of
+    the routing can be used without it.
+
+    Attributes
+    ----------
+    maps: OrderedDict
+      The cached Dijkstra maps, least recently used first.
+    """
+    def __init__(self, maxsize=DIJKSTRA_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.maps = OrderedDict()
+
+    def get(self, game_map, target, radius, routing_avoid):
+        profile = frozenset(routing_avoid)
+        key = (tuple(target), radius, profile,
+               game_map.routing_masks.version(game_map, profile))
+        dm = self.maps.get(key)
+        if dm is not None:
+            self.maps.move_to_end(key)
+            return dm
+        from dijkstra_map.dijkstra_map import DijkstraMap
+        walkable = make_walkable_array(game_map, routing_avoid=profile)
+        walkable[target[0], target[1]] = True
+        dm = DijkstraMap(walkable)
+        dm.set_square_sources(target, radius)
+        dm.build()
+        self.maps[key] = dm
+        if len(self.maps) > self.maxsize:
+            self.maps.popitem(last=False)
+        return dm
@@ -0,0 +1,370 @@
+"""
+Handlers for turn results.
+
+Each type of turn result is processed by a handler function with signature
+
+    handler(context, results, data)
+
+where context is the TurnContext of the game loop, results is the ResultQueue
+the result was popped from (any consequent results are pushed back onto this
+queue), and data is the data attached to the result.  A handler returns True
+if processing of the queue should stop after the result, for example, to play
+an animation before the remaining results are processed.
+
+The player and enemy phases of a turn process different sets of result
+types, so each phase has its own dispatch table, but a result type handled in
+both phases is handled by the same function.
+"""
+from collections import defaultdict
+from time import perf_counter
+
+from animations.animations import construct_animation
+
+from components.status_manager import (
+    PlayerConfusedManager, EnemyConfusedManager,
+    EnemyFrozenManager, SpeedManager)
+
+from etc.enum import ResultTypes, GameStates
+
+from cursor import Cursor
+from death_functions import kill_monster, kill_player, make_corpse
+from game_loop_functions import (
+    encroach_on_all, process_damage, process_harm, apply_status,
+    entity_equip_armor, entity_equip_weapon, entity_remove_armor,
+    entity_remove_weapon)
+from turn_results import Result
+
+
+class TurnContext:
+    """The state of the game loop that is read and modified while processing
+    turn results.
+
+    Attributes
+    ----------
+    game_map: GameMap object
+      The map of the current floor.
+
+    player: Entity object
+      The player.
+
+    message_log: MessageLog object
+      The log of game messages.
+
+    harmed_queue: deque of Entity
+      Recently harmed entities, whose health bars are rendered in the UI.
+
+    game_state: GameStates object
+      The current state of the game loop.
+
+    previous_game_state: GameStates object
+      The state to return to when the current state is exited.
+
+    skip_player_input: bool
+      After an animation finishes, we need to continue processing the stack
+      of player turn results (animations are popped off first, so there will
+      still be results from the previous turn on the stack).  This flag will
+      skip the gathering of user input which ususally occurs before
+      processing the player turn stack.
+
+    animation_player: Animation object
+      The animation currently playing, if any.  Call .next_frame on this
+      object to draw the next frame of the animation. This method returns
+      False until the animation is finished, after the last frame is player,
+      will return True.
+
+    cursor: Cursor object
+      A cursor object for allowing the user to select a space on the map,
+      populated when the game state is in cursor select mode.
+
+    game_turn: int
+      The number of turns the player has taken.
+
+    stats: HandlerStats object or None
+      If supplied, records the number of calls to and the time spent in each
+      handler.
+    """
+    def __init__(self, game_map, player, message_log, harmed_queue, *,
+                 game_turn, stats=None):
+        self.game_map = game_map
+        self.player = player
+        self.message_log = message_log
+        self.harmed_queue = harmed_queue
+        self.game_state = GameStates.PLAYER_TURN
+        self.previous_game_state = self.game_state
+        self.skip_player_input = False
+        self.animation_player = None
+        self.cursor = None
+        self.game_turn = game_turn
+        self.stats = stats
+
+    def enter_state(self, game_state):
+        self.game_state, self.previous_game_state = (
+            game_state, self.game_state)
+
+    def exit_state(self):
+        self.game_state, self.previous_game_state = (
+            self.previous_game_state, self.game_state)
+
+
+class HandlerStats:
+    """Per result type counts of handler calls and the time spent in them."""
+    def __init__(self):
+        self.counts = defaultdict(int)
+        self.times = defaultdict(float)
+
+    def record(self, result_type, elapsed):
+        self.counts[result_type] += 1
+        self.times[result_type] += elapsed
+
+    def report(self):
+        """Return (result type, calls, total seconds) rows, slowest first."""
+        return sorted(
+            ((t, self.counts[t], self.times[t]) for t in self.counts),
+            key=lambda row: row[2], reverse=True)
+
+
+def process_results(context, results, handlers, *, stop_states=()):
+    """Pop and handle results in priority order until the queue is empty, a
+    handler signals to stop, or the game enters one of the stop states.
+
+    Results with no handler in the dispatch table are discarded.
+    """
+    stats = context.stats
+    while results and context.game_state not in stop_states:
+        result_type, result_data = results.pop()
+        handler = handlers.get(result_type)
+        if handler is None:
+            continue
+        if stats is None:
+            stop = handler(context, results, result_data)
+        else:
+            start = perf_counter()
+            stop = handler(context, results, result_data)
+            stats.record(result_type, perf_counter() - start)
+        if stop:
+            break
+
+
+#-----------------------------------------------------------------------------
+# Handlers
+#-----------------------------------------------------------------------------
+def handle_restore_player_input(context, results, data):
+    """We were in a state where player input was locked out, restore it."""
+    context.skip_player_input = False
+
+def handle_animation(context, results, data):
+    """Play an animation.
+
+    After the animation finishes, we do not want to get input from the player
+    before continuing to process the results stack, so set a flag signaling
+    to skip this step, and then push a message that will restore it once we
+    come back to continue processing the stack.
+    """
+    context.animation_player = construct_animation(data, context.game_map)
+    context.skip_player_input = True
+    results.append(Result(ResultTypes.RESTORE_PLAYER_INPUT, True))
+    context.enter_state(GameStates.ANIMATION_PLAYING)
+    return True
+
+def handle_cursor_mode(context, results, data):
+    """Drop into cursor input mode for targeting."""
+    x, y, callback, mode = data
+    context.cursor = Cursor(context.player.x, context.player.y,
+                            context.game_map,
+                            callback=callback,
+                            cursor_type=mode)
+    context.enter_state(GameStates.CURSOR_INPUT)
+    return True
+
+def handle_move(context, results, data):
+    """Move the player according to some user input."""
+    context.player.movable.move(context.game_map, *data)
+
+def handle_move_to_random_position(context, results, data):
+    """Find a random open position on the map, and move the entity there
+    immediately.
+    """
+    entity = data
+    position = context.game_map.find_random_open_position()
+    if position:
+        entity.movable.set_position_if_able(context.game_map, *position)
+
+def handle_set_position(context, results, data):
+    """Set an entity's position to some given coordinates, used when moving
+    more than one step or teleporting (say, due to a raipier attack or
+    teleport staff).
+    """
+    entity, x, y = data
+    entity.movable.set_position_if_able(context.game_map, x, y)
+
+def handle_move_towards(context, results, data):
+    """Attempt to move an entity towards a target."""
+    monster, target_x, target_y = data
+    monster.movable.move_towards(context.game_map, target_x, target_y)
+
+def handle_move_random_adjacent(context, results, data):
+    """Move an entity to a random adjacent square."""
+    monster = data
+    monster.movable.move_to_random_adjacent(context.game_map)
+
+def handle_message(context, results, data):
+    """Add a message to the log."""
+    context.message_log.add_message(data)
+
+def handle_add_item_to_inventory(context, results, data):
+    """Add an item to the inventory and remove it from the game map."""
+    entity, item = data
+    entity.inventory.add(item)
+    item.commitable.delete(context.game_map)
+
+def handle_discard_item(context, results, data):
+    """Remove consumed items from inventory."""
+    item, consumed = data
+    if consumed:
+        context.player.inventory.remove(item)
+
+def handle_drop_item_from_inventory(context, results, data):
+    """Remove dropped items from inventory and place on the map."""
+    entity, item = data
+    entity.inventory.remove(item)
+    item.x, item.y = entity.x, entity.y
+    item.commitable.commit(context.game_map)
+
+def handle_damage(context, results, data):
+    """Process a damage message, possibly transforming it due to elemental
+    defences or other abilities.
+    """
+    process_damage(context.game_map, data, results)
+
+def handle_harm(context, results, data):
+    """Commit final processed damage to an entity."""
+    process_harm(context.game_map, data, results, context.harmed_queue)
+
+def handle_increase_max_hp(context, results, data):
+    entity, amount = data
+    entity.harmable.max_hp += amount
+
+def handle_increase_attack_power(context, results, data):
+    entity, amount = data
+    entity.attacker.power += amount
+
+def handle_equip_armor(context, results, data):
+    entity, armor = data
+    entity_equip_armor(entity, armor, results)
+
+def handle_equip_weapon(context, results, data):
+    entity, weapon = data
+    entity_equip_weapon(entity, weapon, results)
+
+def handle_remove_armor(context, results, data):
+    entity, armor = data
+    entity_remove_armor(entity, armor, results)
+
+def handle_remove_weapon(context, results, data):
+    entity, weapon = data
+    entity_remove_weapon(entity, weapon, results)
+
+def handle_confuse(context, results, data):
+    apply_status(
+        data, context.player, PlayerConfusedManager, EnemyConfusedManager)
+
+def handle_double_speed(context, results, data):
+    apply_status(data, context.player, SpeedManager, SpeedManager)
+
+def handle_freeze(context, results, data):
+    # TODO: Freezing of a player is not yet implemented.
+    apply_status(data, context.player, None, EnemyFrozenManager)
+
+def handle_recharge_item(context, results, data):
+    """Add a use to an item."""
+    item = data
+    item.consumable.uses += 1
+
+def handle_change_swim_stamina(context, results, data):
+    entity, stamina_change = data
+    entity.swimmable.change_stamina(stamina_change)
+
+def handle_add_entity(context, results, data):
+    """Add a new entity to the game map."""
+    entity = data
+    entity.commitable.commit(context.game_map)
+
+def handle_add_entity_and_encroach(context, results, data):
+    """Add a new entity to the game map, and have it interact with the
+    entities already in its space.
+    """
+    entity = data
+    entity.commitable.commit(context.game_map)
+    results.extend(encroach_on_all(entity, context.game_map))
+
+def handle_remove_entity(context, results, data):
+    """Remove an entity from the game map."""
+    entity = data
+    entity.commitable.delete(context.game_map)
+
+def handle_dead_entity(context, results, data):
+    dead_entity = data
+    if dead_entity:
+        context.game_map.dirty.mark(dead_entity.x, dead_entity.y)
+    if dead_entity == context.player:
+        results.extend(kill_player(context.player))
+        context.game_state = GameStates.PLAYER_DEAD
+    elif dead_entity:
+        results.extend(kill_monster(dead_entity, context.game_map))
+        make_corpse(dead_entity, context.game_map)
+
+def handle_death_message(context, results, data):
+    """Death messages are special in that they immediately stop processing of
+    the results.
+    """
+    context.message_log.add_message(data)
+    return True
+
+def handle_end_turn(context, results, data):
+    """End the player's turn."""
+    context.game_turn += 1
+    context.enter_state(GameStates.POST_PLAYER_TURN)
+
+
+PLAYER_TURN_HANDLERS = {
+    ResultTypes.RESTORE_PLAYER_INPUT: handle_restore_player_input,
+    ResultTypes.ANIMATION: handle_animation,
+    ResultTypes.CURSOR_MODE: handle_cursor_mode,
+    ResultTypes.MOVE: handle_move,
+    ResultTypes.MOVE_TO_RANDOM_POSITION: handle_move_to_random_position,
+    ResultTypes.SET_POSITION: handle_set_position,
+    ResultTypes.MESSAGE: handle_message,
+    ResultTypes.ADD_ITEM_TO_INVENTORY: handle_add_item_to_inventory,
+    ResultTypes.DISCARD_ITEM: handle_discard_item,
+    ResultTypes.DROP_ITEM_FROM_INVENTORY: handle_drop_item_from_inventory,
+    ResultTypes.DAMAGE: handle_damage,
+    ResultTypes.HARM: handle_harm,
+    ResultTypes.INCREASE_MAX_HP: handle_increase_max_hp,
+    ResultTypes.INCREASE_ATTACK_POWER: handle_increase_attack_power,
+    ResultTypes.EQUIP_ARMOR: handle_equip_armor,
+    ResultTypes.EQUIP_WEAPON: handle_equip_weapon,
+    ResultTypes.REMOVE_ARMOR: handle_remove_armor,
+    ResultTypes.REMOVE_WEAPON: handle_remove_weapon,
+    ResultTypes.CONFUSE: handle_confuse,
+    ResultTypes.DOUBLE_SPEED: handle_double_speed,
+    ResultTypes.FREEZE: handle_freeze,
+    ResultTypes.ADD_ENTITY: handle_add_entity_and_encroach,
+    ResultTypes.REMOVE_ENTITY: handle_remove_entity,
+    ResultTypes.DEAD_ENTITY: handle_dead_entity,
+    ResultTypes.DEATH_MESSAGE: handle_death_message,
+    ResultTypes.END_TURN: handle_end_turn,
+}
+
+ENEMY_TURN_HANDLERS = {
+    ResultTypes.SET_POSITION: handle_set_position,
+    ResultTypes.MOVE_TOWARDS: handle_move_towards,
+    ResultTypes.MOVE_RANDOM_ADJACENT: handle_move_random_adjacent,
+    ResultTypes.MESSAGE: handle_message,
+    ResultTypes.DAMAGE: handle_damage,
+    ResultTypes.HARM: handle_harm,
+    ResultTypes.RECHARGE_ITEM: handle_recharge_item,
+    ResultTypes.CHANGE_SWIM_STAMINA: handle_change_swim_stamina,
+    ResultTypes.ADD_ENTITY: handle_add_entity,
+    ResultTypes.REMOVE_ENTITY: handle_remove_entity,
+    ResultTypes.DEAD_ENTITY: handle_dead_entity,
+}
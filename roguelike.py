@@ -1,13 +1,4 @@
 from collections import deque
-from time import sleep
-
-import tdl
-
-from animations.animations import construct_animation
-
-from components.status_manager import (
-    PlayerConfusedManager, EnemyConfusedManager,
-    EnemyFrozenManager, SpeedManager)
 
 from etc.colors import COLORS
 from etc.config import (
@@ -15,31 +6,33 @@ from etc.config import (
     BOTTOM_PANEL_CONFIG, MAP_PANEL_CONFIG, MESSAGE_CONFIG, FOV_CONFIG,
     ANIMATION_INTERVAL, SHIMMER_INTERVAL, INITIAL_PLAYER_POSITION)
 from etc.enum import (
-    ResultTypes, FloorResultTypes, InputTypes, EntityTypes, GameStates,
+    FloorResultTypes, InputTypes, GameStates,
     INVENTORY_STATES, INPUT_STATES, CANCEL_STATES)
 
 from generation.floor_schedule import FLOOR_SCHEDULES
 
 from utils.debug import highlight_array, highlight_stairs, highlight_rooms
-from utils.utils import (
-    flatten_list_of_dictionaries,
-    unpack_single_key_dict,
-    get_key_from_single_key_dict,
-    get_all_entities_with_component_in_position)
-
-from cursor import Cursor
-from death_functions import kill_monster, kill_player, make_corpse
+
+from display.backends import TdlBackend
+
+from simulation.fire import fire_turn
+from simulation.lighting import update_lighting
+from simulation.shimmer import shimmer_all
+from simulation.steam import steam_turn
+from simulation.timers import expire_timers
+
 from game_loop_functions import (
     create_map, create_player, set_all_ai_targets, construct_inventory_data,
     get_user_input, process_selected_item, player_move_or_attack,
-    pickup_entity, encroach_on_all, process_damage, process_harm, apply_status,
-    entity_equip_armor, entity_equip_weapon, entity_remove_armor,
-    entity_remove_weapon)
+    pickup_entity, encroach_on_all)
 from menus import invetory_menu
 from messages import MessageLog
+from result_handlers import (
+    TurnContext, process_results, PLAYER_TURN_HANDLERS, ENEMY_TURN_HANDLERS)
+from turn_results import ResultQueue
 
 
-def main():
+def main(backend=None, handler_stats=None):
     """Entry point for starting the game, and managing the high level game
     state.
 
@@ -51,19 +44,28 @@ def main():
       - Starts the main loop, which calls into the function to play a floor.
       - Manages the high level game state: what is the turn number, what floor
         is the player currently on?
+
+    Parameters
+    ----------
+    backend: Display backend object
+      The backend used to draw the game and gather user input.  Defaults to
+      drawing to a window with tdl.
+
+    handler_stats: HandlerStats object or None
+      If supplied, collects the number of calls to, and time spent in, the
+      handler for each type of turn result.
     """
     # TODO: Remove N_FLOORS from config.
-
-    tdl.set_font('fonts/consolas10x10.png', greyscale=True, altLayout=True)
+    if backend is None:
+        backend = TdlBackend()
     # Setup playscreen with two consoles:
     #  - A place to draw the playscreen with the map and entities.
     #  - A console with the player's health bar, and a message log.
-    root_console = tdl.init(SCREEN_WIDTH, SCREEN_HEIGHT,
-                            title='Roguelike Tutorial Game')
-    map_console = tdl.Console(SCREEN_WIDTH, SCREEN_HEIGHT)
-    top_panel_console = tdl.Console(
+    root_console = backend.init_root(SCREEN_WIDTH, SCREEN_HEIGHT)
+    map_console = backend.make_console(SCREEN_WIDTH, SCREEN_HEIGHT)
+    top_panel_console = backend.make_console(
         SCREEN_WIDTH, TOP_PANEL_CONFIG['height'])
-    bottom_panel_console = tdl.Console(
+    bottom_panel_console = backend.make_console(
         SCREEN_WIDTH, BOTTOM_PANEL_CONFIG['height'])
     consoles = [
         root_console, map_console, bottom_panel_console, top_panel_console]
@@ -106,9 +108,10 @@ def main():
         current_map.entities.append(player)
         # Ok, let's play!
         floor_result, game_turn = play_floor(
-            current_map, player, consoles,
+            current_map, player, consoles, backend,
             game_turn=game_turn,
-            current_floor=current_floor)
+            current_floor=current_floor,
+            handler_stats=handler_stats)
         # This position is reached after the player is done with a floor of the
         # dungeon, there are three options:
         #  - The player is descending to the next floor.
@@ -119,7 +122,8 @@ def main():
         current_floor = (current_floor + floor_result.value) % 3
 
 
-def play_floor(game_map, player, consoles, *, game_turn, current_floor):
+def play_floor(game_map, player, consoles, backend, *,
+               game_turn, current_floor, handler_stats=None):
     """Play a floor of the dungeon.
 
     This function contains the main game loop.  This loop controls the flow for
@@ -144,40 +148,31 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
     # Game State Varaibles
     #-------------------------------------------------------------------------
     root_console, _, bottom_panel_console, top_panel_console = consoles
-    # Initial values for game states
-    game_state = GameStates.PLAYER_TURN
-    previous_game_state = game_state
-    # After an animation finishes, we need to continue processing the stack of
-    # player turn results (animations are popped off first, so there will still
-    # be results from the previous turn on the stack).  This flag will skip the
-    # gathering of user input which ususally occurs before processing the
-    # player turn stack.
-    skip_player_input = False
-    # This will be populated when we are playing an animation.  Call
-    # .next_frame on this object to draw the next frame of the animation. This
-    # method returns False until the animation is finished, after the last
-    # frame is player, will return True.
-    animation_player = None
+    # Log of game messages.
+    message_log = MessageLog(MESSAGE_CONFIG)
     # A queue for storing enemy targets that have taken damage.  Used to render
     # enemy health bars in the UI.
     harmed_queue = deque(maxlen=3)
-    # A cursor object for allowing the user to select a space on the map, will
-    # be populated when the game state is in cursor select mode.
-    cursor = None
-    # Stacks for holding the results of player and enemy turns.
-    player_turn_results = []
-    enemy_turn_results = []
-    # Log of game messages.
-    message_log = MessageLog(MESSAGE_CONFIG)
+    # The state of the game loop that is shared with the turn result handlers:
+    # the game state, the cursor, any playing animation, and the turn counter.
+    context = TurnContext(
+        game_map, player, message_log, harmed_queue,
+        game_turn=game_turn, stats=handler_stats)
+    # Queues for holding the results of player and enemy turns.
+    player_turn_results = ResultQueue()
+    enemy_turn_results = ResultQueue()
     # A counter for how many times we have incremented the game loop on this
     # floor.  Used to trigger updates that happen regularly with regards to
     # game loop.  For example, graphical shimmering of water and ice.
     game_loop = -1
+    # The map console is shared between floors, so the whole floor needs to be
+    # drawn on the first pass through the game loop.
+    game_map.dirty.mark_all()
 
     #-------------------------------------------------------------------------
     # Main Game Loop.
     #-------------------------------------------------------------------------
-    while not tdl.event.is_window_closed():
+    while not backend.is_window_closed():
 
         game_loop += 1
 
@@ -187,9 +182,10 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         user_input = None
 
         #---------------------------------------------------------------------
-        # Recompute the player's field of view.
+        # Recompute the player's field of view, if the player moved or the
+        # transparency of the map changed.
         #---------------------------------------------------------------------
-        game_map.compute_fov(
+        game_map.update_fov(
             player.x, player.y,
             fov=FOV_CONFIG["algorithm"],
             radius=FOV_CONFIG["radius"],
@@ -199,18 +195,14 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         # Shimmer the colors of entities that shimmer.
         #---------------------------------------------------------------------
         if game_loop % SHIMMER_INTERVAL == 0:
-            for entity in game_map.entities:
-                if entity.shimmer:
-                    entity.shimmer.shimmer()
+            shimmer_all(game_map)
 
         #---------------------------------------------------------------
-        # Clear the illumination array, which is recomputed from scratch
-        # each time terrain takes their turns.
+        # Update the illumination array, which only changes when light
+        # sources are added, removed, or move.
         #---------------------------------------------------------------
-        if game_state == GameStates.PLAYER_TURN:
-            game_map.illuminated[:, :] = 0
-            for entity in (e for e in game_map.entities if e.illuminatable):
-                entity.illuminatable.illuminate(game_map)
+        if context.game_state == GameStates.PLAYER_TURN:
+            update_lighting(game_map)
 
         #---------------------------------------------------------------------
         # Render and display the dungeon and its inhabitates.
@@ -223,7 +215,7 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         # Top panel.
         top_panel_console.clear(fg=COLORS['white'], bg=COLORS['black'])
         top_panel_console.draw_str(0, 0,
-            f" Current Floor: {current_floor}  Turn Number: {game_turn} "
+            f" Current Floor: {current_floor}  Turn Number: {context.game_turn} "
             f" Position: {player.x}, {player.y}",
             fg=(255, 255, 255))
         player.harmable.render_status_bar(top_panel_console, 1, 2)
@@ -243,31 +235,32 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         #---------------------------------------------------------------------
         # Draw the selection cursor if in cursor input state.
         #---------------------------------------------------------------------
-        if game_state == GameStates.CURSOR_INPUT:
-            cursor.draw()
+        if context.game_state == GameStates.CURSOR_INPUT:
+            context.cursor.draw()
 
         #---------------------------------------------------------------------
         # Render any menus.
         #---------------------------------------------------------------------
-        if game_state in INVENTORY_STATES:
+        if context.game_state in INVENTORY_STATES:
             inventory_message, highlight_attr = construct_inventory_data(
-                game_state)
+                context.game_state)
             menu_console, menu_x, menu_y = invetory_menu(
                 inventory_message, player.inventory,
                 inventory_width=50,
                 screen_width=SCREEN_WIDTH,
                 screen_height=SCREEN_HEIGHT,
-                highlight_attr=highlight_attr)
+                highlight_attr=highlight_attr,
+                backend=backend)
 
         #---------------------------------------------------------------------
         # Advance the frame of any animations.
         #---------------------------------------------------------------------
-        if game_state == GameStates.ANIMATION_PLAYING:
-            animation_finished = animation_player.next_frame()
-            sleep(ANIMATION_INTERVAL)
+        if context.game_state == GameStates.ANIMATION_PLAYING:
+            animation_finished = context.animation_player.next_frame()
+            backend.wait(ANIMATION_INTERVAL)
             if animation_finished:
-                skip_player_input = True
-                game_state, previous_game_state = previous_game_state, game_state
+                context.skip_player_input = True
+                context.exit_state()
 
         #---------------------------------------------------------------------
         # DEBUG
@@ -280,7 +273,7 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         # highlight_array(game_map.steam, game_map, COLORS['desaturated_green'])
         # highlight_array(game_map.terrain, game_map, COLORS['cursor_tail'])
         # highlight_array(game_map.water, game_map, COLORS['cursor_tail'])
-        highlight_stairs(game_map, COLORS['red'])
+        # highlight_stairs(game_map, COLORS['red'])
         # highlight_rooms(game_map, COLORS['cursor_tail'])
         # draw_dijkstra_map_of_radius(game_map, player, radius=3)
 
@@ -294,25 +287,19 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
                           SCREEN_WIDTH, SCREEN_HEIGHT, 0, 0)
         root_console.blit(bottom_panel_console, 0, BOTTOM_PANEL_CONFIG['y'],
                           SCREEN_WIDTH, SCREEN_HEIGHT, 0, 0)
-        if game_state in INVENTORY_STATES:
+        if context.game_state in INVENTORY_STATES:
             root_console.blit(menu_console, menu_x, menu_y,
                               SCREEN_WIDTH, SCREEN_HEIGHT, 0, 0)
-        tdl.flush()
-
-        #---------------------------------------------------------------------
-        # Clear all the entities drawn to the consoles, else we will re-draw
-        # them in the same positions next game loop.
-        #---------------------------------------------------------------------
-        game_map.undraw_all()
+        backend.flush()
 
         #---------------------------------------------------------------------
         # Get key input from the player.
         #---------------------------------------------------------------------
-        if not skip_player_input:
-            user_input = get_user_input()
-            if game_state in INPUT_STATES and not user_input:
+        if not context.skip_player_input:
+            user_input = get_user_input(backend)
+            if context.game_state in INPUT_STATES and not user_input:
                 continue
-        action = player.input_handler.handle_keys(user_input, game_state)
+        action = player.input_handler.handle_keys(user_input, context.game_state)
 
         #----------------------------------------------------------------------
         # Handle player actions.
@@ -337,7 +324,7 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         # if not, attack the blocking entity by putting an attack action on the
         # queue.
         #----------------------------------------------------------------------
-        if move and game_state == GameStates.PLAYER_TURN:
+        if move and context.game_state == GameStates.PLAYER_TURN:
             player_move_or_attack(move,
                                   player=player,
                                   game_map=game_map,
@@ -348,7 +335,7 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         # The player has attempted to pickup an item.  If there is an item in
         # the players space, put a pickup action on the queue.
         #----------------------------------------------------------------------
-        elif pickup and game_state == GameStates.PLAYER_TURN:
+        elif pickup and context.game_state == GameStates.PLAYER_TURN:
             pickup_entity(game_map, player, player_turn_results)
         #----------------------------------------------------------------------
         # Player Inventory use / drop
@@ -357,19 +344,19 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         # Check which state we are in (using or dropping) and put an
         # instruction on the queue.
         #----------------------------------------------------------------------
-        elif (game_state in INVENTORY_STATES
+        elif (context.game_state in INVENTORY_STATES
               and inventory_index is not None
               and inventory_index < len(player.inventory.items)
               # The inventory can be opened after the player has died, but we
               # don't want to let them use any items.
-              and previous_game_state != GameStates.PLAYER_DEAD):
+              and context.previous_game_state != GameStates.PLAYER_DEAD):
             item = player.inventory.items[inventory_index]
             process_selected_item(item,
                                   player=player,
                                   game_map=game_map,
-                                  game_state=game_state,
+                                  game_state=context.game_state,
                                   player_turn_results=player_turn_results)
-            game_state, previous_game_state = previous_game_state, game_state
+            context.exit_state()
 
         #----------------------------------------------------------------------
         # Handle cursor movement.
@@ -377,12 +364,12 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         # The player is currently in cursor select mode, where they have free
         # control of a cursor to select and square within their visible range.
         #----------------------------------------------------------------------
-        if move and game_state == GameStates.CURSOR_INPUT:
-            cursor.move(*move)
-        if cursor_select and game_state == GameStates.CURSOR_INPUT:
-            player_turn_results.extend(cursor.select())
-            game_state, previous_game_state = previous_game_state, game_state
-            cursor = None
+        if move and context.game_state == GameStates.CURSOR_INPUT:
+            context.cursor.move(*move)
+        if cursor_select and context.game_state == GameStates.CURSOR_INPUT:
+            player_turn_results.extend(context.cursor.select())
+            context.exit_state()
+            context.cursor = None
 
         #----------------------------------------------------------------------
         # Process the results stack
@@ -396,166 +383,23 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
         # the stack, so we continually process the results stack until it is
         # empty.
         #----------------------------------------------------------------------
-        while (game_state not in (GameStates.CURSOR_INPUT, GameStates.ANIMATION_PLAYING)
-               and player_turn_results != []):
-
-            # Sort the turn results stack by the priority order.
-            player_turn_results = sorted(
-                flatten_list_of_dictionaries(player_turn_results),
-                key = lambda d: get_key_from_single_key_dict(d))
-
-            result = player_turn_results.pop()
-            result_type, result_data = unpack_single_key_dict(result)
-
-            # We were in a state where player input was locked out, restore it.
-            if result_type == ResultTypes.RESTORE_PLAYER_INPUT:
-                skip_player_input = False
-            # Play an animation.
-            if result_type == ResultTypes.ANIMATION:
-                animation_player = construct_animation(result_data, game_map)
-                # After the animation finishes, we do not want to get input
-                # from the player before continuing to process the results
-                # stack, so set a flag signaling to skip this step, and then
-                # push a message that will restore it once we come back to
-                # continue processing the stack.
-                skip_player_input = True
-                player_turn_results.append(
-                    {ResultTypes.RESTORE_PLAYER_INPUT: True})
-                game_state, previous_game_state = (
-                    GameStates.ANIMATION_PLAYING, game_state)
-                break
-            # Drop into cursor input mode for targeting.
-            if result_type == ResultTypes.CURSOR_MODE:
-                x, y, callback, mode = result_data
-                cursor = Cursor(player.x, player.y, game_map,
-                                callback=callback,
-                                cursor_type=mode)
-                game_state, previous_game_state = (
-                    GameStates.CURSOR_INPUT, game_state)
-                break
-            # Move the player according to some user input.
-            if result_type == ResultTypes.MOVE:
-                player.movable.move(game_map, *result_data)
-            # Find a random open position on the map, and move the player there
-            # immediately.
-            if result_type == ResultTypes.MOVE_TO_RANDOM_POSITION:
-                entity = result_data
-                position = game_map.find_random_open_position()
-                entity.movable.set_position_if_able(game_map, *position)
-            # Set the player's position to some given coordinates, used when
-            # moving more than one step or teleporting (say, due to a raipier
-            # attack or teleport staff).
-            if result_type == ResultTypes.SET_POSITION:
-               entity, x, y = result_data
-               entity.movable.set_position_if_able(game_map, x, y)
-            # Add a message to the log.
-            if result_type == ResultTypes.MESSAGE:
-                message_log.add_message(result_data)
-            # Add an item to the inventory and remove it from the game map.
-            if result_type == ResultTypes.ADD_ITEM_TO_INVENTORY:
-                entity, item = result_data
-                entity.inventory.add(item)
-                item.commitable.delete(game_map)
-            # Remove consumed items from inventory.
-            if result_type == ResultTypes.DISCARD_ITEM:
-                item, consumed = result_data
-                if consumed:
-                    player.inventory.remove(item)
-            # Remove dropped items from inventory and place on the map
-            if result_type == ResultTypes.DROP_ITEM_FROM_INVENTORY:
-                entity, item = result_data
-                entity.inventory.remove(item)
-                item.x, item.y = entity.x, entity.y
-                game_map.entities.append(item)
-            # Process a damage message, possibly transforming it due to
-            # elemental defences or other abilities.
-            if result_type == ResultTypes.DAMAGE:
-                process_damage(game_map, result_data, player_turn_results)
-            # Commit final processed damage to an entity.
-            if result_type == ResultTypes.HARM:
-                process_harm(
-                    game_map, result_data, player_turn_results, harmed_queue)
-            # Increase the maximum HP of an entity
-            if result_type == ResultTypes.INCREASE_MAX_HP:
-                entity, amount = result_data
-                entity.harmable.max_hp += amount
-            # Increase the maximum attack power of an entity
-            if result_type == ResultTypes.INCREASE_ATTACK_POWER:
-                entity, amount = result_data
-                entity.attacker.power += amount
-            # Don defensive equipment.
-            if result_type == ResultTypes.EQUIP_ARMOR:
-                entity, armor = result_data
-                entity_equip_armor(entity, armor, player_turn_results)
-            # Don offensive equipment.
-            if result_type == ResultTypes.EQUIP_WEAPON:
-                entity, weapon = result_data
-                entity_equip_weapon(entity, weapon, player_turn_results)
-            # Remove defensive equipment.
-            if result_type == ResultTypes.REMOVE_ARMOR:
-                entity, armor = result_data
-                entity_remove_armor(entity, armor, player_turn_results)
-            # Remove offensive equipment.
-            if result_type == ResultTypes.REMOVE_WEAPON:
-                entity, weapon = result_data
-                entity_remove_weapon(entity, weapon, player_turn_results)
-            # Put an entity in a confused state
-            if result_type == ResultTypes.CONFUSE:
-                entity = result_data
-                apply_status(
-                    entity, player, PlayerConfusedManager, EnemyConfusedManager)
-            if result_type == ResultTypes.DOUBLE_SPEED:
-                entity = result_data
-                apply_status(entity, player, SpeedManager, SpeedManager)
-            # Freeze the player
-            if result_type == ResultTypes.FREEZE:
-                entity = result_data
-                # TODO: Freezing of a player is not yet implemented.
-                apply_status(entity, player, None, EnemyFrozenManager)
-            # Add a new entity to the game map.
-            if result_type == ResultTypes.ADD_ENTITY:
-                entity = result_data
-                entity.commitable.commit(game_map)
-                player_turn_results.extend(encroach_on_all(entity, game_map))
-            # Remove an entity from the game map.
-            if result_type == ResultTypes.REMOVE_ENTITY:
-                entity = result_data
-                entity.commitable.delete(game_map)
-            # Handle death
-            if result_type == ResultTypes.DEAD_ENTITY:
-                dead_entity = result_data
-                if dead_entity == player:
-                    player_turn_results.extend(kill_player(player))
-                    game_state = GameStates.PLAYER_DEAD
-                elif dead_entity:
-                    player_turn_results.extend(
-                        kill_monster(dead_entity, game_map))
-                    make_corpse(dead_entity)
-            # Handle a player death message.  Death messages are special in
-            # that they immediately break out of the game loop.
-            if result_type == ResultTypes.DEATH_MESSAGE:
-                death_message = result_data
-                message_log.add_message(death_message)
-                break
-            # End the player's turn
-            if result_type == ResultTypes.END_TURN:
-                game_turn += 1
-                game_state, previous_game_state = (
-                    GameStates.POST_PLAYER_TURN, game_state)
+        process_results(
+            context, player_turn_results, PLAYER_TURN_HANDLERS,
+            stop_states=(GameStates.CURSOR_INPUT, GameStates.ANIMATION_PLAYING))
 
 
         #---------------------------------------------------------------------
         # Post player turn checks.
         #---------------------------------------------------------------------
-        if game_state == GameStates.POST_PLAYER_TURN:
+        if context.game_state == GameStates.POST_PLAYER_TURN:
             # Check if the player has entered into a square containing stairs.
             # If so, end the current floor immediately.
             if (player.x, player.y) == game_map.upward_stairs_position:
                 game_map.entities.remove(player)
-                return FloorResultTypes.INCREMENT_FLOOR, game_turn
+                return FloorResultTypes.INCREMENT_FLOOR, context.game_turn
             if (player.x, player.y) == game_map.downward_stairs_position:
                 game_map.entities.remove(player)
-                return FloorResultTypes.DECREMENT_FLOOR, game_turn
+                return FloorResultTypes.DECREMENT_FLOOR, context.game_turn
             # All rechargable items get ticked.
             for item in player.inventory:
                 if item.rechargeable:
@@ -571,161 +415,95 @@ def play_floor(game_map, player, consoles, *, game_turn, current_floor):
             else:
                 enemy_turn_results.extend(player.swimmable.rest())
             # Pass the turn to the enemies.
-            game_state = GameStates.ENEMY_TURN
+            context.game_state = GameStates.ENEMY_TURN
 
 
         #-------------------------------------------------------------------
         # All enemies and terrain take thier turns.
         #-------------------------------------------------------------------
-        if game_state == GameStates.ENEMY_TURN:
-
-            for entity in (e for e in game_map.entities if e != player):
-                # Enemies move and attack if possible.
-                if entity.ai:
-                    turn = entity.ai.take_turn(game_map)
-                    enemy_turn_results.extend(turn)
-                # If the enemy has a current status, tick it.
-                if entity.status_manager:
+        if context.game_state == GameStates.ENEMY_TURN:
+
+            # Monsters chasing the player share one flow field per routing
+            # profile, built at most once this turn.
+            game_map.flow_fields.reset((player.x, player.y))
+            # Each pass only visits the entities holding the relevant
+            # component.
+            entities = game_map.entities
+            # Enemies move and attack if possible.
+            for entity in entities.with_component("ai"):
+                if entity != player:
+                    enemy_turn_results.extend(entity.ai.take_turn(game_map))
+            # If the enemy has a current status, tick it.
+            for entity in entities.with_component("status_manager"):
+                if entity != player:
                     entity.status_manager.tick()
-                # Fire and gas dissipates.
-                if entity.dissipatable:
-                    enemy_turn_results.extend(
-                        entity.dissipatable.dissipate(game_map))
-                # Interact with water.
-                if game_map.water[entity.x, entity.y] and entity.floatable:
+            # Lingering terrain whose time is up dissipates.
+            enemy_turn_results.extend(expire_timers(game_map))
+            # Interact with water.
+            for entity in entities.with_component("floatable"):
+                if game_map.water[entity.x, entity.y]:
                     enemy_turn_results.extend(
                         entity.floatable.float(game_map))
-                if game_map.water[entity.x, entity.y] and entity.swimmable:
-                    enemy_turn_results.extend(
-                        entity.swimmable.swim())
-                # Fire burns entities in the same space.
-                if entity.entity_type == EntityTypes.FIRE:
-                    burnable_entities_at_position = (
-                        get_all_entities_with_component_in_position(
-                            (entity.x, entity.y), game_map, "burnable"))
-                    for e in burnable_entities_at_position:
-                        enemy_turn_results.extend(e.burnable.burn(game_map))
-                # Fire and gas spreads.
-                if entity.spreadable:
-                    enemy_turn_results.extend(
-                        entity.spreadable.spread(game_map))
-                # Steam scalds entities in the same space.
-                if entity.entity_type == EntityTypes.STEAM:
-                    scaldable_entities_at_position = (
-                        get_all_entities_with_component_in_position(
-                            (entity.x, entity.y), game_map, "scaldable"))
-                    for e in scaldable_entities_at_position:
-                        enemy_turn_results.extend(e.scaldable.scald(game_map))
-            game_state = GameStates.PLAYER_TURN
+            for entity in entities.with_component("swimmable"):
+                if game_map.water[entity.x, entity.y] and entity != player:
+                    enemy_turn_results.extend(entity.swimmable.swim())
+            # Fire burns, spreads, and dissipates across the whole map.
+            enemy_turn_results.extend(fire_turn(game_map))
+            # Steam scalds, spreads, and dissipates across the whole map.
+            enemy_turn_results.extend(steam_turn(game_map))
+            # Zombies spread necrotic soil.
+            for entity in entities.with_component("spreadable"):
+                enemy_turn_results.extend(
+                    entity.spreadable.spread(game_map))
+            context.game_state = GameStates.PLAYER_TURN
 
         #---------------------------------------------------------------------
         # Process all result actions of enemy turns.
         #---------------------------------------------------------------------
-        while enemy_turn_results != []:
-
-            enemy_turn_results = sorted(
-                flatten_list_of_dictionaries(enemy_turn_results),
-                key = lambda d: get_key_from_single_key_dict(d))
-
-            result = enemy_turn_results.pop()
-            result_type, result_data = unpack_single_key_dict(result)
-
-            # Handle a move action
-            if result_type == ResultTypes.SET_POSITION:
-                monster, x, y = result_data
-                monster.movable.set_position_if_able(game_map, x, y)
-            # Handle a move towards action.  Move towards a target.
-            if result_type == ResultTypes.MOVE_TOWARDS:
-                #import pdb; pdb.set_trace()
-                monster, target_x, target_y = result_data
-                monster.movable.move_towards(game_map, target_x, target_y)
-            # Handle a move random adjacent action.  Move to a random adjacent
-            # square.
-            if result_type == ResultTypes.MOVE_RANDOM_ADJACENT:
-                monster = result_data
-                monster.movable.move_to_random_adjacent(game_map)
-            # Handle a simple message.
-            if result_type == ResultTypes.MESSAGE:
-                message = result_data
-                message_log.add_message(message)
-            # Handle damage dealt, possibly transforming it.
-            if result_type == ResultTypes.DAMAGE:
-                process_damage(game_map, result_data, enemy_turn_results)
-            # Commit damage to an entity.
-            if result_type == ResultTypes.HARM:
-                process_harm(
-                    game_map, result_data, enemy_turn_results, harmed_queue)
-            # Add a use to an item
-            if result_type == ResultTypes.RECHARGE_ITEM:
-                item = result_data
-                item.consumable.uses += 1
-            # Entities swim and thier stamana decreases.
-            if result_type == ResultTypes.CHANGE_SWIM_STAMINA:
-                entity, stamina_change = result_data
-                entity.swimmable.change_stamina(stamina_change)
-            # Add a new entity to the game.
-            if result_type == ResultTypes.ADD_ENTITY:
-                entity = result_data
-                entity.commitable.commit(game_map)
-            # Remove an entity from the game.
-            if result_type == ResultTypes.REMOVE_ENTITY:
-                entity = result_data
-                entity.commitable.delete(game_map)
-            # Handle death.
-            if result_type == ResultTypes.DEAD_ENTITY:
-                dead_entity = result_data
-                if dead_entity == player:
-                    enemy_turn_results.extend(kill_player(player))
-                    game_state = GameStates.PLAYER_DEAD
-                elif dead_entity:
-                    enemy_turn_results.extend(
-                        kill_monster(dead_entity, game_map))
-                    make_corpse(dead_entity)
+        process_results(context, enemy_turn_results, ENEMY_TURN_HANDLERS)
 
 
         #---------------------------------------------------------------------
         # Handle meta actions,
         #---------------------------------------------------------------------
         show_invetory = action.get(InputTypes.SHOW_INVENTORY)
-        if game_state == GameStates.PLAYER_TURN and show_invetory:
-            previous_game_state = game_state
-            game_state = GameStates.SHOW_INVENTORY
+        if context.game_state == GameStates.PLAYER_TURN and show_invetory:
+            context.enter_state(GameStates.SHOW_INVENTORY)
 
         drop_inventory = action.get(InputTypes.DROP_INVENTORY)
-        if game_state == GameStates.PLAYER_TURN and drop_inventory:
-            previous_game_state = game_state
-            game_state = GameStates.DROP_INVENTORY
+        if context.game_state == GameStates.PLAYER_TURN and drop_inventory:
+            context.enter_state(GameStates.DROP_INVENTORY)
 
         throw_inventory = action.get(InputTypes.THROW_INVENTORY)
-        if game_state == GameStates.PLAYER_TURN and throw_inventory:
-            previous_game_state = game_state
-            game_state = GameStates.THROW_INVENTORY
+        if context.game_state == GameStates.PLAYER_TURN and throw_inventory:
+            context.enter_state(GameStates.THROW_INVENTORY)
 
         equip_inventory = action.get(InputTypes.EQUIP_INVENTORY)
-        if game_state == GameStates.PLAYER_TURN and equip_inventory:
-            previous_game_state = game_state
-            game_state = GameStates.EQUIP_INVENTORY
+        if context.game_state == GameStates.PLAYER_TURN and equip_inventory:
+            context.enter_state(GameStates.EQUIP_INVENTORY)
 
         exit = action.get(InputTypes.EXIT)
         if exit:
-            if game_state == GameStates.CURSOR_INPUT:
-                cursor.clear()
-            if game_state in CANCEL_STATES:
-                game_state, previous_game_state = (
-                    previous_game_state, game_state)
+            if context.game_state == GameStates.CURSOR_INPUT:
+                context.cursor.clear()
+            if context.game_state in CANCEL_STATES:
+                context.exit_state()
             else:
-                return FloorResultTypes.END_GAME, game_turn
+                return FloorResultTypes.END_GAME, context.game_turn
 
         fullscreen = action.get(InputTypes.FULLSCREEN)
         if fullscreen:
-            tdl.set_fullscreen(not tdl.get_fullscreen())
+            backend.set_fullscreen(not backend.get_fullscreen())
 
         #---------------------------------------------------------------------
         # If the player is dead, the game is over.
         #---------------------------------------------------------------------
-        if game_state == GameStates.PLAYER_DEAD:
+        if context.game_state == GameStates.PLAYER_DEAD:
             continue
 
+    # The window was closed, or a headless backend ran out of events.
+    return FloorResultTypes.END_GAME, context.game_turn
+
 
 if __name__ == '__main__':
     main()
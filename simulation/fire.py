@@ -0,0 +1,107 @@
+"""
+Grid level simulation of fire.
+
+The cells that are burning are tracked in the game_map.fire array, and each
+burning cell holds a single Fire entity used for drawing and illumination.
+Each enemy turn, every fire on the map:
+
+  - Burns all the burnable entities in its own cell.
+  - Picks a random adjacent cell, and burns each of the burnable entities
+    there at a fixed probability.
+  - Dissipates at a fixed probability.
+
+The rolls for all the fires on the map are made at once with numpy (from a
+generator seeded by python's random, see make_rng), and results are only
+constructed for the entities that actually ignite and the fires that
+dissipate.
+"""
+import numpy as np
+
+from etc.enum import ResultTypes, EntityTypes
+from etc.game_config import FIRE_SPREAD_PROBABILITY, FIRE_DISSAPATE_PROBABILTY
+from turn_results import Result
+from utils.utils import (
+    get_all_entities_of_type_in_position,
+    get_all_entities_with_component_in_position)
+
+from utils.geometry import ADJACENT_DX, ADJACENT_DY, in_bounds
+from simulation.grid import make_component_count, make_rng
+
+
+def fire_turn(game_map,
+              p_spread=FIRE_SPREAD_PROBABILITY,
+              p_dissipate=FIRE_DISSAPATE_PROBABILTY):
+    """All the fires on the map take their turn.
+
+    Each burnable entity in a cell a fire spreads towards is rolled for
+    separately, once for every fire that picks the cell.  An entity is burned
+    at most once a turn, however many fires reach it.
+
+    Parameters
+    ----------
+    game_map: GameMap object
+
+    p_spread: float
+      The probability that a fire spreads to the burnable entities in the
+      adjacent cell it picks.
+
+    p_dissipate: float
+      The probability that a fire dissipates.
+
+    Returns
+    -------
+    results: List[Result]
+      The burn results of all the ignited entities, and the removal of all
+      the dissipated fires.
+    """
+    fire = game_map.fire != 0
+    fire_xs, fire_ys = np.nonzero(fire)
+    n_fires = len(fire_xs)
+    if n_fires == 0:
+        return []
+    # The burnable entities are grass, shrubs, items, and any creature that can
+    # burn.
+    n_burnable = make_component_count(game_map, "burnable")
+    # Fires always burn the contents of their own cell.
+    ignited = fire & (n_burnable > 0)
+    # Each fire picks one neighbour to spread into, and rolls once for each
+    # burnable entity there.  The contents of cells that are already ignited
+    # burn anyway.
+    rng = make_rng()
+    direction = rng.integers(0, len(ADJACENT_DX), size=n_fires)
+    target_xs = fire_xs + ADJACENT_DX[direction]
+    target_ys = fire_ys + ADJACENT_DY[direction]
+    on_map = in_bounds(game_map, target_xs, target_ys)
+    target_xs, target_ys = target_xs[on_map], target_ys[on_map]
+    targets = ((n_burnable[target_xs, target_ys] > 0)
+               & ~ignited[target_xs, target_ys])
+    target_xs, target_ys = target_xs[targets], target_ys[targets]
+    n_targeted = n_burnable[target_xs, target_ys]
+    spreads = rng.random(size=n_targeted.sum()) < p_spread
+    dissipates = rng.random(size=n_fires) < p_dissipate
+
+    # The burned entities, as an insertion ordered set.
+    burned = {}
+    for x, y in zip(*np.nonzero(ignited)):
+        burnable_entities = get_all_entities_with_component_in_position(
+            (int(x), int(y)), game_map, "burnable")
+        for entity in burnable_entities:
+            burned[entity] = None
+    roll_idx = 0
+    for x, y, n in zip(target_xs.tolist(), target_ys.tolist(),
+                       n_targeted.tolist()):
+        burnable_entities = get_all_entities_with_component_in_position(
+            (x, y), game_map, "burnable")
+        for entity, spread in zip(burnable_entities,
+                                  spreads[roll_idx:roll_idx + n].tolist()):
+            if spread:
+                burned[entity] = None
+        roll_idx += n
+    results = []
+    for entity in burned:
+        results.extend(entity.burnable.burn(game_map))
+    for x, y in zip(fire_xs[dissipates], fire_ys[dissipates]):
+        fires = get_all_entities_of_type_in_position(
+            (int(x), int(y)), game_map, EntityTypes.FIRE)
+        results.extend(Result(ResultTypes.REMOVE_ENTITY, f) for f in fires)
+    return results
@@ -0,0 +1,41 @@
+"""
+Helpers shared by the grid level simulations.
+"""
+import random
+
+import numpy as np
+
+
+def make_rng():
+    """Construct a numpy random generator seeded from python's random module.
+
+    The rest of the game draws from python's random, so seeding it makes a
+    whole game reproducible.  The simulations make their rolls for the whole
+    map at once with a generator seeded here.
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def make_component_mask(game_map, component):
+    """Construct a boolean array marking the cells that contain at least one
+    entity holding a component.
+    """
+    mask = np.zeros((game_map.width, game_map.height), dtype=bool)
+    positions = [
+        (e.x, e.y) for e in game_map.entities.with_component(component)]
+    if positions:
+        xs, ys = zip(*positions)
+        mask[xs, ys] = True
+    return mask
+
+def make_component_count(game_map, component):
+    """Construct an integer array counting the entities holding a component
+    in each cell.
+    """
+    counts = np.zeros((game_map.width, game_map.height), dtype=np.int16)
+    positions = [
+        (e.x, e.y) for e in game_map.entities.with_component(component)]
+    if positions:
+        xs, ys = zip(*positions)
+        np.add.at(counts, (np.array(xs), np.array(ys)), 1)
+    return counts
@@ -0,0 +1,28 @@
+"""
+Illumination of the map by light sources.
+
+Each light source (fires and stationary torches) lights the tiles around it,
+which are then visible even when not in the player's fov.  The sources are
+composited into game_map.lights, and the illuminated array is only rebuilt
+when a light source is added, removed, or moves.
+"""
+
+
+def update_lighting(game_map):
+    """Bring the light map up to date with the light sources currently on the
+    map, and recompute the illuminated tiles if anything changed.
+    """
+    lights = game_map.lights
+    current = {
+        e: (e.x, e.y, e.illuminatable.radius)
+        for e in game_map.entities.with_component("illuminatable")}
+    if current == lights.sources:
+        return
+    stale = [source for source, light in lights.sources.items()
+             if current.get(source) != light]
+    for source in stale:
+        lights.remove(source)
+    for source, light in current.items():
+        if source not in lights.sources:
+            lights.add(source, *light)
+    game_map.illuminated[:, :] = lights.counts > 0
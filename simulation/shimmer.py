@@ -0,0 +1,32 @@
+"""
+Shimmering of water, ice, fire, and steam.
+
+Every few frames of the game loop, the shimmer components of the tiles the
+player can see generate new colors for their entities, and only those tiles
+are redrawn, so a shimmer never triggers a render pass of the map.  The
+colors are stored on the entities, so a shimmering tile that is re-rendered
+for some other reason (say, a monster walks over it) keeps its colors.  A
+floor with no shimmering tiles does no work at all.
+"""
+
+
+def shimmer_all(game_map):
+    """Shimmer the colors of all the shimmering entities that are drawn, and
+    redraw their tiles.
+
+    An entity is only shimmered when it is drawn on top of its tile, the
+    colors of any entity drawn over it take precedence.  Tiles out of view
+    only shimmer their dark colors, and only if they have been seen.
+    """
+    entities = game_map.entities
+    for entity in entities.with_component("shimmer"):
+        x, y = entity.x, entity.y
+        if entities.get_entities_in_position((x, y))[-1] is not entity:
+            continue
+        if game_map.visible(x, y):
+            entity.shimmer.shimmer()
+        elif entity.visible_out_of_fov and entity.seen:
+            entity.shimmer.shimmer_dark()
+        else:
+            continue
+        game_map.update_and_draw_entity(entity)
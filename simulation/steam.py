@@ -0,0 +1,112 @@
+"""
+Grid level simulation of steam.
+
+The cells holding steam are tracked in the game_map.steam array, and the
+spread probability, dissipation probability, and age of the steam in each
+cell are held in game_map.steam_field.  Each enemy turn, all the steam on the
+map:
+
+  - Scalds all the scaldable entities in its own cell.
+  - Spreads to each adjacent walkable cell at its spread probability.  The
+    new steam is less likely to spread, and more likely to dissipate.
+  - Lingers for a fixed number of turns, and then dissipates at its
+    dissipation probability.
+
+The rolls for all the steam on the map are made at once with numpy (from a
+generator seeded by python's random, see make_rng).  Steam entities are only
+constructed for the cells that newly fill with steam, and are used to draw
+the steam.
+"""
+import numpy as np
+
+from etc.enum import ResultTypes, EntityTypes
+from etc.game_config import STEAM_DISSAPATE_N_FRAMES
+from turn_results import Result
+from utils.utils import (
+    get_all_entities_of_type_in_position,
+    get_all_entities_with_component_in_position)
+import game_objects.various
+
+from utils.geometry import ADJACENT_DX, ADJACENT_DY, in_bounds
+from simulation.grid import make_component_mask, make_rng
+
+
+# The change in the spread and dissipation probabilities of steam that is
+# the result of spreading.
+SPREAD_DECAY = 0.4
+
+
+def steam_turn(game_map, n_frames=STEAM_DISSAPATE_N_FRAMES):
+    """All the steam on the map takes its turn.
+
+    When steam spreads into the same cell from more than one neighbour, the
+    new steam takes the parameters of the most vigorous source.
+
+    Parameters
+    ----------
+    game_map: GameMap object
+
+    n_frames: int
+      The number of turns steam lingers before it can dissipate.
+
+    Returns
+    -------
+    results: List[Result]
+      The scald results of all the scalded entities, the addition of new
+      steam, and the removal of all the dissipated steam.
+    """
+    steam = game_map.steam != 0
+    steam_xs, steam_ys = np.nonzero(steam)
+    n_steam = len(steam_xs)
+    if n_steam == 0:
+        return []
+    field = game_map.steam_field
+    p_spread = field.p_spread[steam_xs, steam_ys]
+    p_dissipate = field.p_dissipate[steam_xs, steam_ys]
+    # Roll for spreading into each of the eight neighbours of every cell.
+    target_xs = steam_xs[np.newaxis, :] + ADJACENT_DX[:, np.newaxis]
+    target_ys = steam_ys[np.newaxis, :] + ADJACENT_DY[:, np.newaxis]
+    rng = make_rng()
+    spreads = rng.random(size=target_xs.shape) < p_spread
+    spreads &= in_bounds(game_map, target_xs, target_ys)
+    source_idxs = np.broadcast_to(np.arange(n_steam), target_xs.shape)
+    target_xs, target_ys = target_xs[spreads], target_ys[spreads]
+    source_idxs = source_idxs[spreads]
+    # Steam only spreads into open cells that do not already hold steam.
+    open_cells = (game_map.walkable[target_xs, target_ys] &
+                  ~steam[target_xs, target_ys])
+    target_xs, target_ys = target_xs[open_cells], target_ys[open_cells]
+    source_idxs = source_idxs[open_cells]
+    # Keep the most vigorous source for each target cell.
+    by_vigor = np.argsort(-p_spread[source_idxs], kind='stable')
+    target_xs, target_ys = target_xs[by_vigor], target_ys[by_vigor]
+    source_idxs = source_idxs[by_vigor]
+    _, first = np.unique(
+        target_xs * game_map.height + target_ys, return_index=True)
+    target_xs, target_ys = target_xs[first], target_ys[first]
+    source_idxs = source_idxs[first]
+    new_p_spread = np.maximum(0, p_spread[source_idxs] - SPREAD_DECAY)
+    new_p_dissipate = np.minimum(1, p_dissipate[source_idxs] + SPREAD_DECAY)
+    # Steam lingers for a number of turns, and then may dissipate.
+    age = field.age[steam_xs, steam_ys]
+    lingering = age < n_frames
+    field.age[steam_xs[lingering], steam_ys[lingering]] += 1
+    dissipates = ~lingering & (rng.random(size=n_steam) < p_dissipate)
+
+    results = []
+    scalded = steam & make_component_mask(game_map, "scaldable")
+    for x, y in zip(*np.nonzero(scalded)):
+        scaldable_entities = get_all_entities_with_component_in_position(
+            (int(x), int(y)), game_map, "scaldable")
+        for entity in scaldable_entities:
+            results.extend(entity.scaldable.scald(game_map))
+    for x, y, p_s, p_d in zip(target_xs.tolist(), target_ys.tolist(),
+                              new_p_spread.tolist(), new_p_dissipate.tolist()):
+        new_steam = game_objects.various.Steam.make(
+            game_map, x, y, p_spread=p_s, p_dissipate=p_d)
+        results.append(Result(ResultTypes.ADD_ENTITY, new_steam))
+    for x, y in zip(steam_xs[dissipates], steam_ys[dissipates]):
+        steams = get_all_entities_of_type_in_position(
+            (int(x), int(y)), game_map, EntityTypes.STEAM)
+        results.extend(Result(ResultTypes.REMOVE_ENTITY, s) for s in steams)
+    return results
@@ -0,0 +1,24 @@
+"""
+Expiry of lingering terrain.
+
+Lingering terrain (for example, the necrotic soil left behind by zombies) is
+committed with a LingeringCommitable, which starts a countdown timer for the
+entity in game_map.timers.  Each enemy turn all the timers on the map are
+counted down at once, and the lingering entities whose timer has run out
+are removed.
+"""
+from etc.enum import ResultTypes
+from turn_results import Result
+
+
+def expire_timers(game_map):
+    """Count down all the timers on the map, and remove the lingering entities
+    whose time is up.
+
+    Returns
+    -------
+    results: List[Result]
+      The removal of all the expired entities.
+    """
+    return [Result(ResultTypes.REMOVE_ENTITY, entity)
+            for entity in game_map.timers.tick()]
@@ -0,0 +1,52 @@
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+# The game modules are imported from the root of the repository.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from display.backends import ArrayConsole
+from etc.config import (
+    FOV_CONFIG, INITIAL_PLAYER_POSITION, SCREEN_HEIGHT, SCREEN_WIDTH)
+from game_loop_functions import create_map, create_player
+from generation.floor import CaveFloor
+from generation.floor_schedule import FLOOR_SCHEDULES
+from map import GameMap
+
+
+@pytest.fixture
+def game_map():
+    """The first floor of the dungeon, drawn to an ArrayConsole."""
+    random.seed(0)
+    np.random.seed(0)
+    console = ArrayConsole(SCREEN_WIDTH, SCREEN_HEIGHT)
+    return create_map(console, floor_schedule=FLOOR_SCHEDULES[0])
+
+
+@pytest.fixture
+def open_map():
+    """A small empty floor, open everywhere but the walls at its edges."""
+    random.seed(0)
+    floor = CaveFloor((20, 15))
+    floor.layout = np.ones((20, 15), dtype=bool)
+    return GameMap(floor, ArrayConsole(20, 15))
+
+
+@pytest.fixture
+def player(game_map):
+    """The player, on the first floor with the fov computed."""
+    player = create_player(game_map)
+    player.x, player.y = INITIAL_PLAYER_POSITION
+    game_map.entities.append(player)
+    update_fov(game_map, player)
+    return player
+
+
+def update_fov(game_map, player):
+    """Compute the fov from the player, as the game loop does."""
+    game_map.update_fov(
+        player.x, player.y, fov=FOV_CONFIG["algorithm"],
+        radius=FOV_CONFIG["radius"], light_walls=FOV_CONFIG["light_walls"])
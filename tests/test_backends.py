@@ -0,0 +1,76 @@
+import random
+
+import numpy as np
+
+from display.backends import (
+    ArrayBackend, ArrayConsole, KeyEvent, NullBackend, DEFAULT_BG, DEFAULT_FG)
+from etc.config import FOV_CONFIG, INITIAL_PLAYER_POSITION, MAP_PANEL_CONFIG
+from game_loop_functions import create_map, create_player
+from generation.floor_schedule import FLOOR_SCHEDULES
+
+
+def test_array_console_colors_follow_tdl_conventions():
+    console = ArrayConsole(4, 3)
+    console.draw_char(1, 1, '@', fg=(1, 2, 3), bg=(4, 5, 6))
+    # None leaves the current colors in place.
+    console.draw_char(1, 1, '#', fg=None, bg=None)
+    assert console.chars[1, 1] == '#'
+    assert tuple(console.fg[1, 1]) == (1, 2, 3)
+    assert tuple(console.bg[1, 1]) == (4, 5, 6)
+    # Ellipsis uses the defaults.
+    console.draw_rect(0, 0, 2, 2, ' ')
+    assert tuple(console.fg[1, 1]) == DEFAULT_FG
+    assert tuple(console.bg[1, 1]) == DEFAULT_BG
+
+
+def test_array_console_blit():
+    source = ArrayConsole(3, 3)
+    source.draw_str(0, 1, 'abc', fg=(9, 9, 9))
+    target = ArrayConsole(4, 4)
+    target.blit(source, 1, 2, 3, 3, 0, 0)
+    assert ''.join(target.chars[:, 3]) == ' abc'
+    assert (target.fg[1:, 3] == 9).all()
+
+
+def test_null_backend_closes_after_its_events():
+    backend = NullBackend(events=[KeyEvent(char='h')])
+    assert [event.char for event in backend.get_events()] == ['h']
+    assert not backend.is_window_closed()
+    assert backend.get_events() == []
+    assert backend.is_window_closed()
+
+
+def test_headless_map_render_matches_visual_arrays():
+    random.seed(0)
+    np.random.seed(0)
+    console = ArrayConsole(100, 60)
+    game_map = create_map(console, floor_schedule=FLOOR_SCHEDULES[0])
+    player = create_player(game_map)
+    player.x, player.y = INITIAL_PLAYER_POSITION
+    game_map.entities.append(player)
+    game_map.update_fov(
+        player.x, player.y, fov=FOV_CONFIG["algorithm"],
+        radius=FOV_CONFIG["radius"], light_walls=FOV_CONFIG["light_walls"])
+    game_map.update_and_draw_all()
+    width, height = game_map.width, game_map.height
+    assert console.chars[player.x, player.y] == player.char
+    assert (console.chars[:width, :height] == game_map.chars).all()
+    valid = game_map.bg_colors.valid
+    assert (console.bg[:width, :height][valid]
+            == game_map.bg_colors.rgb[valid]).all()
+    # Nothing is left to draw.
+    assert not game_map.dirty.any()
+
+
+def test_headless_game_plays_to_the_end_of_its_script():
+    random.seed(0)
+    np.random.seed(0)
+    import roguelike
+    moves = [KeyEvent(char=char) for char in 'hjklyubn' * 3]
+    backend = ArrayBackend(events=moves)
+    assert roguelike.main(backend=backend)
+    assert backend.frames > len(moves)
+    top_line = ''.join(backend.root.chars[:, 0])
+    assert 'Current Floor: 0' in top_line
+    map_rows = backend.root.chars[:, MAP_PANEL_CONFIG['y']:]
+    assert (map_rows != ' ').any()
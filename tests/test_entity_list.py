@@ -0,0 +1,127 @@
+import math
+import random
+
+import pytest
+
+from entity_list import EntityList
+from etc.enum import RenderOrder
+
+
+WIDTH, HEIGHT = 40, 30
+
+
+class FakeEntity:
+    """Just the attributes of an entity that the entity list reads."""
+    def __init__(self, x, y, render_order):
+        self.x = x
+        self.y = y
+        self.render_order = render_order
+        self.component_names = ()
+
+    def __repr__(self):
+        return f"FakeEntity({self.x}, {self.y}, {self.render_order})"
+
+
+def make_entity_list(n_entities, seed=0):
+    rng = random.Random(seed)
+    entities = EntityList(WIDTH, HEIGHT)
+    for _ in range(n_entities):
+        entities.append(FakeEntity(
+            rng.randrange(WIDTH), rng.randrange(HEIGHT),
+            rng.choice(list(RenderOrder))))
+    return entities, rng
+
+
+def move(entities, entity, position):
+    old_position = (entity.x, entity.y)
+    entity.x, entity.y = position
+    entities.update_position(entity, old_position, position)
+
+
+def test_in_render_order_matches_sorting():
+    entities, rng = make_entity_list(300)
+    for entity in rng.sample(list(entities), 100):
+        entities.remove(entity)
+    # The original renderer sorted the entities on every frame.
+    expected = sorted(entities, key=lambda e: e.render_order.value)
+    assert list(entities.in_render_order()) == expected
+
+
+def test_positions_stay_in_render_order_as_entities_move():
+    entities, rng = make_entity_list(300)
+    for _ in range(500):
+        # Pile entities onto a few squares, so positions hold several.
+        move(entities, rng.choice(list(entities)),
+             (rng.randrange(5), rng.randrange(5)))
+    for x in range(WIDTH):
+        for y in range(HEIGHT):
+            orders = [
+                e.render_order.value
+                for e in entities.get_entities_in_position((x, y))]
+            assert orders == sorted(orders)
+
+
+def test_update_render_order_moves_entity_within_position():
+    entities = EntityList(WIDTH, HEIGHT)
+    item = FakeEntity(1, 1, RenderOrder.ITEM)
+    actor = FakeEntity(1, 1, RenderOrder.ACTOR)
+    entities.append(actor)
+    entities.append(item)
+    assert entities.get_entities_in_position((1, 1)) == [item, actor]
+    actor.render_order = RenderOrder.CORPSE
+    entities.update_render_order(actor, RenderOrder.ACTOR, RenderOrder.CORPSE)
+    assert entities.get_entities_in_position((1, 1)) == [actor, item]
+    assert list(entities.in_render_order()) == [actor, item]
+
+
+def test_position_index_matches_scan():
+    entities, rng = make_entity_list(300)
+    for _ in range(300):
+        move(entities, rng.choice(list(entities)),
+             (rng.randrange(WIDTH), rng.randrange(HEIGHT)))
+    for entity in rng.sample(list(entities), 100):
+        entities.remove(entity)
+    for x in range(WIDTH):
+        for y in range(HEIGHT):
+            assert set(entities.get_entities_in_position((x, y))) == {
+                e for e in entities if (e.x, e.y) == (x, y)}
+    # Only the occupied positions are held.
+    assert set(entities.coordinate_map) == {(e.x, e.y) for e in entities}
+
+
+def distance(entity, position):
+    return math.hypot(entity.x - position[0], entity.y - position[1])
+
+
+@pytest.mark.parametrize("radius", [0, 1, 2.5, 7, 12, 100])
+def test_within_radius_matches_brute_force(radius):
+    entities, rng = make_entity_list(200)
+    for _ in range(20):
+        position = (rng.randrange(WIDTH), rng.randrange(HEIGHT))
+        expected = {e for e in entities if distance(e, position) <= radius}
+        assert set(entities.within_radius(position, radius)) == expected
+
+
+def test_within_radius_predicate():
+    entities, _ = make_entity_list(200)
+    predicate = lambda e: e.render_order == RenderOrder.ACTOR
+    expected = {
+        e for e in entities if distance(e, (20, 15)) <= 10 and predicate(e)}
+    assert set(entities.within_radius((20, 15), 10, predicate)) == expected
+
+
+@pytest.mark.parametrize("n", [1, 3, 10, 250])
+def test_nearest_matches_brute_force(n):
+    entities, rng = make_entity_list(200)
+    for _ in range(20):
+        position = (rng.randrange(WIDTH), rng.randrange(HEIGHT))
+        nearest = entities.nearest(position, n)
+        assert len(nearest) == min(n, len(entities))
+        expected = sorted(distance(e, position) for e in entities)[:n]
+        assert [distance(e, position) for e in nearest] == expected
+
+
+def test_nearest_with_no_entities_requested():
+    entities, _ = make_entity_list(20)
+    assert entities.nearest((0, 0), 0) == []
+    assert entities.nearest((0, 0), -1) == []
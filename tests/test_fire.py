@@ -0,0 +1,109 @@
+import random
+
+from components.commitable import BaseCommitable
+from entity import Entity
+from etc.enum import ResultTypes
+from game_objects.various import Fire
+from simulation.fire import fire_turn
+from turn_results import Result
+
+
+class RecordingBurnable:
+    def burn(self, game_map):
+        return [Result(ResultTypes.MESSAGE, self.owner)]
+
+
+def add_burnable(game_map, x, y):
+    entity = Entity(x, y, '"', (0, 255, 0), "Kindling",
+                    burnable=RecordingBurnable(),
+                    commitable=BaseCommitable())
+    entity.commitable.commit(game_map)
+    return entity
+
+
+def add_fire(game_map, x, y):
+    fire = Fire.make(game_map, x, y)
+    fire.commitable.commit(game_map)
+    return fire
+
+
+def burned(results):
+    return [r.data for r in results if r.type == ResultTypes.MESSAGE]
+
+
+def removed(results):
+    return [r.data for r in results if r.type == ResultTypes.REMOVE_ENTITY]
+
+
+def test_no_fires_no_results(open_map):
+    add_burnable(open_map, 5, 5)
+    assert fire_turn(open_map) == []
+
+
+def test_fires_burn_their_own_cell(open_map):
+    add_fire(open_map, 5, 5)
+    entities = [add_burnable(open_map, 5, 5) for _ in range(3)]
+    results = fire_turn(open_map, p_spread=0.0, p_dissipate=0.0)
+    assert burned(results) == entities
+
+
+def test_fires_spread_into_one_neighbour(open_map):
+    add_fire(open_map, 5, 5)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            if (dx, dy) != (0, 0):
+                for _ in range(2):
+                    add_burnable(open_map, 5 + dx, 5 + dy)
+    for _ in range(20):
+        results = fire_turn(open_map, p_spread=1.0, p_dissipate=0.0)
+        cells = {(e.x, e.y) for e in burned(results)}
+        assert len(cells) == 1
+        assert len(burned(results)) == 2
+
+
+def test_each_entity_burns_at_most_once(open_map):
+    # A cell targeted by several fires.
+    for x, y in [(4, 4), (4, 6), (6, 4), (6, 6), (5, 4), (5, 6)]:
+        add_fire(open_map, x, y)
+    add_fire(open_map, 5, 5)
+    add_burnable(open_map, 5, 5)
+    for _ in range(20):
+        results = fire_turn(open_map, p_spread=1.0, p_dissipate=0.0)
+        assert len(burned(results)) == len(set(burned(results)))
+
+
+def test_spread_is_rolled_per_entity(open_map):
+    # An entity next to a fire burns when the fire picks its cell (one in
+    # eight) and then rolls a spread, independently of its cellmates.
+    add_fire(open_map, 5, 5)
+    entities = [add_burnable(open_map, 6, 5) for _ in range(2)]
+    n_turns, p_spread = 4000, 0.5
+    counts = {entity: 0 for entity in entities}
+    n_both = 0
+    for _ in range(n_turns):
+        results = burned(fire_turn(open_map, p_spread, p_dissipate=0.0))
+        for entity in results:
+            counts[entity] += 1
+        n_both += len(results) == 2
+    for count in counts.values():
+        assert abs(count / n_turns - p_spread / 8) < 0.02
+    assert abs(n_both / n_turns - p_spread**2 / 8) < 0.015
+
+
+def test_fires_dissipate(open_map):
+    fires = [add_fire(open_map, x, 5) for x in range(2, 8)]
+    assert removed(fire_turn(open_map, p_dissipate=1.0)) == fires
+    assert removed(fire_turn(open_map, p_dissipate=0.0)) == []
+
+
+def test_fire_turns_are_reproducible_from_the_python_seed(open_map):
+    for x in range(2, 18, 3):
+        add_fire(open_map, x, 7)
+        for dx in (-1, 0, 1):
+            add_burnable(open_map, x + dx, 8)
+    def play(seed):
+        random.seed(seed)
+        return [(r.type, r.data) for _ in range(10)
+                for r in fire_turn(open_map, p_spread=0.5, p_dissipate=0.1)]
+    assert play(1) == play(1)
+    assert play(1) != play(2)
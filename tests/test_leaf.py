@@ -0,0 +1,92 @@
+import pytest
+
+import components.behaviour_trees.leaf as leaf
+from components.behaviour_trees.leaf import TravelToRandomPosition
+from game_objects.monsters import Orc
+
+
+@pytest.fixture
+def orc(open_map):
+    orc = Orc.make(2, 7)
+    orc.commitable.commit(open_map)
+    return orc
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    searches = []
+    get_shortest_path = leaf.get_shortest_path
+    def counting_get_shortest_path(game_map, source, target, **kwargs):
+        searches.append(source)
+        return get_shortest_path(game_map, source, target, **kwargs)
+    monkeypatch.setattr(leaf, "get_shortest_path", counting_get_shortest_path)
+    return searches
+
+
+def take_turn(travel, owner, game_map):
+    _, results = travel.tick(owner, game_map)
+    for result in results:
+        _, target_x, target_y = result.data
+        owner.movable.move_towards(game_map, target_x, target_y)
+    return results
+
+
+def make_travel(target_position):
+    travel = TravelToRandomPosition()
+    travel.target_position = target_position
+    return travel
+
+
+def test_travel_keeps_its_path_between_turns(open_map, orc, searches):
+    travel = make_travel((17, 7))
+    for turn in range(10):
+        position = (orc.x, orc.y)
+        take_turn(travel, orc, open_map)
+        assert max(abs(orc.x - position[0]), abs(orc.y - position[1])) == 1
+    assert len(searches) == 1
+    assert orc.x == 12
+
+
+def test_travel_repairs_its_path_when_the_next_square_is_blocked(
+        open_map, orc, searches):
+    travel = make_travel((17, 7))
+    take_turn(travel, orc, open_map)
+    # The path still starts at the square the orc moved from.
+    blocker = Orc.make(*travel.path[2])
+    blocker.commitable.commit(open_map)
+    take_turn(travel, orc, open_map)
+    assert len(searches) == 2
+    assert (orc.x, orc.y) != (blocker.x, blocker.y)
+
+
+def test_travel_repairs_its_path_when_the_routing_mask_changes(
+        open_map, orc, searches):
+    travel = make_travel((17, 7))
+    take_turn(travel, orc, open_map)
+    x, y = travel.path[2]
+    open_map.water[x, y] = True
+    open_map.bump_version("water")
+    take_turn(travel, orc, open_map)
+    assert len(searches) == 2
+    assert not open_map.water[orc.x, orc.y]
+    # Changes to layers the owner does not avoid keep the path.
+    open_map.bump_version("shrub")
+    take_turn(travel, orc, open_map)
+    assert len(searches) == 2
+
+
+def test_travel_repairs_its_path_when_knocked_off_it(open_map, orc, searches):
+    travel = make_travel((17, 7))
+    take_turn(travel, orc, open_map)
+    orc.movable.set_position_if_able(open_map, orc.x, orc.y + 3)
+    take_turn(travel, orc, open_map)
+    assert len(searches) == 2
+
+
+def test_move_towards_an_adjacent_square_respects_routing(open_map, orc):
+    open_map.fire[3, 7] = True
+    open_map.bump_version("fire")
+    orc.movable.move_towards(open_map, 3, 7)
+    assert (orc.x, orc.y) == (2, 7)
+    orc.movable.move_towards(open_map, 3, 8)
+    assert (orc.x, orc.y) == (3, 8)
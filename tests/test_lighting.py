@@ -0,0 +1,83 @@
+import numpy as np
+
+from game_objects.various import Fire
+from map import LightMap
+from simulation.lighting import update_lighting
+
+
+def ring(center, radius):
+    """The tiles at an L1 distance of radius, as the original illuminate."""
+    x, y = center
+    ring = set()
+    for i in range(radius + 1):
+        ring.update([(x + radius - i, y + i), (x - radius + i, y - i),
+                     (x - radius + i, y + i), (x + radius - i, y - i)])
+    return ring
+
+
+def brute_force_counts(shape, sources):
+    counts = np.zeros(shape, dtype=int)
+    width, height = shape
+    for x, y, radius in sources:
+        lit = set()
+        for r in range(radius + 2):
+            lit.update(ring((x, y), r))
+        for lx, ly in lit:
+            if 0 <= lx < width and 0 <= ly < height:
+                counts[lx, ly] += 1
+    return counts
+
+
+def test_light_map_matches_brute_force():
+    rng = np.random.default_rng(0)
+    shape = (30, 20)
+    lights = LightMap(shape)
+    sources = {}
+    for source in range(60):
+        # Sources near the edges have their stencils clipped.
+        x, y = int(rng.integers(-2, 32)), int(rng.integers(-2, 22))
+        sources[source] = (x, y, int(rng.integers(0, 5)))
+        lights.add(source, *sources[source])
+        if rng.random() < 0.3:
+            removed = int(rng.choice(list(sources)))
+            lights.remove(removed)
+            del sources[removed]
+        assert (lights.counts == brute_force_counts(
+            shape, sources.values())).all()
+
+
+def illuminated_by(game_map, fires):
+    return brute_force_counts(
+        game_map.illuminated.shape,
+        [(f.x, f.y, f.illuminatable.radius) for f in fires]) > 0
+
+
+def test_update_lighting_follows_the_light_sources(open_map):
+    fires = [Fire.make(open_map, x, y) for x, y in [(2, 2), (8, 5), (17, 12)]]
+    for fire in fires:
+        fire.commitable.commit(open_map)
+    update_lighting(open_map)
+    assert (open_map.illuminated == illuminated_by(open_map, fires)).all()
+    # Move a light source.
+    moved = fires[1]
+    old_position = (moved.x, moved.y)
+    moved.x, moved.y = 12, 9
+    open_map.entities.update_position(moved, old_position, (12, 9))
+    update_lighting(open_map)
+    assert (open_map.illuminated == illuminated_by(open_map, fires)).all()
+    # Remove a light source.
+    fires[0].commitable.delete(open_map)
+    update_lighting(open_map)
+    assert (open_map.illuminated == illuminated_by(open_map, fires[1:])).all()
+
+
+def test_update_lighting_skips_unchanged_sources(open_map, monkeypatch):
+    fire = Fire.make(open_map, 5, 5)
+    fire.commitable.commit(open_map)
+    update_lighting(open_map)
+    stamps = []
+    monkeypatch.setattr(
+        open_map.lights, "_stamp", lambda *args: stamps.append(args))
+    update_lighting(open_map)
+    assert stamps == []
+    assert open_map.illuminated.any()
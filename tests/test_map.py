@@ -0,0 +1,207 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from conftest import update_fov
+from display.backends import ArrayConsole
+from etc.colors import COLORS
+from etc.config import FOV_CONFIG
+from game_objects.terrain import Shrub
+from map import ColorArray, horizontal_runs
+
+
+def brute_force_runs(mask):
+    runs = []
+    width, height = mask.shape
+    for y in range(height):
+        x = 0
+        while x < width:
+            if mask[x, y]:
+                start = x
+                while x < width and mask[x, y]:
+                    x += 1
+                runs.append((start, y, x - start))
+            else:
+                x += 1
+    return runs
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (1, 7), (7, 1), (40, 25)])
+def test_horizontal_runs_match_brute_force(shape):
+    rng = np.random.default_rng(0)
+    for p_true in (0.0, 0.2, 0.5, 0.8, 1.0):
+        mask = rng.random(shape) < p_true
+        runs = list(horizontal_runs(mask))
+        assert sorted(runs) == sorted(brute_force_runs(mask))
+
+
+def per_tile_floor_colors(game_map, explored):
+    """The background colors of the original tile by tile floor renderer."""
+    colors = {}
+    for x in range(game_map.width):
+        for y in range(game_map.height):
+            wall = game_map.is_wall(x, y)
+            if game_map.visible(x, y):
+                colors[x, y] = COLORS['light_wall' if wall else 'light_ground']
+            elif explored[x, y]:
+                colors[x, y] = COLORS['dark_wall' if wall else 'dark_ground']
+    return colors
+
+
+def test_floor_layout_matches_per_tile_rendering(game_map):
+    rng = np.random.default_rng(0)
+    shape = (game_map.width, game_map.height)
+    game_map.fov[:, :] = rng.random(shape) < 0.3
+    game_map.illuminated[:, :] = rng.random(shape) < 0.1
+    game_map.explored[:, :] = rng.random(shape) < 0.5
+    expected = per_tile_floor_colors(game_map, game_map.explored.copy())
+    visible = game_map.fov | (game_map.illuminated != 0)
+    game_map.update_and_draw_floor_layout(visible, np.ones(shape, dtype=bool))
+    console = game_map.console
+    for (x, y), color in expected.items():
+        assert game_map.bg_colors[x, y] == tuple(color)
+        assert tuple(console.bg[x, y].tolist()) == tuple(color)
+        assert console.chars[x, y] == ' '
+    assert (game_map.explored != 0).sum() == len(expected)
+
+
+class CountingConsole(ArrayConsole):
+    """An ArrayConsole that counts the tiles drawn to it."""
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.n_drawn = 0
+
+    def _fill(self, x, y, width, height, char, fg, bg):
+        self.n_drawn += width * height
+        super()._fill(x, y, width, height, char, fg, bg)
+
+
+def full_render(game_map):
+    """Draw the whole map to a fresh console, as the original renderer did
+    every frame.
+    """
+    console = game_map.console
+    game_map.console = ArrayConsole(console.width, console.height)
+    game_map.dirty.mark_all()
+    game_map.update_and_draw_all()
+    full, game_map.console = game_map.console, console
+    return full
+
+
+def open_neighbour(game_map, entity):
+    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1)]:
+        x, y = entity.x + dx, entity.y + dy
+        if game_map.walkable[x, y] and not game_map.blocked[x, y]:
+            return dx, dy
+
+
+def test_render_with_nothing_dirty_draws_nothing(game_map, player):
+    game_map.update_and_draw_all()
+    game_map.console = CountingConsole(
+        game_map.console.width, game_map.console.height)
+    game_map.update_and_draw_all()
+    assert game_map.console.n_drawn == 0
+
+
+def test_moving_marks_only_the_old_and_new_tiles(game_map, player):
+    game_map.update_and_draw_all()
+    old_position = (player.x, player.y)
+    player.movable.move(game_map, *open_neighbour(game_map, player))
+    assert sorted(zip(*np.nonzero(game_map.dirty.mask))) == sorted(
+        [old_position, (player.x, player.y)])
+
+
+def test_incremental_render_matches_full_render(game_map, player):
+    rng = np.random.default_rng(0)
+    game_map.update_and_draw_all()
+    for _ in range(30):
+        dx, dy = open_neighbour(game_map, player)
+        player.movable.move(game_map, dx, dy)
+        update_fov(game_map, player)
+        if rng.random() < 0.3:
+            # Transient drawing is restored on the next render.
+            game_map.draw_char(player.x, player.y, 'X', bg=(1, 2, 3))
+        game_map.update_and_draw_all()
+        full = full_render(game_map)
+        assert (game_map.console.chars == full.chars).all()
+        assert (game_map.console.bg == full.bg).all()
+        # The foreground of blank tiles is never seen.
+        shown = full.chars != ' '
+        assert (game_map.console.fg[shown] == full.fg[shown]).all()
+
+
+def test_color_array_matches_nested_lists():
+    rng = np.random.default_rng(0)
+    width, height = 12, 8
+    colors = ColorArray((width, height))
+    # The original map colors: a nested list of tuples, or None where unset.
+    expected = [[(0, 0, 0)] * height for _ in range(width)]
+    random_color = lambda: tuple(rng.integers(256, size=3).tolist())
+    for _ in range(200):
+        write = rng.integers(4)
+        if write == 0:
+            x, y = int(rng.integers(width)), int(rng.integers(height))
+            color = random_color() if rng.random() < 0.8 else None
+            colors[x, y] = color
+            expected[x][y] = color
+        else:
+            mask = rng.random((width, height)) < 0.2
+            if write == 1:
+                value = random_color()
+            elif write == 2:
+                value = None
+            else:
+                value = rng.integers(256, size=(mask.sum(), 3))
+            colors[mask] = value
+            for i, (x, y) in enumerate(zip(*np.nonzero(mask))):
+                expected[x][y] = (
+                    tuple(value[i].tolist()) if write == 3 else value)
+    for x in range(width):
+        for y in range(height):
+            assert colors[x, y] == expected[x][y]
+
+
+def test_dirty_tiles_occupied_positions(game_map):
+    game_map.dirty.clear()
+    occupied = [position for position in product(
+        range(game_map.width), range(game_map.height))
+        if game_map.entities.get_entities_in_position(position)]
+    dirty = occupied[::3] + [(0, 0), (1, 0)]
+    for x, y in dirty:
+        game_map.dirty.mark(x, y)
+    assert sorted(game_map.dirty.occupied_positions(game_map.entities)) == (
+        sorted(set(dirty) & set(occupied)))
+
+
+def test_fov_is_recomputed_only_when_its_inputs_change(
+        game_map, player, monkeypatch):
+    calls = []
+    compute_fov = game_map.compute_fov
+    def counting_compute_fov(*args, **kwargs):
+        calls.append(args)
+        compute_fov(*args, **kwargs)
+    monkeypatch.setattr(game_map, "compute_fov", counting_compute_fov)
+    update_fov(game_map, player)
+    assert calls == []
+    player.movable.move(game_map, *open_neighbour(game_map, player))
+    update_fov(game_map, player)
+    update_fov(game_map, player)
+    assert len(calls) == 1
+    game_map.update_fov(
+        player.x, player.y, fov=FOV_CONFIG["algorithm"], radius=2,
+        light_walls=FOV_CONFIG["light_walls"])
+    assert len(calls) == 2
+    update_fov(game_map, player)
+    assert len(calls) == 3
+    # Blocking the view next to the player changes the fov.
+    dx, dy = open_neighbour(game_map, player)
+    shrub = Shrub.make(game_map, player.x + dx, player.y + dy)
+    shrub.commitable.commit(game_map)
+    update_fov(game_map, player)
+    assert len(calls) == 4
+    cached = game_map.fov.copy()
+    game_map.compute_fov(
+        player.x, player.y, fov=FOV_CONFIG["algorithm"],
+        radius=FOV_CONFIG["radius"], light_walls=FOV_CONFIG["light_walls"])
+    assert (game_map.fov == cached).all()
@@ -0,0 +1,292 @@
+import random
+import sys
+from collections import Counter, deque
+from types import ModuleType, SimpleNamespace
+
+import numpy as np
+import pytest
+
+import pathfinding
+from etc.enum import RoutingOptions
+from pathfinding import (
+    UNREACHABLE, DijkstraMapCache, FlowFields, OpenCells, Regions,
+    RoutingMasks, label_regions, make_distance_field)
+from utils.geometry import ADJACENT_DX, ADJACENT_DY
+
+
+def make_game_map(walkable):
+    """Just the parts of a game map that routing reads."""
+    layer = lambda: np.zeros(walkable.shape, dtype=np.int8)
+    return SimpleNamespace(
+        width=walkable.shape[0], height=walkable.shape[1],
+        walkable=walkable.astype(np.int8), blocked=layer(), door=layer(),
+        water=layer(), fire=layer(), steam=layer(), versions=Counter(),
+        upward_stairs_position=None, downward_stairs_position=None,
+        routing_masks=RoutingMasks(), regions=Regions())
+
+
+def random_walkable(rng, shape, p_open):
+    return rng.random(shape) < p_open
+
+
+def bfs_distances(walkable, root):
+    """A square by square breadth first search."""
+    width, height = walkable.shape
+    distances = np.full(walkable.shape, UNREACHABLE, dtype=np.int32)
+    distances[root] = 0
+    queue = deque([root])
+    while queue:
+        x, y = queue.popleft()
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                nx, ny = x + dx, y + dy
+                if (0 <= nx < width and 0 <= ny < height
+                    and walkable[nx, ny]
+                    and distances[nx, ny] == UNREACHABLE):
+                    distances[nx, ny] = distances[x, y] + 1
+                    queue.append((nx, ny))
+    return distances
+
+
+@pytest.mark.parametrize("p_open", [0.3, 0.6, 0.9])
+def test_distance_field_matches_bfs(p_open):
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        walkable = random_walkable(rng, (25, 15), p_open)
+        root = (int(rng.integers(25)), int(rng.integers(15)))
+        assert (make_distance_field(walkable, root)
+                == bfs_distances(walkable, root)).all()
+
+
+def test_flow_field_steps_descend_to_root():
+    rng = np.random.default_rng(2)
+    walkable = random_walkable(rng, (30, 20), 0.7)
+    root = (15, 10)
+    walkable[root] = True
+    game_map = make_game_map(walkable)
+    flow_fields = FlowFields()
+    flow_fields.reset(root)
+    distances = bfs_distances(walkable, root)
+    for x, y in zip(*np.nonzero(walkable)):
+        if (x, y) == root:
+            continue
+        step = flow_fields.next_step(game_map, (x, y))
+        if distances[x, y] in (1, UNREACHABLE):
+            assert step is None
+        else:
+            assert distances[step] == distances[x, y] - 1
+
+
+def test_flow_field_steps_around_monsters_blocking_the_way():
+    rng = np.random.default_rng(4)
+    walkable = random_walkable(rng, (30, 20), 0.8)
+    root = (15, 10)
+    walkable[root] = True
+    game_map = make_game_map(walkable)
+    flow_fields = FlowFields()
+    flow_fields.reset(root)
+    avoid_monsters = [RoutingOptions.AVOID_MONSTERS]
+    distances = bfs_distances(walkable, root)
+    for _ in range(20):
+        # The monsters move between steps, after the field is built.
+        game_map.blocked[:, :] = walkable & (rng.random(walkable.shape) < 0.3)
+        game_map.blocked[root] = True
+        for x, y in zip(*np.nonzero(walkable)):
+            if distances[x, y] in (0, 1, UNREACHABLE):
+                continue
+            step = flow_fields.next_step(game_map, (x, y), avoid_monsters)
+            free = [
+                (x + dx, y + dy) for dx, dy in zip(ADJACENT_DX, ADJACENT_DY)
+                if 0 <= x + dx < 30 and 0 <= y + dy < 20
+                and distances[x + dx, y + dy] == distances[x, y] - 1
+                and not game_map.blocked[x + dx, y + dy]]
+            if free:
+                assert step in free
+            else:
+                assert step is None
+    assert list(flow_fields.fields) == [frozenset()]
+
+
+class FakeDijkstraMap:
+    builds = []
+
+    def __init__(self, walkable):
+        pass
+
+    def set_square_sources(self, target, radius):
+        self.key = (target, radius)
+
+    def build(self):
+        self.builds.append(self.key)
+
+
+@pytest.fixture
+def fake_dijkstra_map(monkeypatch):
+    """Stand in for the dijkstra_map package, which is imported lazily."""
+    package = ModuleType("dijkstra_map")
+    module = ModuleType("dijkstra_map.dijkstra_map")
+    module.DijkstraMap = FakeDijkstraMap
+    package.dijkstra_map = module
+    monkeypatch.setitem(sys.modules, "dijkstra_map", package)
+    monkeypatch.setitem(sys.modules, "dijkstra_map.dijkstra_map", module)
+    FakeDijkstraMap.builds = []
+    return FakeDijkstraMap
+
+
+def test_dijkstra_map_cache_evicts_least_recently_used(fake_dijkstra_map):
+    game_map = make_game_map(np.ones((10, 10), dtype=bool))
+    cache = DijkstraMapCache(maxsize=3)
+    # A reference least recently used cache of the targets.
+    cached, expected_builds = [], []
+    rng = np.random.default_rng(3)
+    for _ in range(200):
+        target = (int(rng.integers(5)), 0)
+        if target in cached:
+            cached.remove(target)
+        else:
+            expected_builds.append((target, 1))
+            if len(cached) == 3:
+                cached.pop(0)
+        cached.append(target)
+        cache.get(game_map, target, 1, [])
+    assert fake_dijkstra_map.builds == expected_builds
+    assert len(cache.maps) == 3
+
+
+def test_dijkstra_map_cache_rebuilds_when_the_mask_changes(fake_dijkstra_map):
+    game_map = make_game_map(np.ones((10, 10), dtype=bool))
+    cache = DijkstraMapCache()
+    avoid_water = [RoutingOptions.AVOID_WATER]
+    cache.get(game_map, (1, 1), 1, avoid_water)
+    game_map.versions["fire"] += 1
+    cache.get(game_map, (1, 1), 1, avoid_water)
+    assert len(fake_dijkstra_map.builds) == 1
+    game_map.versions["water"] += 1
+    cache.get(game_map, (1, 1), 1, avoid_water)
+    assert len(fake_dijkstra_map.builds) == 2
+    # Other radii and profiles have maps of their own.
+    cache.get(game_map, (1, 1), 2, avoid_water)
+    cache.get(game_map, (1, 1), 1, [])
+    assert len(fake_dijkstra_map.builds) == 4
+
+
+def draw_positions(game_map, n, **kwargs):
+    open_cells = OpenCells()
+    return [open_cells.random_position(game_map, **kwargs) for _ in range(n)]
+
+
+def test_open_cells_pick_only_open_squares():
+    rng = np.random.default_rng(5)
+    walkable = random_walkable(rng, (8, 6), 0.7)
+    game_map = make_game_map(walkable)
+    game_map.water[:, :] = rng.random(walkable.shape) < 0.3
+    game_map.blocked[:, :] = walkable & (rng.random(walkable.shape) < 0.2)
+    random.seed(0)
+    positions = draw_positions(
+        game_map, 2000, routing_avoid=[RoutingOptions.AVOID_WATER])
+    free = walkable & (game_map.water == 0) & (game_map.blocked == 0)
+    assert set(positions) == set(zip(*np.nonzero(free)))
+    positions = draw_positions(game_map, 2000, avoid_monsters=False)
+    assert set(positions) == set(zip(*np.nonzero(walkable)))
+
+
+def test_open_cells_on_a_crowded_map():
+    game_map = make_game_map(np.ones((10, 10), dtype=bool))
+    game_map.blocked[:, :] = True
+    assert draw_positions(game_map, 1) == [None]
+    game_map.blocked[4, 6] = False
+    assert draw_positions(game_map, 10) == [(4, 6)] * 10
+    assert draw_positions(make_game_map(np.zeros((5, 5), dtype=bool)), 1) == [
+        None]
+
+
+def test_open_cells_reachable_from():
+    walkable = np.ones((10, 5), dtype=bool)
+    walkable[5, :] = False
+    game_map = make_game_map(walkable)
+    positions = draw_positions(game_map, 200, reachable_from=(8, 2))
+    assert {x for x, y in positions} == {6, 7, 8, 9}
+
+
+def test_open_cells_follow_the_routing_mask():
+    game_map = make_game_map(np.ones((6, 6), dtype=bool))
+    open_cells = OpenCells()
+    avoid_fire = [RoutingOptions.AVOID_FIRE]
+    open_cells.random_position(game_map, avoid_fire)
+    game_map.fire[:, :3] = True
+    game_map.versions["fire"] += 1
+    positions = [open_cells.random_position(game_map, avoid_fire)
+                 for _ in range(100)]
+    assert all(y >= 3 for x, y in positions)
+
+
+def test_open_cells_are_reproducible():
+    game_map = make_game_map(np.ones((20, 20), dtype=bool))
+    game_map.blocked[::2, :] = True
+    draws = []
+    for _ in range(2):
+        random.seed(1)
+        draws.append(draw_positions(game_map, 50))
+    assert draws[0] == draws[1]
+
+
+@pytest.mark.parametrize("p_open", [0.3, 0.5, 0.7, 1.0])
+def test_label_regions_matches_reachability(p_open):
+    rng = np.random.default_rng(1)
+    for _ in range(10):
+        walkable = random_walkable(rng, (20, 12), p_open)
+        labels = label_regions(walkable)
+        assert ((labels == 0) == ~walkable).all()
+        unlabelled = walkable.copy()
+        while unlabelled.any():
+            root = tuple(np.argwhere(unlabelled)[0])
+            reachable = bfs_distances(walkable, root) != UNREACHABLE
+            assert (reachable == (labels == labels[root])).all()
+            unlabelled &= ~reachable
+
+
+def test_label_regions_serpentine():
+    # A single corridor snaking back and forth across the map.
+    walkable = np.zeros((100, 50), dtype=bool)
+    walkable[:, ::2] = True
+    for y in range(1, 50, 2):
+        walkable[99 if y % 4 == 1 else 0, y] = True
+    labels = label_regions(walkable)
+    assert set(np.unique(labels).tolist()) == {0, 1}
+
+
+def test_regions_only_relabel_when_a_profile_mask_changes(monkeypatch):
+    n_labellings = []
+    def counting_label_regions(walkable):
+        n_labellings.append(1)
+        return label_regions(walkable)
+    monkeypatch.setattr(pathfinding, "label_regions", counting_label_regions)
+    game_map = make_game_map(np.ones((10, 10), dtype=bool))
+    regions = Regions()
+    avoid_fire = [RoutingOptions.AVOID_FIRE]
+    regions.get(game_map, [])
+    regions.get(game_map, avoid_fire)
+    assert len(n_labellings) == 2
+    game_map.fire[3, 3] = True
+    game_map.versions["fire"] += 1
+    regions.get(game_map, [])
+    assert len(n_labellings) == 2
+    regions.get(game_map, avoid_fire)
+    assert len(n_labellings) == 3
+    # A bump that leaves the mask unchanged.
+    game_map.versions["walkable"] += 1
+    regions.get(game_map, [])
+    regions.get(game_map, avoid_fire)
+    assert len(n_labellings) == 3
+
+
+def test_regions_connected():
+    walkable = np.ones((10, 5), dtype=bool)
+    walkable[5, :] = False
+    game_map = make_game_map(walkable)
+    regions = Regions()
+    assert regions.connected(game_map, (0, 0), (4, 4))
+    assert not regions.connected(game_map, (0, 0), (9, 4))
+    # Squares that are not open themselves join their neighbours' regions.
+    assert regions.connected(game_map, (5, 2), (9, 4))
+    assert regions.connected(game_map, (5, 2), (0, 0))
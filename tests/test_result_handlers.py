@@ -0,0 +1,88 @@
+from collections import deque
+
+from etc.config import MESSAGE_CONFIG
+from etc.enum import GameStates, ResultTypes
+from messages import Message, MessageLog
+from result_handlers import (
+    ENEMY_TURN_HANDLERS, PLAYER_TURN_HANDLERS, HandlerStats, TurnContext,
+    process_results)
+from turn_results import Result, ResultQueue
+
+
+# The result types handled by the if chains of the original game loop.
+ORIGINAL_PLAYER_TURN_TYPES = {
+    ResultTypes.RESTORE_PLAYER_INPUT, ResultTypes.ANIMATION,
+    ResultTypes.CURSOR_MODE, ResultTypes.MOVE,
+    ResultTypes.MOVE_TO_RANDOM_POSITION, ResultTypes.SET_POSITION,
+    ResultTypes.MESSAGE, ResultTypes.ADD_ITEM_TO_INVENTORY,
+    ResultTypes.DISCARD_ITEM, ResultTypes.DROP_ITEM_FROM_INVENTORY,
+    ResultTypes.DAMAGE, ResultTypes.HARM, ResultTypes.INCREASE_MAX_HP,
+    ResultTypes.INCREASE_ATTACK_POWER, ResultTypes.EQUIP_ARMOR,
+    ResultTypes.EQUIP_WEAPON, ResultTypes.REMOVE_ARMOR,
+    ResultTypes.REMOVE_WEAPON, ResultTypes.CONFUSE, ResultTypes.DOUBLE_SPEED,
+    ResultTypes.FREEZE, ResultTypes.ADD_ENTITY, ResultTypes.REMOVE_ENTITY,
+    ResultTypes.DEAD_ENTITY, ResultTypes.DEATH_MESSAGE, ResultTypes.END_TURN}
+ORIGINAL_ENEMY_TURN_TYPES = {
+    ResultTypes.SET_POSITION, ResultTypes.MOVE_TOWARDS,
+    ResultTypes.MOVE_RANDOM_ADJACENT, ResultTypes.MESSAGE, ResultTypes.DAMAGE,
+    ResultTypes.HARM, ResultTypes.RECHARGE_ITEM,
+    ResultTypes.CHANGE_SWIM_STAMINA, ResultTypes.ADD_ENTITY,
+    ResultTypes.REMOVE_ENTITY, ResultTypes.DEAD_ENTITY}
+
+
+def make_context(game_map, player, stats=None):
+    return TurnContext(
+        game_map, player, MessageLog(MESSAGE_CONFIG), deque(maxlen=3),
+        game_turn=0, stats=stats)
+
+
+def test_dispatch_tables_handle_the_original_result_types():
+    assert set(PLAYER_TURN_HANDLERS) == ORIGINAL_PLAYER_TURN_TYPES
+    assert set(ENEMY_TURN_HANDLERS) == ORIGINAL_ENEMY_TURN_TYPES
+
+
+def test_types_handled_in_both_phases_share_a_handler():
+    shared = set(PLAYER_TURN_HANDLERS) & set(ENEMY_TURN_HANDLERS)
+    # Entities added during the player's turn also encroach on their
+    # cellmates.
+    shared.discard(ResultTypes.ADD_ENTITY)
+    for result_type in shared:
+        assert (PLAYER_TURN_HANDLERS[result_type]
+                is ENEMY_TURN_HANDLERS[result_type])
+
+
+def test_process_results_stops_after_a_death_message(game_map, player):
+    context = make_context(game_map, player)
+    results = ResultQueue([
+        Result(ResultTypes.DEATH_MESSAGE, Message("unprocessed")),
+        Result(ResultTypes.DEATH_MESSAGE, Message("dead")),
+        Result(ResultTypes.END_TURN, True),
+        Result(ResultTypes.MESSAGE, Message("hit"))])
+    process_results(context, results, PLAYER_TURN_HANDLERS)
+    assert [m.text for m in context.message_log.messages] == ["hit", "dead"]
+    assert context.game_turn == 1
+    assert context.game_state == GameStates.POST_PLAYER_TURN
+    assert len(results) == 1
+
+
+def test_process_results_discards_unhandled_types(game_map, player):
+    stats = HandlerStats()
+    context = make_context(game_map, player, stats)
+    results = ResultQueue([
+        Result(ResultTypes.END_TURN, True),
+        Result(ResultTypes.MESSAGE, Message("enemy"))])
+    process_results(context, results, ENEMY_TURN_HANDLERS)
+    assert not results
+    assert context.game_turn == 0
+    assert [m.text for m in context.message_log.messages] == ["enemy"]
+    assert dict(stats.counts) == {ResultTypes.MESSAGE: 1}
+
+
+def test_process_results_stops_in_stop_states(game_map, player):
+    context = make_context(game_map, player)
+    context.enter_state(GameStates.CURSOR_INPUT)
+    results = ResultQueue([Result(ResultTypes.MESSAGE, Message("later"))])
+    process_results(context, results, PLAYER_TURN_HANDLERS,
+                    stop_states=(GameStates.CURSOR_INPUT,))
+    assert len(results) == 1
+    assert context.message_log.messages == []
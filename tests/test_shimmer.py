@@ -0,0 +1,83 @@
+import random
+
+from game_objects.terrain import Water
+from game_objects.various import Steam
+from simulation.shimmer import shimmer_all
+
+
+def add_water(game_map, positions):
+    waters = [Water.make(game_map, x, y) for x, y in positions]
+    for water in waters:
+        water.commitable.commit(game_map)
+    return waters
+
+
+def colors(entity):
+    return (entity.fg_color, entity.bg_color,
+            entity.dark_fg_color, entity.dark_bg_color)
+
+
+def test_shimmer_stores_colors_on_visible_entities(open_map):
+    lit, dark, unseen = add_water(open_map, [(3, 3), (5, 5), (7, 7)])
+    open_map.fov[3, 3] = True
+    dark.seen = True
+    open_map.update_and_draw_all()
+    before = {water: colors(water) for water in (lit, dark, unseen)}
+    shimmer_all(open_map)
+    # Visible tiles shimmer their light colors, seen tiles out of view their
+    # dark colors, and tiles never seen do not shimmer at all.
+    assert colors(lit)[:2] != before[lit][:2]
+    assert colors(lit)[2:] == before[lit][2:]
+    assert colors(dark)[:2] == before[dark][:2]
+    assert colors(dark)[2:] != before[dark][2:]
+    assert colors(unseen) == before[unseen]
+    console = open_map.console
+    assert tuple(console.fg[3, 3].tolist()) == lit.fg_color
+    assert tuple(console.bg[3, 3].tolist()) == lit.bg_color
+    assert tuple(console.bg[5, 5].tolist()) == dark.dark_bg_color
+    assert open_map.bg_colors[3, 3] == lit.bg_color
+
+
+def test_covered_entities_do_not_shimmer(open_map):
+    water, = add_water(open_map, [(3, 3)])
+    steam = Steam.make(open_map, 3, 3)
+    steam.commitable.commit(open_map)
+    open_map.fov[:, :] = True
+    before = colors(water)
+    shimmer_all(open_map)
+    assert colors(water) == before
+
+
+def test_redrawing_a_tile_keeps_its_shimmer(open_map):
+    water, = add_water(open_map, [(3, 3)])
+    open_map.fov[:, :] = True
+    open_map.update_and_draw_all()
+    shimmer_all(open_map)
+    shimmered = (water.fg_color, water.bg_color)
+    open_map.dirty.mark(3, 3)
+    open_map.update_and_draw_all()
+    console = open_map.console
+    assert tuple(console.fg[3, 3].tolist()) == shimmered[0]
+    assert tuple(console.bg[3, 3].tolist()) == shimmered[1]
+
+
+def test_shimmer_without_shimmering_entities_draws_nothing(open_map):
+    open_map.fov[:, :] = True
+    open_map.update_and_draw_all()
+    console = open_map.console
+    drawn = console.chars.copy(), console.fg.copy(), console.bg.copy()
+    shimmer_all(open_map)
+    assert (console.chars == drawn[0]).all()
+    assert (console.fg == drawn[1]).all()
+    assert (console.bg == drawn[2]).all()
+
+
+def test_shimmer_is_reproducible(open_map):
+    waters = add_water(open_map, [(x, 4) for x in range(2, 12)])
+    open_map.fov[:, :] = True
+    shimmered = []
+    for _ in range(2):
+        random.seed(1)
+        shimmer_all(open_map)
+        shimmered.append([colors(water) for water in waters])
+    assert shimmered[0] == shimmered[1]
@@ -0,0 +1,89 @@
+import random
+
+from components.commitable import BaseCommitable
+from entity import Entity
+from etc.enum import ResultTypes
+from game_objects.various import Steam
+from simulation.steam import SPREAD_DECAY, steam_turn
+from turn_results import Result
+
+
+class RecordingScaldable:
+    def scald(self, game_map):
+        return [Result(ResultTypes.MESSAGE, self.owner)]
+
+
+def add_steam(game_map, x, y, p_spread=0.0, p_dissipate=0.0):
+    steam = Steam.make(game_map, x, y, p_spread=p_spread,
+                       p_dissipate=p_dissipate)
+    steam.commitable.commit(game_map)
+    return steam
+
+
+def added(results):
+    return {(r.data.x, r.data.y): r.data
+            for r in results if r.type == ResultTypes.ADD_ENTITY}
+
+
+def removed(results):
+    return [r.data for r in results if r.type == ResultTypes.REMOVE_ENTITY]
+
+
+def test_no_steam_no_results(open_map):
+    assert steam_turn(open_map) == []
+
+
+def test_steam_spreads_into_open_neighbours(open_map):
+    add_steam(open_map, 5, 5, p_spread=1.0, p_dissipate=0.2)
+    add_steam(open_map, 6, 6)
+    # The edges of the map are walls.
+    add_steam(open_map, 1, 1, p_spread=1.0)
+    new_steam = added(steam_turn(open_map, n_frames=10))
+    expected = {(5 + dx, 5 + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+    expected -= {(5, 5), (6, 6)}
+    expected |= {(1, 2), (2, 1), (2, 2)}
+    assert set(new_steam) == expected
+    steam_field = new_steam[4, 4].commitable
+    assert steam_field.p_spread == 1.0 - SPREAD_DECAY
+    assert steam_field.p_dissipate == 0.2 + SPREAD_DECAY
+
+
+def test_most_vigorous_source_wins(open_map):
+    add_steam(open_map, 4, 5, p_spread=1.0)
+    add_steam(open_map, 6, 5, p_spread=0.99)
+    for _ in range(10):
+        new_steam = added(steam_turn(open_map, n_frames=10))
+        assert new_steam[5, 5].commitable.p_spread == 1.0 - SPREAD_DECAY
+
+
+def test_steam_lingers_before_dissipating(open_map):
+    steam = add_steam(open_map, 5, 5, p_dissipate=1.0)
+    for _ in range(3):
+        assert removed(steam_turn(open_map, n_frames=3)) == []
+    assert removed(steam_turn(open_map, n_frames=3)) == [steam]
+
+
+def test_steam_scalds_its_cell(open_map):
+    add_steam(open_map, 5, 5)
+    scaldables = []
+    for x in (5, 6):
+        entity = Entity(x, 5, '@', (255, 255, 255), "Scaldable",
+                        scaldable=RecordingScaldable(),
+                        commitable=BaseCommitable())
+        entity.commitable.commit(open_map)
+        scaldables.append(entity)
+    results = steam_turn(open_map, n_frames=10)
+    scalded = [r.data for r in results if r.type == ResultTypes.MESSAGE]
+    assert scalded == scaldables[:1]
+
+
+def test_steam_turns_are_reproducible_from_the_python_seed(open_map):
+    for x in range(2, 18, 4):
+        add_steam(open_map, x, 7, p_spread=0.5, p_dissipate=0.5)
+    def play(seed):
+        random.seed(seed)
+        open_map.steam_field.age[:, :] = 0
+        return [(r.type, (r.data.x, r.data.y)) for _ in range(10)
+                for r in steam_turn(open_map, n_frames=2)]
+    assert play(1) == play(1)
+    assert play(1) != play(2)
@@ -0,0 +1,72 @@
+import random
+
+from etc.enum import ResultTypes
+from game_objects.terrain import NecroticSoil
+from map import CountdownTimers
+from simulation.timers import expire_timers
+
+
+class Dissipating:
+    """The original per entity countdown: nothing for n_turns turns, and then
+    a removal every turn until the entity is removed.
+    """
+    def __init__(self, n_turns):
+        self.n_turns = n_turns
+        self.turn = 0
+
+    def tick(self):
+        if self.turn < self.n_turns:
+            self.turn += 1
+            return False
+        return True
+
+
+def test_countdown_timers_match_per_entity_countdowns():
+    rng = random.Random(0)
+    # Start small, so the timers have to grow.
+    timers = CountdownTimers(capacity=4)
+    countdowns = {}
+    for turn in range(500):
+        for _ in range(rng.randrange(3)):
+            entity = rng.randrange(40)
+            n_turns = rng.randrange(6)
+            timers.set(entity, n_turns)
+            countdowns[entity] = Dissipating(n_turns)
+        if countdowns and rng.random() < 0.3:
+            entity = rng.choice(list(countdowns))
+            timers.clear(entity)
+            del countdowns[entity]
+        expired = timers.tick()
+        assert len(expired) == len(set(expired))
+        assert set(expired) == {
+            entity for entity, countdown in countdowns.items()
+            if countdown.tick()}
+        # Expired entities are removed from the map, which clears them.
+        for entity in expired:
+            if rng.random() < 0.8:
+                timers.clear(entity)
+                del countdowns[entity]
+
+
+def test_countdown_timers_are_per_entity():
+    timers = CountdownTimers()
+    timers.set("soil", 1)
+    timers.tick()
+    timers.set("more soil", 1)
+    assert timers.tick() == ["soil"]
+    timers.clear("soil")
+    assert timers.tick() == ["more soil"]
+
+
+def test_lingering_soil_is_removed_once_its_time_is_up(open_map):
+    soil = NecroticSoil.make(open_map, 5, 5)
+    soil.commitable.commit(open_map)
+    n_turns = soil.commitable.n_turns
+    for _ in range(n_turns):
+        assert expire_timers(open_map) == []
+    results = expire_timers(open_map)
+    assert [(r.type, r.data) for r in results] == [
+        (ResultTypes.REMOVE_ENTITY, soil)]
+    soil.commitable.delete(open_map)
+    assert soil not in open_map.entities
+    assert expire_timers(open_map) == []
@@ -0,0 +1,45 @@
+import random
+
+from etc.enum import ResultTypes
+from turn_results import Result, ResultQueue
+
+
+class SortedStack:
+    """The original result stack: sorted by type, with the last result popped
+    off the end.
+    """
+    def __init__(self):
+        self.results = []
+
+    def append(self, result):
+        self.results.append(result)
+
+    def pop(self):
+        self.results.sort(key=lambda result: result.type.value)
+        result = self.results.pop()
+        return result.type, result.data
+
+
+def test_result_queue_matches_sorted_stack():
+    rng = random.Random(0)
+    types = list(ResultTypes)
+    queue, stack = ResultQueue(), SortedStack()
+    for i in range(2000):
+        if stack.results and rng.random() < 0.4:
+            assert queue.pop() == stack.pop()
+        else:
+            result = Result(rng.choice(types), i)
+            queue.append(result)
+            stack.append(result)
+        assert len(queue) == len(stack.results)
+    while stack.results:
+        assert queue.pop() == stack.pop()
+    assert not queue
+
+
+def test_results_of_the_same_type_are_last_in_first_out():
+    queue = ResultQueue([
+        Result(ResultTypes.END_TURN, 1),
+        Result(ResultTypes.END_TURN, 2),
+        Result(ResultTypes.END_TURN, 3)])
+    assert [queue.pop()[1] for _ in range(3)] == [3, 2, 1]
@@ -0,0 +1,71 @@
+import heapq
+import itertools
+
+
+class Result:
+    """A single turn result.
+
+    Components and game events return lists of results, which are then
+    processed by the game loop in priority order.
+
+    Attributes
+    ----------
+    type: ResultTypes object
+      The type of the result, which determines how it is processed.
+
+    data: Any
+      The data needed to process the result.  See ResultTypes for the data
+      expected by each type.
+    """
+    __slots__ = ('type', 'data')
+
+    def __init__(self, type, data):
+        self.type = type
+        self.data = data
+
+    def __repr__(self):
+        return f"Result({self.type}, {self.data!r})"
+
+
+class ResultQueue:
+    """A priority queue of turn results.
+
+    Results are processed in priority order:
+
+      - Results with a higher ResultTypes value are processed first.
+      - Results of the same type are processed last in, first out.
+
+    This is the same order as repeatedly sorting a stack of results by type
+    and popping the last result, but each push and pop only costs O(log k).
+    """
+    def __init__(self, results=None):
+        self.heap = []
+        self.counter = itertools.count()
+        if results:
+            self.extend(results)
+
+    def append(self, result):
+        self._push(result.type, result.data)
+
+    def extend(self, results):
+        for result in results:
+            self.append(result)
+
+    def pop(self):
+        """Remove and return the next result as a (type, data) tuple."""
+        _, _, result_type, result_data = heapq.heappop(self.heap)
+        return result_type, result_data
+
+    def clear(self):
+        self.heap = []
+
+    def _push(self, result_type, result_data):
+        heapq.heappush(
+            self.heap,
+            (-result_type.value, -next(self.counter), result_type, result_data))
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
@@ -0,0 +1,124 @@
+"""
+Precomputed geometric stencils.
+
+A stencil is a pair of arrays of (dx, dy) offsets from a center tile.
+Stencils for each radius are computed once and cached, and are translated to
+a center and clipped to the bounds of the map to produce numpy index arrays:
+
+    xs, ys = disc_indices(game_map, center, radius)
+    game_map.walkable[xs, ys]
+
+All the radius effects in the game (blasts, illumination, spreading) share
+these stencils.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+# The number of stencils of each shape kept in the cache.
+STENCIL_CACHE_SIZE = 32
+
+# Offsets from a tile to each of its eight neighbours.
+ADJACENT_DX = np.array([-1, 0, 1, -1, 1, -1, 0, 1])
+ADJACENT_DY = np.array([1, 1, 1, 0, 0, -1, -1, -1])
+ADJACENT_DX.setflags(write=False)
+ADJACENT_DY.setflags(write=False)
+
+
+@lru_cache(maxsize=STENCIL_CACHE_SIZE)
+def circle_offsets(radius):
+    """The offsets of the tiles at exactly a given taxicab distance from the
+    center.
+    """
+    dx, dy = _offsets_within(radius)
+    on_circle = np.abs(dx) + np.abs(dy) == radius
+    return _frozen(dx[on_circle]), _frozen(dy[on_circle])
+
+@lru_cache(maxsize=STENCIL_CACHE_SIZE)
+def disc_offsets(radius):
+    """The offsets of the tiles within a circle of a given radius.
+
+    Matching utils.coordinates_within_circle, this is all the tiles
+    within a taxicab distance of radius + 1 of the center.
+    """
+    dx, dy = _offsets_within(radius + 1)
+    in_disc = np.abs(dx) + np.abs(dy) <= radius + 1
+    return _frozen(dx[in_disc]), _frozen(dy[in_disc])
+
+@lru_cache(maxsize=STENCIL_CACHE_SIZE)
+def disc_stencil(radius):
+    """The tiles within a circle of a given radius, as a boolean array
+    centered on the center tile.
+    """
+    reach = radius + 1
+    offsets = np.abs(np.arange(-reach, reach + 1))
+    stencil = (offsets[:, np.newaxis] + offsets[np.newaxis, :]) <= reach
+    return _frozen(stencil)
+
+def _offsets_within(reach):
+    dx, dy = np.meshgrid(np.arange(-reach, reach + 1),
+                         np.arange(-reach, reach + 1), indexing='ij')
+    return dx.ravel(), dy.ravel()
+
+def _frozen(arr):
+    arr.setflags(write=False)
+    return arr
+
+
+def in_bounds(game_map, xs, ys):
+    """Which of the positions (xs, ys) lie on the map?"""
+    return ((0 <= xs) & (xs < game_map.width) &
+            (0 <= ys) & (ys < game_map.height))
+
+def translate(game_map, center, offsets):
+    """Translate a stencil of offsets to a center, and clip it to the bounds
+    of the map.
+
+    Returns
+    -------
+    xs, ys: np.array of int
+      Index arrays of the tiles in the stencil that lie on the map.
+    """
+    dx, dy = offsets
+    xs, ys = center[0] + dx, center[1] + dy
+    on_map = in_bounds(game_map, xs, ys)
+    return xs[on_map], ys[on_map]
+
+def circle_indices(game_map, center, radius):
+    return translate(game_map, center, circle_offsets(radius))
+
+def disc_indices(game_map, center, radius):
+    return translate(game_map, center, disc_offsets(radius))
+
+def adjacent_indices(game_map, center):
+    return translate(game_map, center, (ADJACENT_DX, ADJACENT_DY))
+
+
+def entities_in_stencil(game_map, xs, ys, predicate=None):
+    """Get all the entities in the tiles of a (translated and clipped)
+    stencil.
+
+    The stencil is intersected with the occupancy array of the map's entities
+    first, so entities are only looked up in the occupied tiles.
+
+    Parameters
+    ----------
+    game_map: GameMap object
+
+    xs, ys: np.array of int
+      Index arrays of the tiles in the stencil.
+
+    predicate: Callable[[Entity], bool]
+      If supplied, only entities satisfying the predicate are returned.
+
+    Returns
+    -------
+    entities: List[Entity]
+    """
+    entities = game_map.entities
+    occupied = entities.occupancy[xs, ys] > 0
+    positions = zip(xs[occupied].tolist(), ys[occupied].tolist())
+    return [e for position in positions
+              for e in entities.get_entities_in_position(position)
+              if predicate is None or predicate(e)]
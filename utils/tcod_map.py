@@ -0,0 +1,55 @@
+"""
+A stand in for tdl.map.Map, built on the fov computation in tcod.
+
+The game map only needs tdl for its walkable, transparent and fov arrays, and
+for computing the fov.  When tdl is not installed (for example, when the game
+is run headless with one of the display backends that do not need a window)
+this class provides the same interface.
+"""
+import numpy as np
+import tcod
+
+
+FOV_ALGORITHMS = {
+    'BASIC': tcod.constants.FOV_BASIC,
+    'DIAMOND': tcod.constants.FOV_DIAMOND,
+    'SHADOW': tcod.constants.FOV_SHADOW,
+    'PERMISSIVE': tcod.constants.FOV_PERMISSIVE_8,
+    'RESTRICTIVE': tcod.constants.FOV_RESTRICTIVE,
+}
+FOV_ALGORITHMS.update({
+    f'PERMISSIVE{n}': getattr(tcod.constants, f'FOV_PERMISSIVE_{n}')
+    for n in range(9)})
+
+
+class Map:
+    """A map whose arrays are indexed [x, y], like those of tdl.map.Map.
+
+    Attributes
+    ----------
+    walkable: np.array of bool
+    transparent: np.array of bool
+    fov: np.array of bool
+    """
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.walkable = np.zeros((width, height), dtype=bool)
+        self.transparent = np.zeros((width, height), dtype=bool)
+        self.fov = np.zeros((width, height), dtype=bool)
+
+    def compute_fov(self, x, y, fov='PERMISSIVE', radius=None,
+                    light_walls=True):
+        """Compute the fov from a position into the fov array.
+
+        Parameters
+        ----------
+        fov: str
+          The name of the fov algorithm, as accepted by tdl.
+
+        radius: int or None
+          The maximum distance seen, or None for no limit.
+        """
+        self.fov[:, :] = tcod.map.compute_fov(
+            self.transparent, (x, y), radius=radius or 0,
+            light_walls=light_walls, algorithm=FOV_ALGORITHMS[fov.upper()])
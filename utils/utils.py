@@ -3,23 +3,10 @@ import random
 import functools
 import numpy as np
 
-from pathfinding import make_walkable_array
+from etc.enum import RoutingOptions
+from utils import geometry
 
 
-def flatten_list_of_dictionaries(list_of_dictionaries):
-    ret = []
-    for d in list_of_dictionaries:
-        for k, v in d.items():
-            ret.append({k: v})
-    return ret
-
-def get_key_from_single_key_dict(d):
-    return list(d)[0]
-
-def unpack_single_key_dict(d):
-    k = list(d)[0]
-    return k, d[k]
-
 def choose_from_list_of_tuples(list_of_tuples):
     """Randomly sample from a catagorical distribution defined by a list
     of (probability, catagory) tuples.
@@ -36,28 +23,16 @@ def l2_distance(source, target):
     return math.sqrt(dx*dx + dy*dy)
 
 def coordinates_on_circle(center, radius):
-    circle = set()
-    circle.update((center[0] + radius - i, center[1] + i)
-        for i in range(0, radius + 1))
-    circle.update((center[0] - radius + i, center[1] - i)
-        for i in range(0, radius + 1))
-    circle.update((center[0] - radius + i, center[1] + i)
-        for i in range(0, radius + 1))
-    circle.update((center[0] + radius - i, center[1] - i)
-        for i in range(0, radius + 1))
-    return circle
+    dx, dy = geometry.circle_offsets(radius)
+    return set(zip((center[0] + dx).tolist(), (center[1] + dy).tolist()))
 
 def coordinates_within_circle(center, radius):
-    circle = set()
-    for r in range(0, radius + 2):
-        circle.update(coordinates_on_circle(center, r))
-    return circle
+    dx, dy = geometry.disc_offsets(radius)
+    return set(zip((center[0] + dx).tolist(), (center[1] + dy).tolist()))
 
 def adjacent_coordinates(center):
-    dxdy = [(-1, 1), (0, 1), (1, 1),
-            (-1, 0),         (1, 0),
-            (-1, -1), (0, -1), (1, -1)]
-    return [(center[0] + dx, center[1] + dy) for dx, dy in dxdy]
+    return list(zip((center[0] + geometry.ADJACENT_DX).tolist(),
+                    (center[1] + geometry.ADJACENT_DY).tolist()))
 
 def _bresenham_ray(game_map, source, target):
     """Bresenham's line drawing algorithm, used to draw a ray joining two
@@ -172,48 +147,33 @@ def random_adjacent(center):
     return random.choice(candidates)
 
 def random_walkable_position(game_map, entity):
-    walkable_array =  make_walkable_array(game_map, entity.routing_avoid)
-    x, y = (random.choice(range(0, game_map.width)),
-            random.choice(range(0, game_map.height)))
-    while not walkable_array[x, y]:
-        x, y = (random.choice(range(0, game_map.width)),
-                random.choice(range(0, game_map.height)))
-    return (x, y)
+    """Pick a random walkable position that the entity can reach."""
+    routing_avoid = entity.routing_avoid or []
+    return game_map.open_cells.random_position(
+        game_map, routing_avoid,
+        avoid_monsters=RoutingOptions.AVOID_MONSTERS in routing_avoid,
+        reachable_from=(entity.x, entity.y))
 
 #-----------------------------------------------------------------------------
 # Entity Finders
 #-----------------------------------------------------------------------------
 def get_closest_entity_of_type(position, game_map, entity_type):
     """Get the closest entity of a given type from a list of entities."""
-    closest = None
-    closest_distance = math.inf
-    for entity in game_map.entities:
-        distance = l2_distance(position, (entity.x, entity.y))
-        if (entity.entity_type == entity_type and
-            distance < closest_distance):
-            closest = entity
-            closest_distance = distance
-    return closest
+    closest = get_n_closest_entities_of_type(
+        position, game_map, entity_type, 1)
+    if closest == []:
+        return None
+    return closest[0]
 
 def get_n_closest_entities_of_type(position, game_map, entity_type, n):
-    entities_of_type = [
-        e for e in game_map.entities if e.entity_type == entity_type]
-    entities_of_type = sorted(
-        entities_of_type, key=lambda e: l2_distance(position, (e.x, e.y)))
-    if len(entities_of_type) < n:
-        return entities_of_type
-    else:
-        return entities_of_type[:n]
+    return game_map.entities.nearest(
+        position, n, lambda e: e.entity_type == entity_type)
 
 def get_all_entities_of_type_within_radius(
     position, game_map, entity_type, radius):
     """Get all the entities of a given type within a given range."""
-    within_radius = []
-    for entity in game_map.entities:
-        if (l2_distance(position, (entity.x, entity.y)) <= radius and
-            entity.entity_type == entity_type):
-            within_radius.append(entity)
-    return within_radius
+    return game_map.entities.within_radius(
+        position, radius, lambda e: e.entity_type == entity_type)
 
 def get_all_entities_of_type_in_position(position, game_map, entity_type):
     entities = game_map.entities.get_entities_in_position(position)
@@ -222,12 +182,8 @@ def get_all_entities_of_type_in_position(position, game_map, entity_type):
 def get_all_entities_with_component_within_radius(
     position, game_map, component, radius):
     """Get all the entities of a given type within a given range."""
-    within_radius = []
-    for entity in game_map.entities:
-        if (l2_distance(position, (entity.x, entity.y)) <= radius
-            and getattr(entity, component)):
-            within_radius.append(entity)
-    return within_radius
+    return game_map.entities.within_radius(
+        position, radius, lambda e: getattr(e, component))
 
 def get_all_entities_with_component_in_position(position, game_map, component):
     entities = game_map.entities.get_entities_in_position(position)